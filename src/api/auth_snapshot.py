@@ -0,0 +1,117 @@
+"""
+Auth Snapshot
+Every auth fact the login screens need, gathered in one latency unit
+
+monk has no composite auth command, so status, expired, info and expires
+run side by side (all four are answered from local monk config) instead of
+one after another. The snapshot is cached until a login, logout or server
+or tenant switch changes what it describes, or the token it describes
+reaches its expiry. Expiry is judged at read time from `expires`, and a
+round where any command failed is returned but never cached.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from utils.session_timer import SessionTimer
+
+
+# Commands that change the answer to "who am I logged in as"
+AUTH_CHANGING_COMMANDS = {("auth", "login"), ("auth", "logout"), ("server", "use"), ("tenant", "use")}
+
+
+@dataclass
+class AuthSnapshot:
+    """Composite result of auth status / expired / info / expires"""
+    authenticated: bool = False
+    reported_expired: bool = False         # `monk auth expired` verdict when gathered
+    tenant: str = ""
+    username: str = ""
+    expires: str = ""                      # raw `monk auth expires` output, "" if unknown
+    expires_at: Optional[datetime] = None  # parsed `expires` (naive if it names no timezone)
+    info: Dict[str, Any] = field(default_factory=dict)
+    taken_at: float = 0.0
+    complete: bool = True                  # False if any command failed - not cached
+
+    @property
+    def expired(self) -> bool:
+        """Expired when gathered, or the token has run out since (judged only when the expiry's timezone is known)"""
+        if self.reported_expired or self.expires_at is None:
+            return self.reported_expired
+        remaining = SessionTimer.seconds_until(self.expires_at)
+        return remaining is not None and remaining <= 0
+
+    @property
+    def active(self) -> bool:
+        """Logged in with a live token and known identity"""
+        return self.authenticated and not self.expired and bool(self.info)
+
+
+class AuthSnapshotCache:
+    """Gathers auth facts in parallel and holds the result until invalidated or expired"""
+
+    def __init__(self, client):
+        self.client = client
+        self.snapshot: Optional[AuthSnapshot] = None
+        self.generation = 0  # Bumped by invalidate() so in-flight gathers are not cached
+        self.lock = threading.Lock()
+
+    def get(self, refresh: bool = False) -> AuthSnapshot:
+        """Cached snapshot, or a freshly gathered one"""
+        with self.lock:
+            # A snapshot of a live token goes stale the moment the token expires
+            cached = self.snapshot
+            if cached is not None and not refresh and (cached.reported_expired or not cached.expired):
+                return cached
+            generation = self.generation
+        snapshot = self.gather()
+        with self.lock:
+            if generation == self.generation:
+                self.snapshot = snapshot if snapshot.complete else None
+        return snapshot
+
+    def invalidate(self) -> None:
+        with self.lock:
+            self.snapshot = None
+            self.generation += 1
+
+    def gather(self) -> AuthSnapshot:
+        """Run the four auth commands concurrently at the caller's priority"""
+        priority = self.client.scheduler.current_priority()
+
+        def run(command: Callable[[], Any]):
+            with self.client.priority(priority):
+                return command()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            status, expired, info, expires = [
+                future.result() for future in [
+                    executor.submit(run, command) for command in (
+                        self.client.auth_status, self.client.auth_expired,
+                        self.client.auth_info, self.client.auth_expires)
+                ]
+            ]
+
+        status_data = status.data if status.success and isinstance(status.data, dict) else {}
+        info_data = info.data if info.success and isinstance(info.data, dict) else {}
+        expires_text = expires.raw_output if expires.success else ""
+        authenticated = bool(status_data.get("authenticated", False))
+        # auth expired exits non-zero when expired, so only a timeout or refusal is a failure
+        expired_failed = expired.timed_out or expired.not_sent
+        complete = status.success and not expired_failed and (
+            not authenticated or (info.success and expires.success))
+        return AuthSnapshot(
+            authenticated=authenticated,
+            reported_expired=not expired.success and not expired_failed,
+            tenant=info_data.get("tenant", ""),
+            username=info_data.get("name", ""),
+            expires=expires_text,
+            expires_at=SessionTimer.parse_expires_output(expires_text) if expires_text else None,
+            info=info_data,
+            taken_at=time.time(),
+            complete=complete,
+        )
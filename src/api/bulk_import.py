@@ -0,0 +1,398 @@
+"""
+BULK IMPORT PIPELINE
+Resumable CSV/NDJSON record import into a monk schema
+
+"Moving a million residents, one manifest at a time"
+"""
+
+import csv
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from config import config
+from api.monk_client import MonkClient, monk
+from api.scheduler import Priority
+from api.server_health import is_connect_error
+from utils.schema_validators import CompiledSchema, extract_definition, schema_validators
+
+
+# Source readers - both stream lazily so memory stays flat on large files
+
+def read_csv_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield CSV rows as dicts keyed by header column"""
+    with open(path, newline="", encoding="utf-8") as handle:
+        for row in csv.DictReader(handle):
+            yield row
+
+
+def read_ndjson_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield one JSON object per non-empty line"""
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def open_source(path: str) -> Iterator[Dict[str, Any]]:
+    """Pick a reader from the file extension"""
+    if path.lower().endswith((".ndjson", ".jsonl")):
+        return read_ndjson_records(path)
+    return read_csv_records(path)
+
+
+class SchemaFieldMap:
+    """Maps source columns onto schema fields and validates/coerces values"""
+
+    def __init__(self, validators: CompiledSchema, mapping: Optional[Dict[str, str]] = None):
+        self.validators = validators
+        self.properties = validators.definition.get("properties", {}) or {}
+        self.mapping = mapping or {}
+
+    def map_row(self, row: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+        """Return (record, errors) for a single source row"""
+        record = {}
+        errors = []
+
+        for column, value in row.items():
+            field_name = self.mapping.get(column, column)
+            if not field_name:
+                continue  # Explicitly unmapped column
+            if self.properties and field_name not in self.properties:
+                continue  # Unknown to the schema - drop it
+            if value is None or value == "":
+                continue
+
+            coerced, error = self.coerce(field_name, value)
+            if error:
+                errors.append(error)
+            else:
+                record[field_name] = coerced
+
+        if not errors:
+            # Compiled schema validators catch enum/format/range/required problems
+            errors = [message for level, message in self.validators.validate_record(record) if level == "error"]
+
+        return record, errors
+
+    def coerce(self, field_name: str, value: Any) -> Tuple[Any, str]:
+        """Coerce a raw (usually string) value to the schema type"""
+        field_type = self.properties.get(field_name, {}).get("type")
+        if not field_type or not isinstance(value, str):
+            return value, ""
+
+        try:
+            if field_type == "integer":
+                return int(value), ""
+            if field_type == "number":
+                return float(value), ""
+            if field_type == "boolean":
+                lowered = value.strip().lower()
+                if lowered in ("true", "1", "yes", "y"):
+                    return True, ""
+                if lowered in ("false", "0", "no", "n"):
+                    return False, ""
+                return None, f"{field_name}: expected boolean, got {value!r}"
+            if field_type in ("object", "array"):
+                return json.loads(value), ""
+        except (ValueError, json.JSONDecodeError):
+            return None, f"{field_name}: expected {field_type}, got {value!r}"
+
+        return value, ""
+
+
+@dataclass
+class ImportCheckpoint:
+    """On-disk progress marker for a resumable import"""
+    source: str
+    schema: str
+    source_size: int
+    source_mtime: float
+    batch_size: int
+    next_batch: int = 0                   # Every batch below this index is committed
+    completed_batches: List[int] = field(default_factory=list)  # Committed batches above the watermark
+    sent_batches: List[int] = field(default_factory=list)  # Sent but unconfirmed - may already be applied
+    rows_imported: int = 0
+    rows_rejected: int = 0
+    finished: bool = False
+
+    def matches(self, other: "ImportCheckpoint") -> bool:
+        """Check the checkpoint was written for the same source file"""
+        return (
+            self.source == other.source
+            and self.schema == other.schema
+            and self.source_size == other.source_size
+            and self.source_mtime == other.source_mtime
+        )
+
+
+@dataclass
+class ImportProgress:
+    """Snapshot of import state reported to callers"""
+    rows_imported: int = 0
+    rows_rejected: int = 0
+    batches_committed: int = 0
+    resumed_from_batch: int = 0
+    finished: bool = False
+    error: str = ""
+
+
+class BulkImporter:
+    """Streams a CSV/NDJSON file into a schema in checkpointed batches"""
+
+    MAX_RETRIES = 3
+
+    def __init__(
+        self,
+        schema: str,
+        source_path: str,
+        client: Optional[MonkClient] = None,
+        mapping: Optional[Dict[str, str]] = None,
+        schema_definition: Optional[Dict] = None,
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
+    ):
+        self.schema = schema
+        self.source_path = os.path.abspath(source_path)
+        self.client = client or monk
+        self.mapping = mapping
+        self.schema_definition = schema_definition
+        self.batch_size = max(1, batch_size or config.import_batch_size)
+        self.parallelism = max(1, parallelism or config.import_parallelism)
+        self.checkpoint_path = checkpoint_path or self.default_checkpoint_path()
+        self.rejects_path = self.checkpoint_path[:-len(".json")] + ".rejects.ndjson"
+
+    def default_checkpoint_path(self) -> str:
+        """Checkpoint location derived from source path and schema"""
+        key = hashlib.sha1(f"{self.source_path}|{self.schema}".encode("utf-8")).hexdigest()[:16]
+        return os.path.join(config.cache_dir, "imports", f"{key}.json")
+
+    # Checkpoint persistence
+
+    def load_checkpoint(self) -> ImportCheckpoint:
+        """Load a matching checkpoint or start a fresh one"""
+        stat = os.stat(self.source_path)
+        fresh = ImportCheckpoint(
+            source=self.source_path,
+            schema=self.schema,
+            source_size=stat.st_size,
+            source_mtime=stat.st_mtime,
+            batch_size=self.batch_size,
+        )
+
+        try:
+            with open(self.checkpoint_path, encoding="utf-8") as handle:
+                saved = ImportCheckpoint(**json.load(handle))
+        except (OSError, ValueError, TypeError):
+            return fresh
+
+        # Source changed since the checkpoint was written - start over
+        if not saved.matches(fresh):
+            return fresh
+
+        # Batch boundaries must stay identical across resumes
+        self.batch_size = saved.batch_size
+        return saved
+
+    def save_checkpoint(self, checkpoint: ImportCheckpoint) -> None:
+        """Atomically write checkpoint to disk"""
+        os.makedirs(os.path.dirname(self.checkpoint_path), exist_ok=True)
+        temp_path = self.checkpoint_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(asdict(checkpoint), handle)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def clear_checkpoint(self) -> None:
+        """Forget saved progress so the next run starts from row zero"""
+        for path in (self.checkpoint_path, self.rejects_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    # Pipeline
+
+    def iter_batches(self, checkpoint: ImportCheckpoint) -> Iterator[Tuple[int, List[Dict], List[Tuple[int, List[str]]]]]:
+        """Yield (batch_index, records, rejects) skipping already committed batches"""
+        field_map = SchemaFieldMap(schema_validators.compile(self.schema, self.schema_definition or {}), self.mapping)
+        done = set(checkpoint.completed_batches)
+
+        records = []
+        rejects = []
+        batch_index = 0
+
+        for row_number, row in enumerate(open_source(self.source_path)):
+            batch_index = row_number // self.batch_size
+            skip = batch_index < checkpoint.next_batch or batch_index in done
+
+            if row_number and row_number % self.batch_size == 0:
+                previous = batch_index - 1
+                if records or rejects:
+                    yield previous, records, rejects
+                records, rejects = [], []
+
+            if skip:
+                continue
+
+            record, errors = field_map.map_row(row)
+            if errors:
+                rejects.append((row_number, errors))
+            else:
+                records.append(record)
+
+        if records or rejects:
+            yield batch_index, records, rejects
+
+    def batch_state(self, records: List[Dict]) -> str:
+        """Whether a batch already landed: "applied", "missing", "partial", "unknown" or a check failure
+
+        Creates aren't idempotent, so a batch whose outcome is unknown (timeout,
+        crash mid-send) is looked up before it is sent again. The first and last
+        records are probed by id; records without one can't be told apart from
+        existing rows with the same values, so such a batch is "unknown" and the
+        import stops for the operator instead of skipping or duplicating it.
+        """
+        probes = [records[0], records[-1]] if len(records) > 1 else records[:1]
+        if any(record.get("id") in (None, "") for record in probes):
+            return "unknown - records carry no id"
+        found = []
+        for record in probes:
+            with self.client.priority(Priority.BULK):
+                result = self.client.data_select(self.schema, {"where": {"id": record["id"]}, "limit": 1},
+                                                 fields=["id"])
+            if not result.success:
+                return f"check failed: {result.error or f'exit code {result.exit_code}'}"
+            found.append(bool(result.data))
+        if all(found):
+            return "applied"
+        return "partial" if any(found) else "missing"
+
+    def push_batch(self, records: List[Dict], verify_first: bool = False) -> str:
+        """Send one batch with retries, returning an error message or empty string
+
+        Only failures that provably never reached the server (open circuit,
+        connection refused) are retried blindly; after anything else the batch
+        is checked first so a timed-out but committed batch isn't duplicated.
+        """
+        if not records:
+            return ""
+
+        if verify_first:
+            # Sent by an earlier run that stopped before confirming it
+            state = self.batch_state(records)
+            if state == "applied":
+                return ""
+            if state != "missing":
+                return f"cannot tell whether the batch was applied ({state})"
+
+        error = ""
+        for attempt in range(self.MAX_RETRIES):
+            # Bulk class so interactive monk calls always jump ahead of import batches
+            with self.client.priority(Priority.BULK):
+                result = self.client.data_create_many(self.schema, records)
+            if result.success:
+                return ""
+            error = result.error or f"exit code {result.exit_code}"
+            if not (result.not_sent or is_connect_error(error)):
+                state = self.batch_state(records)
+                if state == "applied":
+                    return ""
+                if state != "missing":
+                    return f"{error} - not retried, batch may be partially applied ({state})"
+            if attempt + 1 < self.MAX_RETRIES:
+                time.sleep(0.5 * (2 ** attempt))
+        return error
+
+    def run(self, progress_callback: Optional[Callable[[ImportProgress], None]] = None) -> ImportProgress:
+        """Run (or resume) the import; blocking, call from a worker thread"""
+        if self.schema_definition is None:
+            result = self.client.meta_select(self.schema)
+            self.schema_definition = extract_definition(result.data) if result.success else {}
+
+        checkpoint = self.load_checkpoint()
+        progress = ImportProgress(
+            rows_imported=checkpoint.rows_imported,
+            rows_rejected=checkpoint.rows_rejected,
+            resumed_from_batch=checkpoint.next_batch,
+            finished=checkpoint.finished,
+        )
+        if checkpoint.finished:
+            return progress
+
+        # Batches a previous run sent without confirming - check them before re-sending
+        unconfirmed = set(checkpoint.sent_batches)
+
+        in_flight: Dict[Future, Tuple[int, int, List[Tuple[int, List[str]]]]] = {}
+        max_in_flight = self.parallelism * 2  # Backpressure: stop reading when the queue is full
+
+        def collect(done_futures) -> None:
+            for future in done_futures:
+                batch_index, imported, rejects = in_flight.pop(future)
+                error = future.result()
+                if error:
+                    progress.error = progress.error or f"batch {batch_index}: {error}"
+                    continue
+                if rejects:
+                    self.write_rejects(rejects)
+                self.commit_batch(checkpoint, batch_index, imported, len(rejects))
+                progress.rows_imported = checkpoint.rows_imported
+                progress.rows_rejected = checkpoint.rows_rejected
+                progress.batches_committed += 1
+            self.save_checkpoint(checkpoint)
+            if progress_callback:
+                progress_callback(progress)
+
+        with ThreadPoolExecutor(max_workers=self.parallelism) as executor:
+            for batch_index, records, rejects in self.iter_batches(checkpoint):
+                if progress.error:
+                    break  # Stop feeding new work after a permanent failure
+
+                if batch_index not in checkpoint.sent_batches:
+                    checkpoint.sent_batches.append(batch_index)
+                    self.save_checkpoint(checkpoint)
+                future = executor.submit(self.push_batch, records, batch_index in unconfirmed)
+                in_flight[future] = (batch_index, len(records), rejects)
+
+                if len(in_flight) >= max_in_flight:
+                    done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                    collect(done)
+
+            if in_flight:
+                done, _ = wait(list(in_flight))
+                collect(done)
+
+        if not progress.error:
+            checkpoint.finished = True
+            progress.finished = True
+            self.save_checkpoint(checkpoint)
+            if progress_callback:
+                progress_callback(progress)
+
+        return progress
+
+    def commit_batch(self, checkpoint: ImportCheckpoint, batch_index: int, imported: int, rejected: int) -> None:
+        """Record a committed batch and advance the contiguous watermark"""
+        checkpoint.rows_imported += imported
+        checkpoint.rows_rejected += rejected
+        if batch_index in checkpoint.sent_batches:
+            checkpoint.sent_batches.remove(batch_index)
+
+        done = set(checkpoint.completed_batches)
+        done.add(batch_index)
+        while checkpoint.next_batch in done:
+            done.discard(checkpoint.next_batch)
+            checkpoint.next_batch += 1
+        checkpoint.completed_batches = sorted(done)
+
+    def write_rejects(self, rejects: List[Tuple[int, List[str]]]) -> None:
+        """Append rejected rows to the rejects log next to the checkpoint"""
+        os.makedirs(os.path.dirname(self.rejects_path), exist_ok=True)
+        with open(self.rejects_path, "a", encoding="utf-8") as handle:
+            for row_number, errors in rejects:
+                handle.write(json.dumps({"row": row_number, "errors": errors}) + "\n")
@@ -0,0 +1,442 @@
+"""
+COLUMNAR DATASET CACHE
+Memory-mapped on-disk record sets for instant reload
+
+Record sets are stored column by column: low-cardinality values are
+dictionary encoded, numbers and timestamps are fixed-width arrays, and
+free text is an offsets array over one UTF-8 blob. Opening a file only
+parses its header; values are decoded from the mapping when a row or
+column is actually read, so memory follows what is viewed.
+
+File layout (native byte order, sections 8-byte aligned):
+
+    b"VCOL" version:u32 header_length:u32 reserved:u32
+    header JSON (row count, column descriptors, section offsets, meta)
+    column sections
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from abc import ABC, abstractmethod
+from array import array
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from config import config
+from api.filter_cache import atom_fields, match_atom, split_conditions
+from utils.compact_records import to_plain
+
+
+MAGIC = b"VCOL"
+VERSION = 1
+PREAMBLE = struct.Struct("<4sIII")
+
+# Dictionary encode a column when it has at most this share of distinct values
+DICT_RATIO = 0.5
+
+# Code array type by dictionary size; the type's max value marks null
+CODE_TYPES = (("B", 0xFF), ("H", 0xFFFF), ("I", 0xFFFFFFFF))
+
+EPOCH = datetime(1970, 1, 1)
+
+
+# Timestamp formats stored as int64 microseconds - only used when every
+# value of a column round-trips exactly through the format
+def _strip_z(text: str) -> datetime:
+    if not text.endswith("Z"):
+        raise ValueError(text)
+    return datetime.fromisoformat(text[:-1])
+
+DATE_FORMATS: Dict[str, Tuple[Callable[[str], datetime], Callable[[datetime], str]]] = {
+    "date": (datetime.fromisoformat, lambda value: value.strftime("%Y-%m-%d")),
+    "datetime": (datetime.fromisoformat, lambda value: value.strftime("%Y-%m-%d %H:%M:%S")),
+    "iso": (datetime.fromisoformat, lambda value: value.strftime("%Y-%m-%dT%H:%M:%S")),
+    "iso-z": (_strip_z, lambda value: value.strftime("%Y-%m-%dT%H:%M:%SZ")),
+    "iso-ms-z": (_strip_z, lambda value: value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"),
+    "iso-us-z": (_strip_z, lambda value: value.strftime("%Y-%m-%dT%H:%M:%S.%fZ")),
+}
+
+
+class ColumnarFormatError(Exception):
+    """File is not a readable columnar dataset"""
+
+
+# Writing
+
+def _bitmap(values: Sequence[Any]) -> Optional[bytes]:
+    """Packed null bitmap (bit set = null), or None when nothing is null"""
+    if all(value is not None for value in values):
+        return None
+    bits = bytearray((len(values) + 7) // 8)
+    for position, value in enumerate(values):
+        if value is None:
+            bits[position >> 3] |= 1 << (position & 7)
+    return bytes(bits)
+
+
+def _text_sections(texts: Sequence[Optional[str]]) -> Tuple[bytes, bytes]:
+    """Offsets (uint64, n+1) and UTF-8 blob for a list of strings"""
+    offsets = array("Q", [0])
+    blob = bytearray()
+    for text in texts:
+        if text:
+            blob += text.encode("utf-8")
+        offsets.append(len(blob))
+    return offsets.tobytes(), bytes(blob)
+
+
+def _date_format(values: List[str]) -> Optional[str]:
+    """Timestamp format every value round-trips through, if any"""
+    sample = values[0]
+    for name, (parse, render) in DATE_FORMATS.items():
+        try:
+            if render(parse(sample)) != sample:
+                continue
+            if all(render(parse(value)) == value for value in values):
+                return name
+        except ValueError:
+            continue
+    return None
+
+
+def _encode_column(values: List[Any]) -> Tuple[Dict[str, Any], Dict[str, bytes]]:
+    """Pick an encoding for one column; returns (descriptor, sections)"""
+    present = [value for value in values if value is not None]
+    sections: Dict[str, bytes] = {}
+    nulls = _bitmap(values)
+    if nulls:
+        sections["nulls"] = nulls
+
+    kinds = {type(value) for value in present}
+    if present and kinds == {int} and all(-2**63 <= value < 2**63 for value in present):
+        sections["values"] = array("q", [value or 0 for value in values]).tobytes()
+        return {"kind": "int"}, sections
+    if present and kinds == {float}:
+        sections["values"] = array("d", [value or 0.0 for value in values]).tobytes()
+        return {"kind": "float"}, sections
+    if present and kinds == {str}:
+        fmt = _date_format(present)
+        if fmt:
+            parse = DATE_FORMATS[fmt][0]
+            micros = [(parse(value) - EPOCH) // timedelta(microseconds=1) if value is not None else 0
+                      for value in values]
+            sections["values"] = array("q", micros).tobytes()
+            return {"kind": "date", "format": fmt}, sections
+
+    # Strings as-is; anything else (bools, nested objects, mixed types) as JSON text
+    encoded = "str" if kinds <= {str} else "json"
+    texts = [value if encoded == "str" or value is None else json.dumps(value, separators=(",", ":"), default=to_plain)
+             for value in values]
+
+    distinct = list(dict.fromkeys(text for text in texts if text is not None))
+    if len(distinct) <= max(1, len(values) * DICT_RATIO):
+        code_type, null_code = next((t, m) for t, m in CODE_TYPES if len(distinct) < m)
+        codes = {text: code for code, text in enumerate(distinct)}
+        sections.pop("nulls", None)  # Null is a reserved code instead
+        sections["codes"] = array(code_type, [null_code if text is None else codes[text] for text in texts]).tobytes()
+        sections["dict_offsets"], sections["dict_data"] = _text_sections(distinct)
+        return {"kind": "dict", "encoded": encoded, "code_type": code_type}, sections
+
+    sections["offsets"], sections["data"] = _text_sections(texts)
+    return {"kind": "text", "encoded": encoded}, sections
+
+
+def write_table(path: str, rows: Sequence[Dict[str, Any]], fields: Optional[List[str]] = None,
+                meta: Optional[Dict[str, Any]] = None) -> int:
+    """Write rows as a columnar file (atomically); returns bytes written"""
+    if fields is None:
+        fields = list(dict.fromkeys(name for row in rows for name in row))
+
+    columns = []
+    blobs: List[bytes] = []
+    position = 0
+    for name in fields:
+        descriptor, sections = _encode_column([row.get(name) for row in rows])
+        descriptor["name"] = name
+        descriptor["sections"] = {}
+        for section, data in sections.items():
+            descriptor["sections"][section] = [position, len(data)]
+            padding = -len(data) % 8
+            blobs.append(data + b"\0" * padding)
+            position += len(data) + padding
+        columns.append(descriptor)
+
+    header = json.dumps({
+        "rows": len(rows), "byteorder": sys.byteorder, "columns": columns, "meta": meta or {},
+    }, separators=(",", ":")).encode("utf-8")
+    header += b" " * (-(PREAMBLE.size + len(header)) % 8)
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as handle:
+        handle.write(PREAMBLE.pack(MAGIC, VERSION, len(header), 0))
+        handle.write(header)
+        for blob in blobs:
+            handle.write(blob)
+    os.replace(temp_path, path)
+    return PREAMBLE.size + len(header) + position
+
+
+# Reading
+
+class Column(ABC):
+    """One column of a mapped table - values decode on access"""
+
+    def __init__(self, name: str, rows: int, nulls: Optional[memoryview]):
+        self.name = name
+        self.rows = rows
+        self.nulls = nulls
+
+    def is_null(self, index: int) -> bool:
+        return self.nulls is not None and bool(self.nulls[index >> 3] & (1 << (index & 7)))
+
+    def __len__(self) -> int:
+        return self.rows
+
+    @abstractmethod
+    def __getitem__(self, index: int) -> Any:
+        """Decoded value of one row (None for null)"""
+
+    def release(self) -> None:
+        if self.nulls is not None:
+            self.nulls.release()
+
+
+class FixedColumn(Column):
+    """int64 / float64 / timestamp values"""
+
+    def __init__(self, name, rows, nulls, values: memoryview, kind: str, fmt: Optional[str] = None):
+        super().__init__(name, rows, nulls)
+        self.values = values.cast("d" if kind == "float" else "q")
+        self.render = DATE_FORMATS[fmt][1] if kind == "date" else None
+
+    def __getitem__(self, index: int) -> Any:
+        if self.is_null(index):
+            return None
+        value = self.values[index]
+        return self.render(EPOCH + timedelta(microseconds=value)) if self.render else value
+
+    def release(self) -> None:
+        super().release()
+        self.values.release()
+
+
+class TextColumn(Column):
+    """Variable-length strings (or JSON) over an offsets array"""
+
+    def __init__(self, name, rows, nulls, offsets: memoryview, data: memoryview, encoded: str):
+        super().__init__(name, rows, nulls)
+        self.offsets = offsets.cast("Q")
+        self.data = data
+        self.decode = json.loads if encoded == "json" else None
+
+    def __getitem__(self, index: int) -> Any:
+        if self.is_null(index):
+            return None
+        text = str(self.data[self.offsets[index]:self.offsets[index + 1]], "utf-8")
+        return self.decode(text) if self.decode else text
+
+    def release(self) -> None:
+        super().release()
+        self.offsets.release()
+        self.data.release()
+
+
+class DictColumn(Column):
+    """Dictionary-encoded values - rows hold small integer codes"""
+
+    def __init__(self, name, rows, codes: memoryview, code_type: str, dictionary: TextColumn):
+        super().__init__(name, rows, None)
+        self.codes = codes.cast(code_type)
+        self.null_code = dict(CODE_TYPES)[code_type]
+        self.dictionary = dictionary
+        self._values: Optional[List[Any]] = None
+
+    @property
+    def values(self) -> List[Any]:
+        """Decoded dictionary (distinct values only, decoded once)"""
+        if self._values is None:
+            self._values = [self.dictionary[code] for code in range(len(self.dictionary))]
+        return self._values
+
+    def __getitem__(self, index: int) -> Any:
+        code = self.codes[index]
+        return None if code == self.null_code else self.values[code]
+
+    def matching_codes(self, predicate: Callable[[Any], bool]) -> set:
+        """Codes (null code included) whose value satisfies predicate"""
+        codes = {code for code, value in enumerate(self.values) if predicate(value)}
+        if predicate(None):
+            codes.add(self.null_code)
+        return codes
+
+    def release(self) -> None:
+        self.codes.release()
+        self.dictionary.release()
+
+
+class ColumnarTable:
+    """Read-only memory-mapped record set"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._columns: Dict[str, Column] = {}
+        self._handle = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file
+            self._handle.close()
+            raise ColumnarFormatError(f"{path}: empty file")
+        try:
+            magic, version, header_length, _ = PREAMBLE.unpack_from(self._map, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ColumnarFormatError(f"{path}: not a version {VERSION} columnar file")
+            header = json.loads(self._map[PREAMBLE.size:PREAMBLE.size + header_length])
+            if header.get("byteorder") != sys.byteorder:
+                raise ColumnarFormatError(f"{path}: written with another byte order")
+        except (struct.error, ValueError) as error:
+            self.close()
+            raise ColumnarFormatError(f"{path}: {error}")
+        except ColumnarFormatError:
+            self.close()
+            raise
+
+        self.rows: int = header["rows"]
+        self.meta: Dict[str, Any] = header.get("meta", {})
+        self._base = PREAMBLE.size + header_length
+        self._descriptors = {column["name"]: column for column in header["columns"]}
+        self.fields: List[str] = [column["name"] for column in header["columns"]]
+
+    # Columns
+
+    def _section(self, descriptor: Dict, name: str) -> Optional[memoryview]:
+        span = descriptor["sections"].get(name)
+        if span is None:
+            return None
+        start = self._base + span[0]
+        return memoryview(self._map)[start:start + span[1]]
+
+    def column(self, name: str) -> Optional[Column]:
+        """Column by name (created on first use), or None if the table lacks it"""
+        column = self._columns.get(name)
+        if column is not None:
+            return column
+        descriptor = self._descriptors.get(name)
+        if descriptor is None:
+            return None
+        kind = descriptor["kind"]
+        nulls = self._section(descriptor, "nulls")
+        if kind in ("int", "float", "date"):
+            column = FixedColumn(name, self.rows, nulls, self._section(descriptor, "values"),
+                                 kind, descriptor.get("format"))
+        elif kind == "text":
+            column = TextColumn(name, self.rows, nulls, self._section(descriptor, "offsets"),
+                                self._section(descriptor, "data"), descriptor["encoded"])
+        else:
+            offsets = self._section(descriptor, "dict_offsets")
+            dictionary = TextColumn(name, len(offsets) // 8 - 1, None, offsets,
+                                    self._section(descriptor, "dict_data"), descriptor["encoded"])
+            column = DictColumn(name, self.rows, self._section(descriptor, "codes"),
+                                descriptor["code_type"], dictionary)
+        self._columns[name] = column
+        return column
+
+    # Rows
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def row(self, index: int, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """One record as a dict (only the requested fields are decoded)"""
+        if not 0 <= index < self.rows:
+            raise IndexError(index)
+        record = {}
+        for name in (fields if fields is not None else self.fields):
+            column = self.column(name)
+            record[name] = column[index] if column is not None else None
+        return record
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.row(position) for position in range(*index.indices(self.rows))]
+        return self.row(index if index >= 0 else self.rows + index)
+
+    def rows_at(self, indices: Iterable[int], fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        return [self.row(index, fields) for index in indices]
+
+    # Queries
+
+    def query(self, where: Optional[Dict] = None, order: Optional[List[str]] = None,
+              limit: Optional[int] = None) -> List[int]:
+        """Row indices matching a where-clause, in order (raises UnsupportedFilter)"""
+        indices: Iterable[int] = range(self.rows)
+        for atom in split_conditions(where):
+            fields = atom_fields(atom)
+            column = self.column(next(iter(fields))) if len(fields) == 1 else None
+            if isinstance(column, DictColumn):
+                # Evaluate once per distinct value, then scan the code array
+                name = column.name
+                codes = column.matching_codes(lambda value: match_atom({name: value}, atom))
+                code_array = column.codes
+                indices = [index for index in indices if code_array[index] in codes]
+            else:
+                indices = [index for index in indices if match_atom(self.row(index, fields), atom)]
+
+        indices = list(indices)
+        for clause in reversed(order or []):
+            parts = clause.split()
+            column = self.column(parts[0])
+            if column is None:
+                continue
+            descending = len(parts) > 1 and parts[1].lower() == "desc"
+            indices.sort(key=lambda index: (column[index] is None, column[index]), reverse=descending)
+        return indices[:limit] if limit else indices
+
+    def close(self) -> None:
+        for column in self._columns.values():
+            column.release()
+        self._columns.clear()
+        try:
+            self._map.close()
+        except (AttributeError, BufferError):
+            pass  # A caller still holds a view - the mapping closes when it's collected
+        self._handle.close()
+
+    def __enter__(self) -> "ColumnarTable":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class DatasetCache:
+    """Columnar snapshots of whole record sets, one file per (server, tenant, schema)"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def path_for(self, schema: str, server: Optional[str] = None, tenant: Optional[str] = None) -> str:
+        scope = f"{server or 'default'}__{tenant or 'default'}__{schema}"
+        safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in scope)
+        return os.path.join(self.directory, f"{safe}.vcol")
+
+    def save(self, schema: str, rows: Sequence[Dict[str, Any]], server: Optional[str] = None,
+             fields: Optional[List[str]] = None, tenant: Optional[str] = None) -> int:
+        """Snapshot rows; returns the file size"""
+        meta = {"schema": schema, "server": server, "tenant": tenant, "saved_at": time.time()}
+        return write_table(self.path_for(schema, server, tenant), rows, fields, meta)
+
+    def open(self, schema: str, server: Optional[str] = None, tenant: Optional[str] = None) -> Optional[ColumnarTable]:
+        """Mapped snapshot, or None if there isn't a readable one"""
+        try:
+            return ColumnarTable(self.path_for(schema, server, tenant))
+        except (OSError, ColumnarFormatError):
+            return None
+
+
+# Global dataset cache instance
+dataset_cache = DatasetCache(os.path.join(config.cache_dir, "datasets"))
@@ -0,0 +1,66 @@
+"""
+Fan-Out Aggregator
+One monk call per target (server, schema...), run concurrently
+
+Each target gets its own timeout and its result is handed to a callback
+the moment it lands, so registry tables fill in row by row instead of
+waiting for the slowest target. Concurrency is still capped by the
+client's execution scheduler.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Optional
+
+from config import config
+from api.monk_client import monk
+
+
+@dataclass
+class TargetResult:
+    """Outcome of one target's call"""
+    target: str
+    result: Any = None          # Whatever the call returned (usually a MonkCommandResult)
+    elapsed: float = 0.0
+    error: str = ""             # Set when the call raised or was cancelled
+
+
+class FanOut:
+    """Bounded-parallel calls across targets with per-target timeouts"""
+
+    def __init__(self, client, parallelism: int = 8, timeout: float = 5.0):
+        self.client = client
+        self.parallelism = max(1, parallelism)
+        self.timeout = timeout
+
+    def run(self, targets: Iterable[str], call: Callable[[str, float], Any],
+            on_result: Optional[Callable[[TargetResult], None]] = None,
+            cancelled: Callable[[], bool] = lambda: False) -> List[TargetResult]:
+        """Call call(target, timeout) for every target, reporting each result as it completes"""
+        priority = self.client.scheduler.current_priority()
+
+        def run_one(target: str) -> TargetResult:
+            if cancelled():
+                return TargetResult(target=target, error="cancelled")
+            started = time.monotonic()
+            try:
+                with self.client.priority(priority):
+                    result = call(target, self.timeout)
+                return TargetResult(target=target, result=result, elapsed=time.monotonic() - started)
+            except Exception as e:
+                return TargetResult(target=target, error=str(e), elapsed=time.monotonic() - started)
+
+        results = []
+        with ThreadPoolExecutor(max_workers=self.parallelism) as executor:
+            futures = [executor.submit(run_one, target) for target in targets]
+            for future in as_completed(futures):
+                outcome = future.result()
+                results.append(outcome)
+                if on_result and not cancelled():
+                    on_result(outcome)
+        return results
+
+
+# Global fan-out instance
+fanout = FanOut(monk, parallelism=config.fanout_parallelism, timeout=config.fanout_timeout)
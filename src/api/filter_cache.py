@@ -0,0 +1,280 @@
+"""
+FILTER RESULT CACHE
+Data select results keyed by normalised filter, with subsumption reuse
+
+A filter that only adds conditions to a cached, complete result is
+answered locally by evaluating the extra conditions over the cached
+rows. Anything else goes to the server.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+
+from utils.compact_records import copy_rows
+
+
+# Operators the local evaluator understands - others force a server query
+LOCAL_OPERATORS = {"$eq", "$ne", "$gt", "$gte", "$lt", "$lte", "$in", "$nin", "$like", "$ilike"}
+
+
+class UnsupportedFilter(Exception):
+    """Filter can't be evaluated locally"""
+
+
+# Normalisation
+
+def canonical(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def split_conditions(where: Optional[Dict]) -> List[Dict]:
+    """Flatten a where-clause into conjunctive atoms of the form {field: {op: value}}"""
+    atoms: List[Dict] = []
+    if not where:
+        return atoms
+    for key, value in where.items():
+        if key == "$and":
+            for part in value:
+                atoms.extend(split_conditions(part))
+        elif key.startswith("$"):
+            # $or / $not etc. stay opaque atoms
+            atoms.append({key: value})
+        elif isinstance(value, dict) and value and all(op.startswith("$") for op in value):
+            for op, operand in value.items():
+                atoms.append({key: {op: operand}})
+        else:
+            atoms.append({key: {"$eq": value}})
+    return atoms
+
+
+def query_key(schema: str, query: Dict, scope: str = "") -> str:
+    """Stable hash of a select query (within a server/tenant scope) regardless of condition order or shorthand"""
+    normal = {
+        "where": sorted(canonical(atom) for atom in split_conditions(query.get("where"))),
+        "select": sorted(query.get("select") or []),
+        "order": query.get("order") or [],
+        "limit": query.get("limit"),
+    }
+    return hashlib.sha1(f"{scope}:{schema}:{canonical(normal)}".encode()).hexdigest()
+
+
+# Local evaluation
+
+def atom_fields(atom: Dict) -> Set[str]:
+    """Record fields an atom reads"""
+    fields: Set[str] = set()
+    for key, value in atom.items():
+        if key in ("$and", "$or"):
+            for part in value:
+                for sub in split_conditions(part):
+                    fields |= atom_fields(sub)
+        elif key.startswith("$"):
+            raise UnsupportedFilter(key)
+        else:
+            fields.add(key)
+    return fields
+
+
+def _coerce(actual: Any, expected: Any) -> Any:
+    """Compare numbers typed as strings (form inputs) like the server would"""
+    if isinstance(actual, (int, float)) and not isinstance(actual, bool) and isinstance(expected, str):
+        try:
+            return float(expected)
+        except ValueError:
+            return expected
+    return expected
+
+
+def _like(actual: Any, pattern: str, flags: int = 0) -> bool:
+    regex = "^" + re.escape(str(pattern)).replace("%", ".*").replace("_", ".") + "$"
+    return actual is not None and re.match(regex, str(actual), flags) is not None
+
+
+def match_atom(record: Dict, atom: Dict) -> bool:
+    """Evaluate one atom against a record (raises UnsupportedFilter)"""
+    for key, value in atom.items():
+        if key == "$and":
+            if not all(match_where(record, part) for part in value):
+                return False
+        elif key == "$or":
+            if not any(match_where(record, part) for part in value):
+                return False
+        elif key.startswith("$"):
+            raise UnsupportedFilter(key)
+        else:
+            actual = record.get(key)
+            for op, expected in value.items():
+                if op not in LOCAL_OPERATORS:
+                    raise UnsupportedFilter(op)
+                if op in ("$in", "$nin"):
+                    hit = actual in [_coerce(actual, item) for item in expected]
+                    if hit != (op == "$in"):
+                        return False
+                    continue
+                if op == "$like":
+                    if not _like(actual, expected):
+                        return False
+                    continue
+                if op == "$ilike":
+                    if not _like(actual, expected, re.IGNORECASE):
+                        return False
+                    continue
+                expected = _coerce(actual, expected)
+                if op == "$eq":
+                    ok = actual == expected
+                elif op == "$ne":
+                    ok = actual != expected
+                else:
+                    if actual is None:
+                        return False
+                    try:
+                        ok = {"$gt": actual > expected, "$gte": actual >= expected,
+                              "$lt": actual < expected, "$lte": actual <= expected}[op]
+                    except TypeError:
+                        raise UnsupportedFilter(f"{key} {op} on mixed types")
+                if not ok:
+                    return False
+    return True
+
+
+def match_where(record: Dict, where: Optional[Dict]) -> bool:
+    return all(match_atom(record, atom) for atom in split_conditions(where))
+
+
+def sort_rows(rows: List[Dict], order: List[str]) -> List[Dict]:
+    """Apply an order clause ("field asc|desc", ...) locally"""
+    for clause in reversed(order or []):
+        parts = clause.split()
+        field = parts[0]
+        descending = len(parts) > 1 and parts[1].lower() == "desc"
+        try:
+            rows = sorted(rows, key=lambda row: (row.get(field) is None, row.get(field)), reverse=descending)
+        except TypeError:
+            raise UnsupportedFilter(f"order by {field} on mixed types")
+    return rows
+
+
+# Cache
+
+@dataclass
+class CacheEntry:
+    schema: str
+    scope: str                      # server/tenant the rows were read from
+    atoms: Dict[str, Dict]          # canonical atom -> atom
+    select: Optional[Set[str]]      # None = full records
+    rows: List[Dict[str, Any]]
+    complete: bool                  # rows are the whole result of the where-clause
+    size: int                       # bytes, for eviction
+    stored_at: float
+
+
+class FilterCache:
+    """LRU of select results bounded by memory, answering refinements locally"""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, ttl: float = 60.0):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.subsumed = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def lookup(self, schema: str, query: Dict, scope: str = "") -> Optional[List[Dict[str, Any]]]:
+        """Rows for query from an exact or subsuming entry of the same scope, or None"""
+        key = query_key(schema, query, scope)
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and now - entry.stored_at <= self.ttl:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                # Callers mutate rows (selection, lazy full-record loads) - hand out copies
+                return copy_rows(entry.rows)
+
+            candidates = [e for e in reversed(self.entries.values())
+                          if e.schema == schema and e.scope == scope and e.complete
+                          and now - e.stored_at <= self.ttl]
+
+        atoms = {canonical(atom): atom for atom in split_conditions(query.get("where"))}
+        select = set(query["select"]) if query.get("select") else None
+        for entry in candidates:
+            rows = self.refine(entry, atoms, select, query)
+            if rows is not None:
+                with self.lock:
+                    self.subsumed += 1
+                return rows
+
+        with self.lock:
+            self.misses += 1
+        return None
+
+    def refine(self, entry: CacheEntry, atoms: Dict[str, Dict], select: Optional[Set[str]],
+               query: Dict) -> Optional[List[Dict[str, Any]]]:
+        """Evaluate query over a broader cached result, or None if it can't be done exactly"""
+        if not set(entry.atoms) <= set(atoms):
+            return None
+        extra = [atom for key, atom in atoms.items() if key not in entry.atoms]
+        try:
+            needed = set(select or ())
+            for atom in extra:
+                needed |= atom_fields(atom)
+            needed |= {clause.split()[0] for clause in query.get("order") or []}
+            if entry.select is not None and (select is None or not needed <= entry.select):
+                return None  # Cached rows lack columns this query needs
+
+            rows = [row for row in entry.rows if all(match_atom(row, atom) for atom in extra)]
+            rows = sort_rows(rows, query.get("order"))
+        except UnsupportedFilter:
+            return None
+
+        if query.get("limit"):
+            rows = rows[:query["limit"]]
+        if select is not None and entry.select != select:
+            return [{name: row[name] for name in select if name in row} for row in rows]
+        return copy_rows(rows)
+
+    def store(self, schema: str, query: Dict, rows: List[Dict[str, Any]], size: int = 0, scope: str = "") -> None:
+        """Remember a server result"""
+        limit = query.get("limit")
+        entry = CacheEntry(
+            schema=schema,
+            scope=scope,
+            atoms={canonical(atom): atom for atom in split_conditions(query.get("where"))},
+            select=set(query["select"]) if query.get("select") else None,
+            rows=copy_rows(rows),  # Detached from the caller's rows, which screens go on to mutate
+            # A limited result is only the full answer if it came back short
+            complete=not limit or len(rows) < limit,
+            size=size or len(canonical(rows)),
+            stored_at=time.monotonic(),
+        )
+        if entry.size > self.max_bytes:
+            return
+        key = query_key(schema, query, scope)
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous:
+                self.total_bytes -= previous.size
+            self.entries[key] = entry
+            self.total_bytes += entry.size
+            while self.total_bytes > self.max_bytes and self.entries:
+                _, evicted = self.entries.popitem(last=False)
+                self.total_bytes -= evicted.size
+
+    def invalidate(self, schema: Optional[str] = None) -> None:
+        """Drop cached results for a schema in every scope (after a mutation) or everything"""
+        with self.lock:
+            for key in [k for k, e in self.entries.items() if schema is None or e.schema == schema]:
+                self.total_bytes -= self.entries.pop(key).size
+
+    def stats(self) -> Dict[str, int]:
+        with self.lock:
+            return {"entries": len(self.entries), "bytes": self.total_bytes,
+                    "hits": self.hits, "subsumed": self.subsumed, "misses": self.misses}
@@ -5,13 +5,23 @@ Monk CLI Command Execution Utility
 "Bridging the gap between beautiful UIs and powerful CLIs"
 """
 
+import atexit
 import json
 import yaml
 import subprocess
-from typing import Dict, List, Any, Optional
+import time
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
 from config import config
+from api.auth_snapshot import AUTH_CHANGING_COMMANDS, AuthSnapshot, AuthSnapshotCache
+from api.filter_cache import FilterCache
+from api.process_usage import ProcessUsage, UsageStats
+from api.server_health import CircuitBreaker, ServerHealth, is_unreachable_error
+from api.scheduler import ExecutionScheduler, Priority
+from api.transport import build_transport
+from utils.compact_records import compact_rows, to_plain
+from utils.tracing import tracer
 
 
 @dataclass
@@ -22,77 +32,239 @@ class MonkCommandResult:
     error: str = ""
     raw_output: str = ""
     exit_code: int = 0
+    timed_out: bool = False
+    usage: Optional[ProcessUsage] = None   # child rusage, when the platform reports it
+    duration: float = 0.0                  # seconds the child process ran
+    parse_time: float = 0.0                # seconds spent parsing its output
+    not_sent: bool = False                 # refused locally (open circuit) - no process ran
 
 
 class MonkClient:
     """Execute monk CLI commands and parse results"""
     
-    def __init__(self, monk_binary: str = None):
+    # Commands answered from local monk config without contacting a server
+    LOCAL_COMMANDS = {
+        ("server", "add"), ("server", "delete"), ("server", "use"), ("server", "current"),
+        ("server", "list"), ("tenant", "use"), ("auth", "status"), ("auth", "info"),
+        ("auth", "expires"), ("auth", "expired"), ("auth", "logout"),
+    }
+    
+    # Timeout ceiling (seconds) for calls that don't pass their own
+    DEFAULT_TIMEOUT = 5.0
+    
+    def __init__(self, monk_binary: str = None, transport=None):
         self.monk_binary = monk_binary or config.monk_executable
+        self.transport = transport or build_transport(self.monk_binary)
         self.send_trace = None
         self.recv_trace = None
+        self.current_server = None
+        self.current_tenant = None
+        self.health = ServerHealth(config.breaker_failure_threshold, config.breaker_cooldown)
+        self.scheduler = ExecutionScheduler(config.max_concurrency, config.max_concurrency_per_server)
+        self.usage_stats = UsageStats()
+        self.filter_cache = FilterCache(config.filter_cache_mb * 1024 * 1024, config.filter_cache_ttl)
+        self.auth = AuthSnapshotCache(self)
+    
+    def priority(self, priority: Priority):
+        """Context manager running this thread's monk calls at the given priority"""
+        return self.scheduler.priority(priority)
+    
+    def diagnostics(self) -> Dict[str, Any]:
+        """Server health, scheduler queues and per-command process usage"""
+        return {
+            "servers": self.health.summary(),
+            "scheduler": self.scheduler.stats(),
+            "commands": self.usage_stats.summary(),
+            "filter_cache": self.filter_cache.stats(),
+        }
+    
+    def dump_diagnostics(self, path: str) -> None:
+        """Write diagnostics() as JSON (registered at exit when VAULT_DIAGNOSTICS is set)"""
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.diagnostics(), handle, indent=2, default=str)
     
     def set_trace_widgets(self, send_trace, recv_trace):
         """Set trace widgets for command/response display"""
         self.send_trace = send_trace
         self.recv_trace = recv_trace
         
-    def _execute_command(self, args: List[str], timeout: int = 5, trace_data: dict = None) -> MonkCommandResult:
-        """Execute a monk command and return structured result"""
+    def _body_args(self, args: List[str], body: Any) -> Tuple[List[str], Optional[str]]:
+        """Place a JSON body on argv when small, otherwise return it as a stdin payload"""
+        payload = json.dumps(body, separators=(",", ":"), default=to_plain)
+        if len(payload) <= config.payload_stdin_threshold:
+            return args + [payload], None
+        return args, payload
+
+    def _server_for(self, args: List[str]) -> Optional[str]:
+        """Server a command talks to, or None for local-only commands"""
+        if tuple(args[:2]) in self.LOCAL_COMMANDS:
+            return None
+        if args[:2] == ["server", "ping"] and len(args) > 2:
+            return args[2]
+        return self.current_server or "current"
+
+    def _track_current_context(self, args: List[str], result: MonkCommandResult) -> None:
+        """Keep current_server / current_tenant in sync with switches, logins and listings"""
+        if not result.success:
+            return
+        if args[:2] == ["server", "use"] and len(args) > 2:
+            self.current_server = args[2]
+        elif args[:2] in (["tenant", "use"], ["auth", "login"]) and len(args) > 2:
+            self.current_tenant = args[2]
+        elif args[:2] == ["auth", "logout"]:
+            self.current_tenant = None
+        elif args[:2] == ["auth", "info"] and isinstance(result.data, dict) and result.data.get("tenant"):
+            self.current_tenant = result.data["tenant"]
+        elif args[:2] == ["server", "list"] and isinstance(result.data, dict):
+            for server in result.data.get("servers", []):
+                if server.get("is_current", False):
+                    self.current_server = server.get("name")
+
+    @staticmethod
+    def _size_class(args: List[str], stdin_payload: Optional[str]) -> str:
+        """Rough result/payload size of a call, so id probes and 1000-row pages time separately"""
+        body = stdin_payload
+        if body is None and "--filter" in args[:-1]:
+            body = args[args.index("--filter") + 1]
+        elif body is None and args[:2] in (["data", "create"], ["data", "update"]) and len(args) > 3:
+            body = args[-1]
+        size = len(body or "")
+        limit = None
+        if body and args[:2] == ["data", "select"]:
+            try:
+                limit = json.loads(body).get("limit")
+            except (ValueError, AttributeError):
+                pass
+        if args[:2] == ["data", "select"] and limit is None:
+            return "large"  # Unbounded select
+        if (limit or 0) > 100 or size > 64 * 1024:
+            return "large"
+        if (limit or 0) > 10 or size > 4 * 1024:
+            return "medium"
+        return "small"
+
+    def _execute_command(self, args: List[str], timeout: Optional[float] = None, trace_data: dict = None,
+                         stdin_payload: Optional[str] = None) -> MonkCommandResult:
+        """Execute a monk command guarded by per-server health tracking
+
+        Without an explicit timeout the default adapts to observed latency of
+        similar calls; an explicit timeout is used as given (never shortened).
+        """
+        command = " ".join(args[:2])
+        server = self._server_for(args)
+        latency_key = f"{server or 'local'}|{command}|{self._size_class(args, stdin_payload)}"
+        breaker = self.health.breaker(server) if server else None
+        
+        # Fail fast while a server is known to be down
+        if breaker and not breaker.allow():
+            return MonkCommandResult(
+                success=False,
+                error=f"Server '{server}' unavailable - next retry in {breaker.retry_in():.0f}s",
+                exit_code=-1,
+                not_sent=True
+            )
+        
+        # The single half-open probe decides the breaker, so it always gets the full deadline
+        probing = breaker is not None and breaker.state == CircuitBreaker.HALF_OPEN
+        if timeout is not None:
+            effective_timeout = timeout
+        elif probing:
+            effective_timeout = self.DEFAULT_TIMEOUT
+        else:
+            effective_timeout = self.health.latency.timeout_for(latency_key, self.DEFAULT_TIMEOUT)
+        
+        with tracer.span(f"monk {command}", "monk", argv=" ".join(args[:3]), server=server or "local"):
+            # Wait for a slot under the global/per-server limits, highest priority first
+            queued_at = tracer.now_us()
+            with self.scheduler.slot(server or "local"):
+                if tracer.enabled:
+                    tracer.record("queue", "monk", queued_at, tracer.now_us() - queued_at)
+                started = time.monotonic()
+                result = self._run_command(args, effective_timeout, trace_data, stdin_payload)
+                self.health.latency.record(latency_key, time.monotonic() - started)
+        
+        # Only invocations whose child actually ran count towards usage
+        if result.duration:
+            self.usage_stats.record(command, result.usage, result.duration, result.parse_time)
+        
+        if breaker:
+            if result.timed_out:
+                # A shortened adaptive deadline says nothing about the server - only full timeouts
+                # count, except that a timed-out probe must always settle the half-open breaker
+                if probing or effective_timeout >= (timeout if timeout is not None else self.DEFAULT_TIMEOUT):
+                    breaker.record_failure()
+            elif is_unreachable_error(result.error):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        
+        self._track_current_context(args, result)
+        if tuple(args[:2]) in AUTH_CHANGING_COMMANDS:
+            self.auth.invalidate()
+            self.filter_cache.invalidate()
+        return result
+
+    @staticmethod
+    def _parse_output(stdout: str) -> Any:
+        """Parse monk stdout as JSON, then YAML, falling back to raw text"""
+        if not stdout.strip():
+            return None
+        try:
+            # Try JSON first
+            return json.loads(stdout)
+        except json.JSONDecodeError:
+            try:
+                # Try YAML
+                return yaml.safe_load(stdout)
+            except yaml.YAMLError:
+                # Not structured data, use raw output
+                return stdout.strip()
+    
+    def _run_command(self, args: List[str], timeout: float, trace_data: dict = None,
+                     stdin_payload: Optional[str] = None) -> MonkCommandResult:
+        """Run one monk invocation through the transport and return structured result"""
         try:
-            # Build full command
-            cmd = [self.monk_binary] + args
-            
             # Show command trace if widget is available
             command_str = " ".join(args)
+            sent_bytes = len(stdin_payload) if stdin_payload else 0
             if self.send_trace and hasattr(self.send_trace, 'show_send_trace'):
-                self.send_trace.show_send_trace(command_str, trace_data)
+                self.send_trace.show_send_trace(command_str, trace_data, size=sent_bytes)
             elif self.send_trace and hasattr(self.send_trace, 'show_command'):
-                self.send_trace.show_command(command_str, trace_data)
+                self.send_trace.show_command(command_str, trace_data, size=sent_bytes)
             
-            # Execute command
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                check=False  # Don't raise exception on non-zero exit
-            )
+            # Execute command (live subprocess, recording or replay)
+            result = self.transport.run(args, stdin_payload, timeout)
             
             # Try to parse JSON/YAML output, fall back to raw text
-            data = None
-            if result.stdout.strip():
-                try:
-                    # Try JSON first
-                    data = json.loads(result.stdout)
-                except json.JSONDecodeError:
-                    try:
-                        # Try YAML
-                        data = yaml.safe_load(result.stdout)
-                    except yaml.YAMLError:
-                        # Not structured data, use raw output
-                        data = result.stdout.strip()
+            parse_started = time.perf_counter()
+            with tracer.span("parse", "monk", bytes=len(result.stdout)):
+                data = self._parse_output(result.stdout)
+            parse_time = time.perf_counter() - parse_started
             
             # Show response trace if widget is available
             if self.recv_trace and data:
                 if hasattr(self.recv_trace, 'show_recv_trace'):
-                    self.recv_trace.show_recv_trace(data)
+                    self.recv_trace.show_recv_trace(data, size=len(result.stdout))
                 elif hasattr(self.recv_trace, 'show_response'):
-                    self.recv_trace.show_response(data)
+                    self.recv_trace.show_response(data, size=len(result.stdout))
             
             return MonkCommandResult(
                 success=result.returncode == 0,
                 data=data,
                 error=result.stderr.strip() if result.stderr else "",
                 raw_output=result.stdout.strip(),
-                exit_code=result.returncode
+                exit_code=result.returncode,
+                usage=result.usage,
+                duration=result.duration,
+                parse_time=parse_time
             )
             
         except subprocess.TimeoutExpired:
             return MonkCommandResult(
                 success=False,
-                error=f"Command timed out after {timeout} seconds",
-                exit_code=-1
+                error=f"Command timed out after {timeout:g} seconds",
+                exit_code=-1,
+                timed_out=True
             )
         except FileNotFoundError:
             return MonkCommandResult(
@@ -132,12 +304,12 @@ class MonkClient:
         """Execute: monk server current"""
         return self._execute_command(["server", "current"])
     
-    def server_ping(self, name: Optional[str] = None) -> MonkCommandResult:
+    def server_ping(self, name: Optional[str] = None, timeout: Optional[float] = None) -> MonkCommandResult:
         """Execute: monk server ping [name]"""
         args = ["server", "ping"]
         if name:
             args.append(name)
-        return self._execute_command(args)
+        return self._execute_command(args, timeout=timeout)
     
     def server_ping_all(self) -> MonkCommandResult:
         """Execute: monk server ping-all"""
@@ -195,29 +367,87 @@ class MonkClient:
         """Execute: monk auth expired (returns success/error)"""
         return self._execute_command(["auth", "expired"])
     
+    @property
+    def cache_scope(self) -> str:
+        """Server/tenant that cached results belong to"""
+        return f"{self.current_server or 'current'}/{self.current_tenant or ''}"
+    
+    def auth_snapshot(self, refresh: bool = False) -> AuthSnapshot:
+        """Status, expiry and identity in one parallel round (cached until login/logout/switch)"""
+        return self.auth.get(refresh)
+    
     # Data Operations (for future modules)
     
-    def data_select(self, schema: str, filters: Optional[Dict] = None) -> MonkCommandResult:
-        """Execute: monk data select <schema> [filters]"""
+    def data_select(self, schema: str, filters: Optional[Dict] = None,
+                    fields: Optional[List[str]] = None, timeout: Optional[float] = None) -> MonkCommandResult:
+        """Execute: monk data select <schema> [filters], optionally projected to fields"""
+        if fields:
+            # Projection pushdown - the server only returns the columns asked for
+            filters = dict(filters or {}, select=list(fields))
         args = ["data", "select", schema]
         if filters:
-            args.extend(["--filter", json.dumps(filters)])
-        return self._execute_command(args)
+            # --filter is the only documented way to pass a select filter (stdin isn't),
+            # so filters always go on argv - callers chunk big $in lists instead
+            # (see incremental_sync.PROBE_CHUNK)
+            args.extend(["--filter", json.dumps(filters, separators=(",", ":"), default=to_plain)])
+        return self._execute_command(args, timeout=timeout)
+    
+    def data_select_cached(self, schema: str, filters: Optional[Dict] = None,
+                           fields: Optional[List[str]] = None, timeout: Optional[float] = None) -> MonkCommandResult:
+        """data_select answered from the filter cache when an exact or broader result is held"""
+        query = dict(filters or {})
+        if fields:
+            query["select"] = list(fields)
+        scope = self.cache_scope
+        rows = self.filter_cache.lookup(schema, query, scope)
+        if rows is not None:
+            return MonkCommandResult(success=True, data=rows)
+        result = self.data_select(schema, query, timeout=timeout)
+        if result.success and isinstance(result.data, list):
+            # Cached rows live a while - hold them as compact records with pooled values
+            result.data = compact_rows(result.data)
+            self.filter_cache.store(schema, query, result.data, len(result.raw_output), scope)
+        return result
+    
+    def _mutated(self, schema: str, result: MonkCommandResult) -> MonkCommandResult:
+        """Drop cached select results for a schema after a successful write"""
+        if result.success:
+            self.filter_cache.invalidate(schema)
+        return result
     
     def data_create(self, schema: str, data: Dict) -> MonkCommandResult:
         """Execute: monk data create <schema> <data>"""
-        return self._execute_command(["data", "create", schema, json.dumps(data)])
-    
+        args, stdin_payload = self._body_args(["data", "create", schema], data)
+        return self._mutated(schema, self._execute_command(args, stdin_payload=stdin_payload))
+
+    def data_create_many(self, schema: str, records: List[Dict], timeout: int = 30) -> MonkCommandResult:
+        """Execute: monk data create <schema> <[records]> (bulk create from a JSON array)"""
+        args, stdin_payload = self._body_args(["data", "create", schema], records)
+        return self._mutated(schema, self._execute_command(args, timeout=timeout, stdin_payload=stdin_payload))
+
     def data_update(self, schema: str, id_or_data: str, data: Optional[Dict] = None) -> MonkCommandResult:
         """Execute: monk data update <schema> <id> [data]"""
         args = ["data", "update", schema, id_or_data]
+        stdin_payload = None
         if data:
-            args.append(json.dumps(data))
-        return self._execute_command(args)
+            args, stdin_payload = self._body_args(args, data)
+        return self._mutated(schema, self._execute_command(args, stdin_payload=stdin_payload))
+    
+    def data_get(self, schema: str, value: str, key: str = "id") -> MonkCommandResult:
+        """Execute: monk data select <schema> for one full record (data is the record dict or None)"""
+        result = self.data_select(schema, {"where": {key: value}, "limit": 1})
+        if result.success:
+            rows = result.data if isinstance(result.data, list) else [result.data]
+            result.data = rows[0] if rows and isinstance(rows[0], dict) else None
+        return result
+    
+    def data_version(self, schema: str, record_id: str, version_field: str = "modified_at") -> MonkCommandResult:
+        """Execute: monk data select <schema> projected to id + version field for one record"""
+        return self.data_select(schema, {"where": {"id": record_id}, "limit": 1}, fields=["id", version_field])
     
     def data_delete(self, schema: str, record_id: str) -> MonkCommandResult:
         """Execute: monk data delete <schema> <id>"""
-        return self._execute_command(["data", "delete", schema, record_id])
+        return self._mutated(schema, self._execute_command(["data", "delete", schema, record_id]))
     
     # Meta/Schema Operations (for Schema Laboratory)
     
@@ -230,54 +460,20 @@ class MonkClient:
     
     def meta_create(self, schema_type: str, schema_data: Dict) -> MonkCommandResult:
         """Execute: monk meta create <type> with schema data via stdin"""
-        try:
-            # Build command
-            cmd = [self.monk_binary, "meta", "create", schema_type]
-            
-            # Convert schema data to JSON for stdin
-            schema_json = json.dumps(schema_data, indent=2)
-            
-            # Execute with stdin
-            result = subprocess.run(
-                cmd,
-                input=schema_json,
-                capture_output=True,
-                text=True,
-                timeout=10,
-                check=False
-            )
-            
-            # Parse response
-            data = None
-            if result.stdout.strip():
-                try:
-                    data = json.loads(result.stdout)
-                except json.JSONDecodeError:
-                    data = result.stdout.strip()
-            
-            return MonkCommandResult(
-                success=result.returncode == 0,
-                data=data,
-                error=result.stderr.strip() if result.stderr else "",
-                raw_output=result.stdout.strip(),
-                exit_code=result.returncode
-            )
-            
-        except Exception as e:
-            return MonkCommandResult(
-                success=False,
-                error=f"Meta create error: {str(e)}",
-                exit_code=-1
-            )
+        schema_json = json.dumps(schema_data, indent=2, default=to_plain)
+        return self._execute_command(["meta", "create", schema_type], timeout=10, stdin_payload=schema_json)
     
     def meta_update(self, schema: str, definition: Dict) -> MonkCommandResult:
         """Execute: monk meta update <schema> <definition>"""
-        return self._execute_command(["meta", "update", schema, json.dumps(definition)])
+        args, stdin_payload = self._body_args(["meta", "update", schema], definition)
+        return self._mutated(schema, self._execute_command(args, timeout=10, stdin_payload=stdin_payload))
     
     def meta_delete(self, schema: str) -> MonkCommandResult:
         """Execute: monk meta delete <schema>"""
-        return self._execute_command(["meta", "delete", schema])
+        return self._mutated(schema, self._execute_command(["meta", "delete", schema]))
 
 
 # Global client instance
-monk = MonkClient()
\ No newline at end of file
+monk = MonkClient()
+if config.diagnostics_path:
+    atexit.register(monk.dump_diagnostics, config.diagnostics_path)
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""
+PREDICTIVE PREFETCH
+Speculative background loads for the row the cursor is resting on
+
+When the cursor dwells on a row, the command its Enter key would run is
+started at background priority. Moving on cancels the pending load, and
+the screen opened by Enter takes the result instead of calling monk.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from textual.worker import get_current_worker
+
+from config import config
+from api.monk_client import MonkCommandResult, monk
+from api.scheduler import Priority
+
+
+@dataclass
+class PrefetchEntry:
+    result: MonkCommandResult
+    size: int
+    stored_at: float
+
+
+class PrefetchEngine:
+    """Dwell-triggered speculative loads with a byte budget and short lifetime"""
+
+    def __init__(self, client, dwell: float = 0.3, max_bytes: int = 1024 * 1024, ttl: float = 30.0):
+        self.client = client
+        self.dwell = dwell
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.entries: "OrderedDict[Hashable, PrefetchEntry]" = OrderedDict()
+        self.total_bytes = 0
+        self.timer = None
+        self.pending: Optional[Hashable] = None
+        self.started = 0
+        self.hits = 0
+        self.wasted = 0  # Loaded but evicted or expired without being used
+        self.lock = threading.Lock()
+
+    def hover(self, screen, key: Hashable, loader: Callable[[], MonkCommandResult]) -> None:
+        """The cursor moved onto a row - load key after the dwell time unless it moves again"""
+        if self.timer:
+            self.timer.stop()
+            self.timer = None
+        if key == self.pending or self.fresh(key):
+            return
+        self.timer = screen.set_timer(self.dwell, lambda: self.start(screen, key, loader))
+
+    def start(self, screen, key: Hashable, loader: Callable[[], MonkCommandResult]) -> None:
+        """Dwell elapsed - run the load (exclusive=True cancels the previous speculation)"""
+        self.timer = None
+        self.pending = key
+        self.started += 1
+        screen.run_worker(lambda: self.load(key, loader), thread=True, exclusive=True, group="prefetch")
+
+    def load(self, key: Hashable, loader: Callable[[], MonkCommandResult]) -> None:
+        """Worker thread: fetch at background priority and keep the result unless superseded"""
+        with self.client.priority(Priority.BACKGROUND):
+            result = loader()
+        if self.pending == key:
+            self.pending = None
+        if get_current_worker().is_cancelled or not result.success:
+            return
+        self.store(key, result)
+
+    def store(self, key: Hashable, result: MonkCommandResult) -> None:
+        size = len(result.raw_output or "") or 1
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous:
+                self.total_bytes -= previous.size
+            self.entries[key] = PrefetchEntry(result=result, size=size, stored_at=time.monotonic())
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes and self.entries:
+                _, evicted = self.entries.popitem(last=False)
+                self.total_bytes -= evicted.size
+                self.wasted += 1
+
+    def fresh(self, key: Hashable) -> bool:
+        with self.lock:
+            entry = self.entries.get(key)
+            return entry is not None and time.monotonic() - entry.stored_at <= self.ttl
+
+    def take(self, key: Hashable) -> Optional[MonkCommandResult]:
+        """Claim a prefetched result (each is used once), or None"""
+        self.cancel()  # The user acted - no more speculation for this cursor position
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is None:
+                return None
+            self.total_bytes -= entry.size
+            if time.monotonic() - entry.stored_at > self.ttl:
+                self.wasted += 1
+                return None
+            self.hits += 1
+            return entry.result
+
+    def cancel(self) -> None:
+        """Drop the pending dwell (e.g. when the screen is left)"""
+        if self.timer:
+            self.timer.stop()
+            self.timer = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {"entries": len(self.entries), "bytes": self.total_bytes, "started": self.started,
+                    "hits": self.hits, "wasted": self.wasted}
+
+
+# Global prefetch engine instance
+prefetcher = PrefetchEngine(monk, dwell=config.prefetch_dwell, max_bytes=config.prefetch_budget_kb * 1024,
+                            ttl=config.prefetch_ttl)
@@ -0,0 +1,136 @@
+"""
+PROCESS USAGE ACCOUNTING
+Resource usage (rusage) of each monk child process, aggregated per command
+"""
+
+import os
+import subprocess
+import sys
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass
+class ProcessUsage:
+    """Resources consumed by one monk child process"""
+    user_cpu: float = 0.0          # seconds
+    system_cpu: float = 0.0        # seconds
+    max_rss_kb: int = 0
+    minor_faults: int = 0
+    major_faults: int = 0
+    voluntary_switches: int = 0
+    involuntary_switches: int = 0
+
+    @classmethod
+    def from_rusage(cls, rusage) -> "ProcessUsage":
+        # ru_maxrss is kilobytes on Linux but bytes on macOS
+        max_rss = rusage.ru_maxrss // 1024 if sys.platform == "darwin" else rusage.ru_maxrss
+        return cls(
+            user_cpu=rusage.ru_utime,
+            system_cpu=rusage.ru_stime,
+            max_rss_kb=max_rss,
+            minor_faults=rusage.ru_minflt,
+            major_faults=rusage.ru_majflt,
+            voluntary_switches=rusage.ru_nvcsw,
+            involuntary_switches=rusage.ru_nivcsw,
+        )
+
+    @property
+    def cpu(self) -> float:
+        return self.user_cpu + self.system_cpu
+
+
+class UsagePopen(subprocess.Popen):
+    """Popen that reaps its child with wait4 so the child's rusage is kept"""
+
+    usage: Optional[ProcessUsage] = None
+
+    def _try_wait(self, wait_flags):
+        # Overrides CPython's private Popen._try_wait (POSIX), the one place a child is
+        # reaped with waitpid; mirrors it exactly (callers hold self._waitpid_lock)
+        try:
+            pid, sts, rusage = os.wait4(self.pid, wait_flags)
+        except ChildProcessError:
+            return (self.pid, 0)
+        if pid == self.pid:
+            self.usage = ProcessUsage.from_rusage(rusage)
+        return (pid, sts)
+
+
+# wait4 is POSIX only, and _try_wait is a CPython internal - without either,
+# children are reaped by plain Popen and calls report no usage
+ProcessClass = (UsagePopen if hasattr(os, "wait4") and hasattr(subprocess.Popen, "_try_wait")
+                else subprocess.Popen)
+
+
+@dataclass
+class CommandUsage:
+    """Running totals for one command type (e.g. "data select")"""
+    calls: int = 0
+    measured: int = 0              # calls that reported rusage
+    wall: float = 0.0              # seconds, spawn to exit
+    parse: float = 0.0             # seconds spent parsing output in this process
+    user_cpu: float = 0.0
+    system_cpu: float = 0.0
+    peak_rss_kb: int = 0
+    minor_faults: int = 0
+    major_faults: int = 0
+    voluntary_switches: int = 0
+    involuntary_switches: int = 0
+
+    def add(self, usage: Optional[ProcessUsage], wall: float, parse: float) -> None:
+        self.calls += 1
+        self.wall += wall
+        self.parse += parse
+        if usage is None:
+            return
+        self.measured += 1
+        self.user_cpu += usage.user_cpu
+        self.system_cpu += usage.system_cpu
+        self.peak_rss_kb = max(self.peak_rss_kb, usage.max_rss_kb)
+        self.minor_faults += usage.minor_faults
+        self.major_faults += usage.major_faults
+        self.voluntary_switches += usage.voluntary_switches
+        self.involuntary_switches += usage.involuntary_switches
+
+    def summary(self) -> Dict[str, float]:
+        calls = max(1, self.calls)
+        measured = max(1, self.measured)
+        return {
+            "calls": self.calls,
+            "avg_wall_ms": round(self.wall / calls * 1000, 2),
+            "avg_parse_ms": round(self.parse / calls * 1000, 2),
+            "avg_user_cpu_ms": round(self.user_cpu / measured * 1000, 2),
+            "avg_system_cpu_ms": round(self.system_cpu / measured * 1000, 2),
+            "total_cpu_s": round(self.user_cpu + self.system_cpu, 3),
+            "peak_rss_kb": self.peak_rss_kb,
+            "minor_faults": self.minor_faults,
+            "major_faults": self.major_faults,
+            "voluntary_switches": self.voluntary_switches,
+            "involuntary_switches": self.involuntary_switches,
+        }
+
+
+@dataclass
+class UsageStats:
+    """Per-command aggregation of child process usage"""
+    commands: Dict[str, CommandUsage] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, command: str, usage: Optional[ProcessUsage], wall: float, parse: float) -> None:
+        with self.lock:
+            entry = self.commands.get(command)
+            if entry is None:
+                entry = self.commands[command] = CommandUsage()
+            entry.add(usage, wall, parse)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Command → averages and totals, most CPU-expensive first"""
+        with self.lock:
+            ranked = sorted(self.commands.items(), key=lambda item: item[1].user_cpu + item[1].system_cpu, reverse=True)
+            return {command: entry.summary() for command, entry in ranked}
+
+    def reset(self) -> None:
+        with self.lock:
+            self.commands.clear()
@@ -0,0 +1,104 @@
+"""
+EXECUTION SCHEDULER
+Global concurrency governor with priority classes for monk executions
+"""
+
+import itertools
+import threading
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class Priority(IntEnum):
+    """Scheduling classes - lower value runs first"""
+    INTERACTIVE = 0       # Direct response to a keypress
+    VISIBLE_REFRESH = 1   # Refreshing data already on screen
+    BACKGROUND = 2        # Prefetch, health sweeps, cache warming
+    BULK = 3              # Imports and other long batch jobs
+
+
+class ExecutionScheduler:
+    """Caps in-flight monk processes globally and per server, admitting by priority"""
+
+    def __init__(self, global_limit: int = 4, per_server_limit: int = 3, interactive_reserve: int = 1):
+        self.global_limit = max(1, global_limit)
+        self.per_server_limit = max(1, per_server_limit)
+        # Extra slots only interactive work may use, so a saturated bulk job never blocks a keypress
+        self.interactive_reserve = max(0, interactive_reserve)
+
+        self.condition = threading.Condition()
+        self.in_flight = 0
+        self.in_flight_by_server: Dict[str, int] = {}
+        self.waiting: List[Tuple[int, int, str]] = []   # (priority, sequence, server)
+        self.sequence = itertools.count()
+        self.local = threading.local()
+
+    # Priority context
+
+    def current_priority(self) -> Priority:
+        """Priority for the calling thread (UI thread defaults to interactive)"""
+        priority = getattr(self.local, "priority", None)
+        if priority is not None:
+            return priority
+        if threading.current_thread() is threading.main_thread():
+            return Priority.INTERACTIVE
+        return Priority.BACKGROUND
+
+    @contextmanager
+    def priority(self, priority: Priority) -> Iterator[None]:
+        """Run the enclosed monk calls at a given priority on this thread"""
+        previous = getattr(self.local, "priority", None)
+        self.local.priority = priority
+        try:
+            yield
+        finally:
+            self.local.priority = previous
+
+    # Admission
+
+    def has_capacity(self, priority: int, server: str) -> bool:
+        """Check global and per-server limits for a ticket (condition lock held)"""
+        reserve = self.interactive_reserve if priority == Priority.INTERACTIVE else 0
+        if self.in_flight >= self.global_limit + reserve:
+            return False
+        return self.in_flight_by_server.get(server, 0) < self.per_server_limit + reserve
+
+    def next_ticket(self) -> Optional[Tuple[int, int, str]]:
+        """Best-ranked waiting ticket that could start right now (condition lock held)"""
+        for ticket in sorted(self.waiting):
+            if self.has_capacity(ticket[0], ticket[2]):
+                return ticket
+        return None
+
+    @contextmanager
+    def slot(self, server: str, priority: Optional[Priority] = None) -> Iterator[None]:
+        """Block until this execution may start, then hold a slot for its duration"""
+        priority = self.current_priority() if priority is None else priority
+        ticket = (int(priority), next(self.sequence), server)
+
+        with self.condition:
+            self.waiting.append(ticket)
+            while self.next_ticket() != ticket:
+                self.condition.wait()
+            self.waiting.remove(ticket)
+            self.in_flight += 1
+            self.in_flight_by_server[server] = self.in_flight_by_server.get(server, 0) + 1
+            # Others may also fit (e.g. different server) - let them re-check
+            self.condition.notify_all()
+
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.in_flight -= 1
+                self.in_flight_by_server[server] -= 1
+                self.condition.notify_all()
+
+    def stats(self) -> Dict[str, int]:
+        """In-flight and queued counts for diagnostics"""
+        with self.condition:
+            queued = {p.name.lower(): 0 for p in Priority}
+            for priority, _, _ in self.waiting:
+                queued[Priority(priority).name.lower()] += 1
+            return {"in_flight": self.in_flight, **{f"queued_{k}": v for k, v in queued.items()}}
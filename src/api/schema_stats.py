@@ -0,0 +1,94 @@
+"""
+Schema Stats
+Per-schema record counts and last-modified times for the schema registry
+
+One capped, id-and-watermark-only select per schema, newest first, gives
+both numbers: the row count (exact below the cap) and the newest
+modified_at. Selects run concurrently through the fan-out and results are
+cached per server/tenant, so paging back and forth or revisiting the lab
+only re-asks for schemas whose numbers have gone stale.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+from config import config
+from api.fanout import fanout
+
+
+@dataclass
+class SchemaStats:
+    """Record count and newest modification for one schema"""
+    records: int = 0
+    exact: bool = True          # False = at least records (the probe hit its cap)
+    last_modified: str = ""
+    fetched_at: float = 0.0
+    error: str = ""
+
+    def describe_records(self) -> str:
+        if self.error:
+            return "?"
+        return f"{self.records:,}" if self.exact else f"{self.records:,}+"
+
+
+class SchemaStatsCache:
+    """Cached per-schema stats, keyed by scope (server/tenant) and schema name"""
+
+    def __init__(self, fanout, ttl: float = 60.0, cap: int = 1000, watermark_field: str = "modified_at"):
+        self.fanout = fanout
+        self.ttl = ttl
+        self.cap = cap
+        self.watermark_field = watermark_field
+        self.entries: Dict[str, Dict[str, SchemaStats]] = {}
+        self.lock = threading.Lock()
+
+    def get(self, scope: str, schema: str) -> Optional[SchemaStats]:
+        """Cached stats, fresh or not"""
+        with self.lock:
+            return self.entries.get(scope, {}).get(schema)
+
+    def stale(self, scope: str, schemas: Iterable[str]) -> List[str]:
+        """Schemas with no stats or stats older than the ttl"""
+        now = time.time()
+        with self.lock:
+            held = self.entries.get(scope, {})
+            return [name for name in schemas
+                    if name not in held or held[name].error or now - held[name].fetched_at > self.ttl]
+
+    def invalidate(self, scope: str, schema: Optional[str] = None) -> None:
+        with self.lock:
+            if schema is None:
+                self.entries.pop(scope, None)
+            else:
+                self.entries.get(scope, {}).pop(schema, None)
+
+    def probe(self, client, schema: str, timeout: float) -> SchemaStats:
+        """Count rows (up to the cap) and read the newest watermark in one select"""
+        query = {"order": [f"{self.watermark_field} desc"], "limit": self.cap + 1}
+        result = client.data_select(schema, query, fields=["id", self.watermark_field], timeout=timeout)
+        if not result.success or not isinstance(result.data, list):
+            return SchemaStats(fetched_at=time.time(), error=result.error or "no response")
+        rows = result.data
+        newest = rows[0].get(self.watermark_field, "") if rows and isinstance(rows[0], dict) else ""
+        return SchemaStats(records=min(len(rows), self.cap), exact=len(rows) <= self.cap,
+                           last_modified=str(newest or ""), fetched_at=time.time())
+
+    def refresh(self, client, scope: str, schemas: List[str],
+                on_result: Callable[[str, SchemaStats], None],
+                cancelled: Callable[[], bool] = lambda: False) -> None:
+        """Probe schemas concurrently (bounded by the fan-out), caching and reporting each as it lands"""
+        def landed(outcome) -> None:
+            stats = outcome.result if outcome.result is not None else SchemaStats(
+                fetched_at=time.time(), error=outcome.error or "failed")
+            with self.lock:
+                self.entries.setdefault(scope, {})[outcome.target] = stats
+            on_result(outcome.target, stats)
+
+        self.fanout.run(schemas, lambda schema, timeout: self.probe(client, schema, timeout),
+                        on_result=landed, cancelled=cancelled)
+
+
+# Global schema stats cache instance
+schema_stats = SchemaStatsCache(fanout, ttl=config.schema_stats_ttl, cap=config.match_count_cap)
@@ -0,0 +1,182 @@
+"""
+SERVER HEALTH TRACKING
+Per-server circuit breakers and adaptive per-command timeouts
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+
+# Fragments of monk/curl/node stderr that mean the server itself is unreachable
+UNREACHABLE_MARKERS = (
+    "econnrefused",
+    "connection refused",
+    "could not resolve",
+    "couldn't connect",
+    "failed to connect",
+    "network is unreachable",
+    "no route to host",
+    "fetch failed",
+    "timed out",
+    "curl: (6)",
+    "curl: (7)",
+    "curl: (28)",
+)
+
+
+# Subset meaning the request never reached the server (safe to re-send writes)
+CONNECT_MARKERS = (
+    "econnrefused",
+    "connection refused",
+    "could not resolve",
+    "couldn't connect",
+    "failed to connect",
+    "network is unreachable",
+    "no route to host",
+    "curl: (6)",
+    "curl: (7)",
+)
+
+
+def is_unreachable_error(error: str) -> bool:
+    """Classify stderr as a transport failure rather than an application error"""
+    lowered = error.lower()
+    return any(marker in lowered for marker in UNREACHABLE_MARKERS)
+
+
+def is_connect_error(error: str) -> bool:
+    """Classify stderr as a failure to connect at all (nothing was sent)"""
+    lowered = error.lower()
+    return any(marker in lowered for marker in CONNECT_MARKERS)
+
+
+class CircuitBreaker:
+    """Closed → open after repeated failures → half-open probe after cooldown"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 10.0, max_cooldown: float = 120.0):
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Check whether a request may go out now"""
+        with self.lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.cooldown:
+                self.state = self.HALF_OPEN
+                self.probe_in_flight = False
+            if self.state == self.HALF_OPEN and not self.probe_in_flight:
+                # Exactly one probe request decides whether the server recovered
+                self.probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Server answered - close the circuit"""
+        with self.lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.cooldown = self.base_cooldown
+            self.probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Server unreachable - count towards opening the circuit"""
+        with self.lock:
+            if self.state == self.HALF_OPEN:
+                # Failed probe - stay open and back off further
+                self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+                self.trip()
+                return
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.trip()
+
+    def trip(self) -> None:
+        """Open the circuit (lock must be held)"""
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        self.probe_in_flight = False
+
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed"""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
+
+
+class LatencyTracker:
+    """Rolling latency window per key (server | command | size class), used to derive adaptive timeouts"""
+
+    def __init__(self, window: int = 50, min_samples: int = 5, multiplier: float = 3.0,
+                 floor: float = 1.0):
+        self.window = window
+        self.min_samples = min_samples
+        self.multiplier = multiplier
+        self.floor = floor
+        self.samples: Dict[str, Deque[float]] = {}
+        self.lock = threading.Lock()
+
+    def record(self, command: str, seconds: float) -> None:
+        """Record one observed duration (timeouts are recorded at the timeout value)"""
+        with self.lock:
+            samples = self.samples.get(command)
+            if samples is None:
+                samples = self.samples[command] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, command: str, fraction: float) -> Optional[float]:
+        """Get a latency percentile, or None without enough samples"""
+        with self.lock:
+            samples = sorted(self.samples.get(command, ()))
+        if len(samples) < self.min_samples:
+            return None
+        index = min(len(samples) - 1, int(round(fraction * (len(samples) - 1))))
+        return samples[index]
+
+    def timeout_for(self, command: str, ceiling: float) -> float:
+        """Adaptive timeout: multiple of observed p95, never above the default ceiling"""
+        p95 = self.percentile(command, 0.95)
+        if p95 is None:
+            return ceiling
+        return min(ceiling, max(self.floor, p95 * self.multiplier))
+
+
+class ServerHealth:
+    """Registry of circuit breakers (per server) and latency windows (per server, command and size)"""
+
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 10.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.latency = LatencyTracker()
+        self.lock = threading.Lock()
+
+    def breaker(self, server: str) -> CircuitBreaker:
+        """Get or create the breaker for a server"""
+        with self.lock:
+            breaker = self.breakers.get(server)
+            if breaker is None:
+                breaker = self.breakers[server] = CircuitBreaker(self.failure_threshold, self.cooldown)
+            return breaker
+
+    def is_down(self, server: str) -> bool:
+        """True while the server's circuit is open"""
+        breaker = self.breakers.get(server)
+        return bool(breaker and breaker.state == CircuitBreaker.OPEN)
+
+    def summary(self) -> Dict[str, str]:
+        """Server → breaker state, for status displays"""
+        return {server: breaker.state for server, breaker in self.breakers.items()}
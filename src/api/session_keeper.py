@@ -0,0 +1,120 @@
+"""
+Session Keeper
+Renews the monk session in the background before the JWT expires
+
+monk has no refresh-token command, so a refresh is a fresh `auth login`
+with the credentials typed at login (held in memory only, never written
+anywhere). Sessions resumed without a password can't be renewed - the
+operator is warned ahead of expiry instead of hitting a failed action.
+After every login the registered warmers run, so the first screens the
+operator opens read from cache.
+"""
+
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+
+from config import config
+from api.monk_client import monk
+from api.scheduler import Priority
+from api.server_health import is_unreachable_error
+from utils.session_timer import SessionTimer
+
+
+class SessionKeeper:
+    """Tracks token expiry, re-authenticates ahead of it and pre-warms caches"""
+
+    def __init__(self, client, lead: float = 300.0, check_interval: float = 30.0):
+        self.client = client
+        self.configured_lead = lead
+        self.lead = lead                      # Renew when fewer seconds than this remain
+        self.check_interval = check_interval
+        self.warmers: List[Callable[[], object]] = []
+        self.app = None
+        self.timer = None
+        self.credentials: Optional[Tuple[str, str, str]] = None
+        self.expires_at: Optional[datetime] = None
+        self.warned = False
+        self.refreshes = 0
+        self.last_error = ""
+
+    def start(self, app, tenant: str, username: str, password: Optional[str] = None) -> None:
+        """A login succeeded - watch its expiry and warm caches in the background"""
+        self.stop()
+        self.app = app
+        self.lead = self.configured_lead
+        self.credentials = (tenant, username, password) if password else None
+        self.timer = app.set_interval(self.check_interval, self.check)
+        app.run_worker(self.prewarm, thread=True, group="session_prewarm")
+
+    def stop(self) -> None:
+        """Logout - forget credentials and stop checking"""
+        if self.timer:
+            self.timer.stop()
+            self.timer = None
+        self.credentials = None
+        self.expires_at = None
+        self.warned = False
+
+    def check(self) -> None:
+        """Interval tick (UI thread) - the expiry check itself runs off-thread"""
+        if self.app:
+            self.app.run_worker(self.tick, thread=True, exclusive=True, group="session_keeper")
+
+    def remaining(self) -> Optional[float]:
+        """Seconds until the token expires, or None if unknown (including an expiry with no timezone)"""
+        if self.expires_at is None:
+            self.expires_at = self.client.auth_snapshot().expires_at
+        if self.expires_at is None:
+            return None
+        return SessionTimer.seconds_until(self.expires_at)
+
+    def tick(self) -> None:
+        """Worker thread: renew (or warn) once expiry is within the lead time"""
+        with self.client.priority(Priority.BACKGROUND):
+            remaining = self.remaining()
+            if remaining is None or remaining > self.lead:
+                return
+            if self.credentials:
+                self.refresh()
+            elif not self.warned:
+                self.warned = True
+                self.warn(f"Session expires in {max(0, int(remaining // 60))}m - log in again to renew it")
+
+    def refresh(self) -> None:
+        """Log in again with the remembered credentials, then re-read expiry and re-warm"""
+        tenant, username, password = self.credentials
+        result = self.client.auth_login(tenant, username, password)
+        self.expires_at = None
+        if not result.success:
+            self.last_error = result.error or "login failed"
+            if result.timed_out or result.not_sent or is_unreachable_error(result.error):
+                # Server didn't answer - keep the credentials and try again next interval
+                return
+            # Don't retry a rejected password every interval - fall back to warning
+            self.credentials = None
+            self.warn(f"Session renewal failed: {self.last_error}")
+            return
+        self.refreshes += 1
+        self.warned = False
+        remaining = self.remaining()
+        if remaining is not None and remaining <= self.lead:
+            # Tokens live shorter than the lead - renew at half-life instead of on every check
+            self.lead = remaining / 2
+        self.prewarm()
+
+    def prewarm(self) -> None:
+        """Worker thread: run the warmers at background priority (failures only cost a cache miss)"""
+        with self.client.priority(Priority.BACKGROUND):
+            for warmer in self.warmers:
+                try:
+                    warmer()
+                except Exception:
+                    pass
+
+    def warn(self, message: str) -> None:
+        if self.app:
+            self.app.call_from_thread(self.app.notify, message, title="Session", severity="warning")
+
+
+# Global session keeper instance
+session_keeper = SessionKeeper(monk, lead=config.session_refresh_lead, check_interval=config.session_check_interval)
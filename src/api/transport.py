@@ -0,0 +1,199 @@
+"""
+MONK TRANSPORTS
+How monk invocations are carried out: live subprocess, recording, or replay
+
+"Every transmission logged. Every transmission repeatable."
+"""
+
+import json
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Deque, Dict, List, Optional, Tuple
+
+from api.process_usage import ProcessClass, ProcessUsage
+from config import config
+from utils.tracing import tracer
+
+
+@dataclass
+class TransportResult:
+    """Raw outcome of one monk invocation"""
+    stdout: str
+    stderr: str
+    returncode: int
+    duration: float = 0.0
+    usage: Optional[ProcessUsage] = None
+
+
+def redact_args(args: List[str]) -> List[str]:
+    """Hide secrets (login passwords) before argv is written anywhere"""
+    if args[:2] == ["auth", "login"] and len(args) > 4:
+        return args[:4] + ["***"] + args[5:]
+    return list(args)
+
+
+class SubprocessTransport:
+    """Runs the real monk binary"""
+
+    def __init__(self, monk_binary: str):
+        self.monk_binary = monk_binary
+
+    def run(self, args: List[str], stdin_payload: Optional[str], timeout: float) -> TransportResult:
+        """Execute monk; raises subprocess.TimeoutExpired / FileNotFoundError like subprocess.run"""
+        spool = None
+        try:
+            # Large bodies are spooled to a temp file handed over as stdin,
+            # smaller stdin bodies are written straight down the pipe
+            stdin_args = {}
+            if stdin_payload is not None:
+                if len(stdin_payload) >= config.payload_spool_threshold:
+                    spool = tempfile.TemporaryFile(mode="w+", encoding="utf-8")
+                    spool.write(stdin_payload)
+                    spool.seek(0)
+                    stdin_args["stdin"] = spool
+                else:
+                    stdin_args["input"] = stdin_payload
+
+            started = time.monotonic()
+            with tracer.span("spawn", "monk"):
+                process = ProcessClass(
+                    [self.monk_binary] + args,
+                    stdin=stdin_args.get("stdin", subprocess.PIPE if "input" in stdin_args else None),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                )
+            with tracer.span("wait", "monk"):
+                try:
+                    stdout, stderr = process.communicate(stdin_args.get("input"), timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.communicate()
+                    raise
+            return TransportResult(
+                stdout=stdout,
+                stderr=stderr,
+                returncode=process.returncode,
+                duration=time.monotonic() - started,
+                usage=getattr(process, "usage", None),
+            )
+        finally:
+            if spool:
+                spool.close()
+
+
+class RecordingTransport:
+    """Wraps another transport and appends every exchange to an NDJSON file"""
+
+    def __init__(self, inner, path: str):
+        self.inner = inner
+        self.path = path
+        self.started = time.monotonic()
+        self.lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+    def run(self, args: List[str], stdin_payload: Optional[str], timeout: float) -> TransportResult:
+        """Run through the inner transport and record the exchange"""
+        at = time.monotonic() - self.started
+        entry = {"at": round(at, 6), "argv": redact_args(args), "stdin": stdin_payload}
+        try:
+            result = self.inner.run(args, stdin_payload, timeout)
+        except subprocess.TimeoutExpired:
+            entry.update({"timeout": True, "duration": timeout})
+            self.write(entry)
+            raise
+
+        entry.update({
+            "stdout": result.stdout,
+            "stderr": result.stderr,
+            "exit_code": result.returncode,
+            "duration": round(result.duration, 6),
+        })
+        if result.usage:
+            entry["usage"] = asdict(result.usage)
+        self.write(entry)
+        return result
+
+    def write(self, entry: Dict) -> None:
+        """Append one NDJSON line (thread safe)"""
+        line = json.dumps(entry) + "\n"
+        with self.lock:
+            with open(self.path, "a", encoding="utf-8") as handle:
+                handle.write(line)
+
+
+class ReplayTransport:
+    """Serves recorded responses back in order for each (argv, stdin) pair"""
+
+    def __init__(self, path: str, speed: float = 0.0):
+        self.path = path
+        self.speed = speed  # 0 = as fast as possible, 1.0 = recorded latency, 2.0 = twice as fast
+        self.responses: Dict[Tuple, Deque[Dict]] = {}
+        self.last: Dict[Tuple, Dict] = {}
+        self.lock = threading.Lock()
+        self.load()
+
+    @staticmethod
+    def key(args: List[str], stdin_payload: Optional[str]) -> Tuple:
+        return (tuple(redact_args(args)), stdin_payload)
+
+    def load(self) -> None:
+        """Index a recording by request"""
+        with open(self.path, encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                key = (tuple(entry.get("argv", [])), entry.get("stdin"))
+                self.responses.setdefault(key, deque()).append(entry)
+
+    def run(self, args: List[str], stdin_payload: Optional[str], timeout: float) -> TransportResult:
+        """Return the next recorded response for this request"""
+        key = self.key(args, stdin_payload)
+        with self.lock:
+            queue = self.responses.get(key)
+            if queue:
+                entry = queue.popleft()
+                self.last[key] = entry
+            else:
+                # Recording exhausted for this request - repeat the last answer seen
+                entry = self.last.get(key)
+
+        if entry is None:
+            return TransportResult(
+                stdout="",
+                stderr=f"replay: no recorded response for: monk {' '.join(redact_args(args))}",
+                returncode=127,
+            )
+
+        duration = float(entry.get("duration", 0.0))
+        if self.speed > 0:
+            time.sleep(min(duration, timeout) / self.speed)
+
+        if entry.get("timeout"):
+            raise subprocess.TimeoutExpired(args, timeout)
+
+        return TransportResult(
+            stdout=entry.get("stdout", ""),
+            stderr=entry.get("stderr", ""),
+            returncode=int(entry.get("exit_code", 0)),
+            duration=duration,
+            usage=ProcessUsage(**entry["usage"]) if entry.get("usage") else None,
+        )
+
+
+def build_transport(monk_binary: str):
+    """Transport selected by MONK_REPLAY / MONK_RECORD (replay wins if both are set)"""
+    if config.monk_replay_path:
+        return ReplayTransport(config.monk_replay_path, config.monk_replay_speed)
+    transport = SubprocessTransport(monk_binary)
+    if config.monk_record_path:
+        transport = RecordingTransport(transport, config.monk_record_path)
+    return transport
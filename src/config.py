@@ -23,6 +23,71 @@ class VaultConfig:
         # Development mode screen bypass
         self.dev_start_screen = os.getenv("DEV_START_SCREEN", "")  # e.g., "overseer", "population", "schema"
         self.dev_mock_auth = self._get_bool_env("DEV_MOCK_AUTH", False)  # Skip real authentication
+        
+        # Local cache directory (import checkpoints, snapshots, indexes)
+        self.cache_dir = os.path.expanduser(os.getenv("VAULT_CACHE_DIR", "~/.cache/monk-cli-anarchy"))
+        
+        # Bulk import tuning
+        self.import_batch_size = self._get_int_env("IMPORT_BATCH_SIZE", 100)
+        self.import_parallelism = self._get_int_env("IMPORT_PARALLELISM", 4)
+        
+        # Circuit breaker: consecutive unreachable failures before failing fast, and first cooldown
+        self.breaker_failure_threshold = self._get_int_env("BREAKER_FAILURE_THRESHOLD", 3)
+        self.breaker_cooldown = self._get_int_env("BREAKER_COOLDOWN", 10)
+        
+        # Concurrent monk processes (interactive work gets one extra reserved slot)
+        self.max_concurrency = self._get_int_env("MONK_MAX_CONCURRENCY", 4)
+        self.max_concurrency_per_server = self._get_int_env("MONK_MAX_PER_SERVER", 3)
+        
+        # Session recording/replay (NDJSON); replay speed 0 = as fast as possible, 1 = real time
+        self.monk_record_path = os.getenv("MONK_RECORD", "")
+        self.monk_replay_path = os.getenv("MONK_REPLAY", "")
+        self.monk_replay_speed = self._get_float_env("MONK_REPLAY_SPEED", 0.0)
+        
+        # Trace footer repaint rate (frames per second)
+        self.trace_fps = self._get_int_env("TRACE_FPS", 30)
+        
+        # Chrome trace-event output file (empty = tracing off)
+        self.trace_path = os.getenv("VAULT_TRACE", "")
+        
+        # Client diagnostics (breakers, scheduler, process usage, caches) written on exit (empty = off)
+        self.diagnostics_path = os.getenv("VAULT_DIAGNOSTICS", "")
+        
+        # Filter result cache (memory bound in MB, entry lifetime in seconds)
+        self.filter_cache_mb = self._get_int_env("FILTER_CACHE_MB", 32)
+        self.filter_cache_ttl = self._get_float_env("FILTER_CACHE_TTL", 60.0)
+        
+        # Live match counts stop counting past this many rows
+        self.match_count_cap = self._get_int_env("MATCH_COUNT_CAP", 1000)
+        
+        # Distinct values tracked per field for autocomplete
+        self.value_index_size = self._get_int_env("VALUE_INDEX_SIZE", 64)
+        
+        # Predictive prefetch (cursor dwell in seconds, cache budget in KB, result lifetime in seconds)
+        self.prefetch_dwell = self._get_float_env("PREFETCH_DWELL", 0.3)
+        self.prefetch_budget_kb = self._get_int_env("PREFETCH_BUDGET_KB", 1024)
+        self.prefetch_ttl = self._get_float_env("PREFETCH_TTL", 30.0)
+        
+        # Session keeper (renew this many seconds before token expiry, checking every interval)
+        self.session_refresh_lead = self._get_float_env("SESSION_REFRESH_LEAD", 300.0)
+        self.session_check_interval = self._get_float_env("SESSION_CHECK_INTERVAL", 30.0)
+        
+        # Registry fan-out (concurrent calls across servers/schemas, per-target timeout in seconds)
+        self.fanout_parallelism = self._get_int_env("FANOUT_PARALLELISM", 8)
+        self.fanout_timeout = self._get_float_env("FANOUT_TIMEOUT", 5.0)
+        
+        # Schema lab record counts / last-modified times are re-probed after this many seconds
+        self.schema_stats_ttl = self._get_float_env("SCHEMA_STATS_TTL", 60.0)
+        
+        # Rows per page for server-sorted list views
+        self.page_size = self._get_int_env("LIST_PAGE_SIZE", 50)
+        
+        # Module screens kept alive between visits (LRU)
+        self.screen_cache_size = self._get_int_env("SCREEN_CACHE_SIZE", 3)
+        
+        # Request bodies above these sizes go over stdin / a spooled temp file instead of argv
+        self.payload_stdin_threshold = self._get_int_env("MONK_STDIN_THRESHOLD", 16 * 1024)
+        self.payload_spool_threshold = self._get_int_env("MONK_SPOOL_THRESHOLD", 4 * 1024 * 1024)
     
     def _get_bool_env(self, key: str, default: bool = False) -> bool:
         """Get boolean environment variable"""
@@ -33,6 +98,20 @@ class VaultConfig:
             return False
         return default
     
+    def _get_float_env(self, key: str, default: float = 0.0) -> float:
+        """Get float environment variable"""
+        try:
+            return float(os.getenv(key, ""))
+        except ValueError:
+            return default
+    
+    def _get_int_env(self, key: str, default: int = 0) -> int:
+        """Get integer environment variable"""
+        try:
+            return int(os.getenv(key, ""))
+        except ValueError:
+            return default
+    
     @property
     def is_overseer_mode(self) -> bool:
         """Check if running in overseer mode (bypass authentication)"""
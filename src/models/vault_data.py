@@ -232,6 +232,39 @@ class VaultDataGenerator:
         schemas.sort(key=lambda x: x["record_count"], reverse=True)
         return schemas
 
+    def generate_personnel_records(self, count: int = 1000) -> List[Dict[str, Any]]:
+        """Generate mock personnel_records rows shaped like monk data select output"""
+        departments = ["engineering", "sales", "marketing", "operations", "finance"]
+        statuses = ["active", "active", "active", "suspended", "terminated", "medical_leave"]
+        clearances = ["standard", "standard", "elevated", "restricted", "classified"]
+        creators = ["admin", "hr_admin", "manager", "system"]
+        records = []
+        
+        for i in range(count):
+            first = random.choice(self.VAULT_PERSONNEL).split("_")[0].title()
+            last = f"{random.choice(self.VAULT_SECTIONS).title()}{i}"
+            hired = self.start_time - timedelta(days=random.randint(30, 3650))
+            modified = self.start_time - timedelta(minutes=random.randint(0, 60 * 24 * 90))
+            records.append({
+                "id": f"{10000 + i}",
+                "first_name": first,
+                "last_name": last,
+                "email": f"{first.lower()}.{last.lower()}@company.com",
+                "department": random.choice(departments),
+                "status": random.choice(statuses),
+                "hire_date": hired.strftime("%Y-%m-%d"),
+                "phone": f"+1-555-{random.randint(100, 999)}-{random.randint(1000, 9999)}",
+                "security_clearance": random.choice(clearances),
+                "employee_id": f"EMP-{hired.year}-{i:05d}",
+                "created_at": hired.strftime("%Y-%m-%d %H:%M:%S"),
+                "modified_at": modified.strftime("%Y-%m-%d %H:%M:%S"),
+                "created_by": random.choice(creators),
+                "_metadata": {"size": f"{random.randint(8, 14) / 10:.1f}KB", "valid": random.random() > 0.1,
+                              "backed_up": random.random() > 0.2, "last_access": modified.strftime("%Y-%m-%d")}
+            })
+        
+        return records
+
     def generate_dashboard_data(self) -> Dict[str, Any]:
         """Generate complete dashboard data set"""
         return {
@@ -9,11 +9,15 @@ from textual.containers import Container, Horizontal, Vertical
 from textual.screen import Screen
 from textual.widgets import Button, Footer, Header, Input, Label, Static
 from textual.message import Message
+from typing import Optional
 
 from widgets.vault_container import VaultContainer
 from config import config
 from api.monk_client import monk
+from api.scheduler import Priority
 from utils.session_timer import SessionTimer
+from utils.startup_snapshot import startup_snapshots
+from utils.tracing import traced
 
 
 class AuthScreen(Screen):
@@ -83,6 +87,7 @@ class AuthScreen(Screen):
         self.hostname = "Unknown"
         self.status_message = ""
 
+    @traced(cat="screen")
     def compose(self) -> ComposeResult:
         """Build the authentication interface"""
         # Center the auth container on screen
@@ -133,6 +138,7 @@ class AuthScreen(Screen):
                         yield Button("▶ REQUEST ACCESS", variant="primary", id="auth_button")
                         yield Button("◉ SERVER SETUP", variant="default", id="setup_button")
 
+    @traced(cat="screen")
     def on_mount(self) -> None:
         """Focus the tenant input on startup or auto-authenticate in overseer mode"""
         if config.is_overseer_mode:
@@ -165,51 +171,50 @@ class AuthScreen(Screen):
         # First get current server info
         self.update_server_info()
         
-        # Check auth status
-        status_result = monk.auth_status()
-        if status_result.success and isinstance(status_result.data, dict):
-            auth_data = status_result.data
+        # Status, expiry, identity and session time in one parallel round
+        auth = monk.auth_snapshot()
+        if auth.authenticated:
+            if auth.expired:
+                self.update_status("⚠ Previous session expired - Re-authentication required", "warning")
+                self.query_one("#tenant_input", Input).focus()
+                return
             
-            if auth_data.get("authenticated", False):
-                # Check if token is actually expired
-                expired_result = monk.auth_expired()
-                if not expired_result.success:  # auth expired returns error when expired
-                    # Token is expired
-                    self.update_status("⚠ Previous session expired - Re-authentication required", "warning")
-                    self.query_one("#tenant_input", Input).focus()
-                    return
+            if auth.active:
+                tenant = auth.tenant or "unknown"
+                username = auth.username or "unknown"
+                session_info = f" ({SessionTimer.get_session_display(auth.expires)})" if auth.expires else ""
                 
-                # Already authenticated and not expired - get user info
-                info_result = monk.auth_info()
-                if info_result.success and isinstance(info_result.data, dict):
-                    user_info = info_result.data
-                    tenant = user_info.get("tenant", "unknown")
-                    username = user_info.get("name", "unknown")
-                    
-                    # Get session time remaining
-                    expires_result = monk.auth_expires()
-                    session_info = ""
-                    if expires_result.success:
-                        session_info = f" ({SessionTimer.get_session_display(expires_result.data)})"
-                    
-                    # Fill form with existing auth info
-                    self.query_one("#tenant_input", Input).value = tenant
-                    self.query_one("#username_input", Input).value = username
-                    self.query_one("#password_input", Input).value = "authenticated"
-                    
-                    self.update_status(f"✅ Authenticated as {username}@{tenant}{session_info} - Press Enter", "success")
-                    return
+                # Fill form with existing auth info
+                self.query_one("#tenant_input", Input).value = tenant
+                self.query_one("#username_input", Input).value = username
+                self.query_one("#password_input", Input).value = "authenticated"
+                
+                self.update_status(f"✅ Authenticated as {username}@{tenant}{session_info} - Press Enter", "success")
+                return
                     
         # Not authenticated, focus on tenant input for manual auth
         self.update_status("Authentication required", "info")
         self.query_one("#tenant_input", Input).focus()
         
     def update_server_info(self) -> None:
+        """Show the last-known current server at once, then confirm it with monk in the background"""
+        snapshot = startup_snapshots.load("servers")
+        if snapshot and isinstance(snapshot.data, dict) and snapshot.data.get("servers"):
+            self.show_server_info(snapshot.data["servers"], stale=True)
+        self.run_worker(self.fetch_server_info, thread=True, exclusive=True, group="server_info")
+
+    def fetch_server_info(self) -> None:
+        """Worker thread: fetch the live server list and hand off to the UI thread"""
+        with monk.priority(Priority.VISIBLE_REFRESH):
+            servers_result = monk.server_list()
+        self.app.call_from_thread(self.apply_server_info, servers_result)
+
+    def apply_server_info(self, servers_result) -> None:
         """Update server info display with current monk server"""
         try:
             # Get server list and find current server
-            servers_result = monk.server_list()
             if servers_result.success and isinstance(servers_result.data, dict):
+                startup_snapshots.save("servers", servers_result.data)
                 servers = servers_result.data.get("servers", [])
                 
                 # Check if no servers are configured
@@ -217,33 +222,7 @@ class AuthScreen(Screen):
                     self.handle_no_servers()
                     return
                 
-                # Find the current server (marked with is_current: true)
-                current_server_data = None
-                for server in servers:
-                    if server.get("is_current", False):
-                        current_server_data = server
-                        break
-                
-                if current_server_data:
-                    self.server_name = current_server_data.get("name", "unknown")
-                    self.hostname = current_server_data.get("endpoint", "unknown")
-                    status = current_server_data.get("status", "unknown")
-                    
-                    # Update UI labels
-                    server_info_label = self.query_one("#server_info_label", Label)
-                    server_info_label.update(f"Server: {self.server_name} ({self.hostname})")
-                    
-                    server_status_label = self.query_one("#server_status_label", Label)
-                    if status == "up":
-                        server_status_label.update("Status: ●ONLINE")
-                        server_status_label.add_class("status-ok")
-                    elif status == "down":
-                        server_status_label.update("Status: ◐OFFLINE") 
-                        server_status_label.add_class("status-error")
-                    else:
-                        server_status_label.update("Status: ⚠UNKNOWN")
-                        server_status_label.add_class("status-warning")
-                    
+                if self.show_server_info(servers):
                     return
                         
             # Fallback if we can't get server info
@@ -255,6 +234,39 @@ class AuthScreen(Screen):
         except Exception as e:
             # Graceful fallback
             pass
+
+    def show_server_info(self, servers: list, stale: bool = False) -> bool:
+        """Show the current server (marked with is_current: true), returning whether there is one"""
+        current_server_data = None
+        for server in servers:
+            if server.get("is_current", False):
+                current_server_data = server
+                break
+        
+        if not current_server_data:
+            return False
+        
+        self.server_name = current_server_data.get("name", "unknown")
+        self.hostname = current_server_data.get("endpoint", "unknown")
+        status = current_server_data.get("status", "unknown")
+        stale_marker = " (last known)" if stale else ""
+        
+        # Update UI labels
+        server_info_label = self.query_one("#server_info_label", Label)
+        server_info_label.update(f"Server: {self.server_name} ({self.hostname})")
+        
+        server_status_label = self.query_one("#server_status_label", Label)
+        server_status_label.remove_class("status-ok", "status-error", "status-warning")
+        if status == "up":
+            server_status_label.update(f"Status: ●ONLINE{stale_marker}")
+            server_status_label.add_class("status-ok")
+        elif status == "down":
+            server_status_label.update(f"Status: ◐OFFLINE{stale_marker}") 
+            server_status_label.add_class("status-error")
+        else:
+            server_status_label.update(f"Status: ⚠UNKNOWN{stale_marker}")
+            server_status_label.add_class("status-warning")
+        return True
             
     def handle_no_servers(self) -> None:
         """Handle case when no servers are configured"""
@@ -309,13 +321,13 @@ class AuthScreen(Screen):
         
         if auth_result.success:
             self.update_status("✅ Authentication successful", "success")
-            self.authenticate_success(tenant, username)
+            self.authenticate_success(tenant, username, password)
         else:
             error_msg = auth_result.error or "Authentication failed"
             self.update_status(f"❌ Authentication failed: {error_msg}", "error")
             self.query_one("#password_input", Input).focus()
         
-    def authenticate_success(self, vault_id: str, username: str) -> None:
+    def authenticate_success(self, vault_id: str, username: str, password: Optional[str] = None) -> None:
         """Handle successful authentication"""
         user_data = {
             "vault_id": vault_id,
@@ -326,8 +338,8 @@ class AuthScreen(Screen):
         
         self.update_status("✅ Security clearance confirmed", "success")
         
-        # Notify the main app of successful authentication
-        self.app.authenticate_user(user_data)
+        # Notify the main app of successful authentication (the password lets it renew the session)
+        self.app.authenticate_user(user_data, password)
         
     def update_status(self, message: str, status_type: str = "info") -> None:
         """Update the status message display"""
@@ -8,9 +8,15 @@ from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
 from textual.screen import Screen
 from textual.widgets import Button, DataTable, Footer, Header, Label, Static, Input
+from textual.worker import get_current_worker
+from typing import Any, Dict
 
 from widgets.vault_container import VaultContainer
+from api.fanout import fanout
 from api.monk_client import monk
+from api.scheduler import Priority
+from utils.match_counter import estimate_matches
+from utils.tracing import traced
 
 
 class DepartmentRegistryScreen(Screen):
@@ -108,7 +114,9 @@ class DepartmentRegistryScreen(Screen):
         self.selected_item = None
         self.servers_data = []
         self.tenants_data = []
+        self.pinged = 0  # Servers whose ping has landed in the current refresh
 
+    @traced(cat="screen")
     def compose(self) -> ComposeResult:
         """Build the department registry interface"""
         # Header with vault info
@@ -150,6 +158,7 @@ class DepartmentRegistryScreen(Screen):
                 
         yield Footer()
 
+    @traced(cat="screen")
     def on_mount(self) -> None:
         """Load initial data"""
         self.setup_table()
@@ -160,18 +169,50 @@ class DepartmentRegistryScreen(Screen):
         table = self.query_one("#management_table", DataTable)
         table.clear(columns=True)
         
+        # Keyed columns so fan-out results can update single cells as they arrive
         if self.current_view == "servers":
-            table.add_columns("NAME", "URL", "STATUS", "DESCRIPTION")
+            for label, key in (("NAME", "name"), ("URL", "url"), ("STATUS", "status"),
+                               ("PING", "ping"), ("DESCRIPTION", "description")):
+                table.add_column(label, key=key)
             table.border_title = "SERVER REGISTRY"
         else:  # tenants
-            table.add_columns("NAME", "STATUS", "RECORDS", "LAST_ACCESSED")
+            for label, key in (("NAME", "name"), ("STATUS", "status"), ("SCHEMAS", "schemas"),
+                               ("RECORDS", "records")):
+                table.add_column(label, key=key)
             table.border_title = "TENANT DATABASE REGISTRY"
 
+    @traced(cat="screen")
     def load_servers(self) -> None:
-        """Load server list from monk CLI"""
+        """Load the server list, then ping every server concurrently in the background"""
         self.update_status("Loading server registry...")
-        
-        result = monk.server_list()
+        self.run_worker(self.fetch_servers, thread=True, exclusive=True, group="revalidate")
+
+    def revalidate(self) -> None:
+        """Refresh the current view in the background while cached rows stay visible"""
+        if self.current_view == "servers":
+            self.update_status(f"Showing {len(self.servers_data)} cached servers - refreshing...")
+            self.run_worker(self.fetch_servers, thread=True, exclusive=True, group="revalidate")
+        else:
+            self.load_tenants()
+
+    def fetch_servers(self) -> None:
+        """Worker thread: list servers, then stream one ping per server into the table"""
+        worker = get_current_worker()
+        with monk.priority(Priority.VISIBLE_REFRESH):
+            result = monk.server_list()
+            self.app.call_from_thread(self.apply_servers, result)
+            if not result.success or not self.servers_data:
+                return
+            names = [server["name"] for server in self.servers_data]
+            fanout.run(names, lambda name, timeout: monk.server_ping(name, timeout=timeout),
+                       on_result=lambda outcome: self.app.call_from_thread(self.apply_ping, outcome),
+                       cancelled=lambda: worker.is_cancelled)
+
+    @traced(cat="screen")
+    def apply_servers(self, result) -> None:
+        """Apply server list results to the registry table"""
+        if self.current_view != "servers":
+            return  # User switched tabs while the refresh was in flight
         
         if result.success:
             try:
@@ -182,6 +223,7 @@ class DepartmentRegistryScreen(Screen):
                     
                     # Convert to UI format with proper status mapping
                     self.servers_data = []
+                    current_server = "None"
                     for server in raw_servers:
                         # Map monk status to UI status indicators
                         status = server.get("status", "unknown")
@@ -195,24 +237,24 @@ class DepartmentRegistryScreen(Screen):
                         # Mark current server
                         if server.get("is_current", False):
                             ui_status += " *"
+                            current_server = server.get("name", "unknown")
                         
                         self.servers_data.append({
                             "name": server.get("name", "unknown"),
                             "url": server.get("endpoint", "unknown"),
                             "status": ui_status,
+                            "ping": "…",
                             "description": server.get("description", ""),
                             "raw": server  # Keep original data for operations
                         })
                 else:
                     self.servers_data = []
+                    current_server = "None"
                 
                 self.populate_servers_table()
+                self.pinged = 0
                 
-                # Get current server
-                current_result = monk.server_current()
-                current_server = current_result.data if current_result.success else "None"
-                
-                self.update_status(f"Loaded {len(self.servers_data)} servers. Current: {current_server}")
+                self.update_status(f"Loaded {len(self.servers_data)} servers. Current: {current_server} - pinging...")
                 self.update_stats()
                 
             except Exception as e:
@@ -229,6 +271,38 @@ class DepartmentRegistryScreen(Screen):
             self.populate_servers_table()
             self.update_status("Using demo data - monk CLI not available")
 
+    def apply_ping(self, outcome) -> None:
+        """One server's ping landed - update its row in place"""
+        if self.current_view != "servers":
+            return
+        server = next((s for s in self.servers_data if s["name"] == outcome.target), None)
+        if server is None:
+            return
+        result = outcome.result
+        current = " *" if server["status"].endswith(" *") else ""
+        if result is not None and result.success:
+            server["status"] = "●ONLINE" + current
+            server["ping"] = f"{outcome.elapsed * 1000:.0f}ms"
+        else:
+            timed_out = result is not None and result.timed_out
+            server["status"] = ("⚠TIMEOUT" if timed_out else "◐OFFLINE") + current
+            server["ping"] = "—"
+        
+        table = self.query_one("#management_table", DataTable)
+        try:
+            table.update_cell(outcome.target, "status", server["status"])
+            table.update_cell(outcome.target, "ping", server["ping"])
+        except Exception:
+            pass  # Row replaced by a newer refresh
+        
+        self.pinged += 1
+        self.update_stats()
+        if self.pinged >= len(self.servers_data):
+            self.update_status(f"Pinged {self.pinged} servers")
+        else:
+            self.update_status(f"Pinging servers... {self.pinged}/{len(self.servers_data)}")
+
+    @traced(cat="table")
     def populate_servers_table(self) -> None:
         """Populate table with server data"""
         table = self.query_one("#management_table", DataTable)
@@ -239,26 +313,96 @@ class DepartmentRegistryScreen(Screen):
             name = server.get("name", "unknown")
             url = server.get("url", server.get("endpoint", "unknown"))
             status = server.get("status", "◐UNKNOWN")
+            ping = server.get("ping", "")
             description = server.get("description", server.get("desc", ""))
             
-            table.add_row(name, url, status, description)
+            table.add_row(name, url, status, ping, description, key=name)
 
+    @traced(cat="screen")
     def load_tenants(self) -> None:
-        """Load tenant list from monk CLI"""
+        """Load the tenant list, then count schemas and records of the current tenant in the background"""
         self.update_status("Loading tenant databases...")
+        self.run_worker(self.fetch_tenants, thread=True, exclusive=True, group="revalidate")
+
+    def fetch_tenants(self) -> None:
+        """Worker thread: list tenants, then stream per-schema record counts for the logged-in tenant"""
+        worker = get_current_worker()
+        with monk.priority(Priority.VISIBLE_REFRESH):
+            result = monk.tenant_list()
+            self.app.call_from_thread(self.apply_tenants, result)
+            current = next((t["name"] for t in self.tenants_data if t.get("current")), None)
+            if not current:
+                return
+            
+            # Schemas and records are only readable for the tenant we are logged into
+            schemas = monk.data_select_cached("schema", {}, fields=["name"])
+            if not schemas.success or not isinstance(schemas.data, list):
+                return
+            names = [row.get("name") for row in schemas.data if row.get("name")]
+            counts = {"total": 0, "done": 0, "capped": False}
+            self.app.call_from_thread(self.apply_tenant_counts, current, len(names), counts)
+            
+            def counted(outcome) -> None:
+                estimate = outcome.result
+                counts["done"] += 1
+                if estimate is not None and not estimate.error:
+                    counts["total"] += estimate.count
+                    counts["capped"] = counts["capped"] or not estimate.exact
+                self.app.call_from_thread(self.apply_tenant_counts, current, len(names), dict(counts))
+            
+            fanout.run(names, lambda schema, timeout: estimate_matches(monk, schema, None, timeout=timeout),
+                       on_result=counted, cancelled=lambda: worker.is_cancelled)
+
+    def apply_tenants(self, result) -> None:
+        """Apply the live tenant list to the registry table"""
+        if self.current_view != "tenants":
+            return
         
-        # For now, use demo data since monk tenant list --json doesn't exist yet
-        # TODO: Replace with real monk tenant list --json when implemented
-        self.tenants_data = [
-            {"name": "test-1756112139", "status": "●ACTIVE", "records": "2,847", "last_accessed": "2025-08-28"},
-            {"name": "production", "status": "●ACTIVE", "records": "156,332", "last_accessed": "2025-08-28"},
-            {"name": "development", "status": "⚠MAINTENANCE", "records": "45", "last_accessed": "2025-08-27"},
-            {"name": "staging", "status": "●ACTIVE", "records": "12,456", "last_accessed": "2025-08-27"},
-        ]
+        if not result.success or not isinstance(result.data, dict):
+            self.tenants_data = []
+            self.populate_tenants_table()
+            self.update_status(f"Failed to load tenants: {result.error or 'no response'}")
+            self.update_stats()
+            return
+        
+        self.tenants_data = []
+        for tenant in result.data.get("tenants", []):
+            is_current = tenant.get("is_current", False) or tenant.get("name") == self.app.current_vault
+            status = "●ACTIVE" if tenant.get("authenticated", False) else "○NO_AUTH"
+            self.tenants_data.append({
+                "name": tenant.get("name", "unknown"),
+                "status": status + (" *" if is_current else ""),
+                "schemas": "…" if is_current else "—",
+                "records": "…" if is_current else "—",
+                "current": is_current,
+            })
         self.populate_tenants_table()
-        self.update_status(f"Loaded {len(self.tenants_data)} tenant databases (demo data)")
+        self.update_status(f"Loaded {len(self.tenants_data)} tenant databases")
         self.update_stats()
 
+    def apply_tenant_counts(self, name: str, schema_count: int, counts: Dict[str, Any]) -> None:
+        """Partial schema/record totals for a tenant - updated as each schema's count lands"""
+        if self.current_view != "tenants":
+            return
+        tenant = next((t for t in self.tenants_data if t["name"] == name), None)
+        if tenant is None:
+            return
+        tenant["schemas"] = str(schema_count)
+        more = "+" if counts["capped"] or counts["done"] < schema_count else ""
+        tenant["records"] = f"{counts['total']:,}{more}"
+        
+        table = self.query_one("#management_table", DataTable)
+        try:
+            table.update_cell(name, "schemas", tenant["schemas"])
+            table.update_cell(name, "records", tenant["records"])
+        except Exception:
+            pass
+        if counts["done"] < schema_count:
+            self.update_status(f"Counting records in {name}... {counts['done']}/{schema_count} schemas")
+        else:
+            self.update_status(f"Loaded {len(self.tenants_data)} tenant databases - {name}: {tenant['records']} records")
+
+    @traced(cat="table")
     def populate_tenants_table(self) -> None:
         """Populate table with tenant data"""
         table = self.query_one("#management_table", DataTable)
@@ -267,10 +411,10 @@ class DepartmentRegistryScreen(Screen):
         for tenant in self.tenants_data:
             name = tenant.get("name", "unknown")
             status = tenant.get("status", "◐UNKNOWN")
+            schemas = tenant.get("schemas", "—")
             records = tenant.get("records", tenant.get("record_count", "0"))
-            last_accessed = tenant.get("last_accessed", tenant.get("last_access", "Unknown"))
             
-            table.add_row(name, status, records, last_accessed)
+            table.add_row(name, status, schemas, records, key=name)
 
     def update_stats(self) -> None:
         """Update statistics bar"""
@@ -8,8 +8,15 @@ from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
 from textual.screen import Screen
 from textual.widgets import Button, Input, Label, Select, Static, TextArea
+from textual.worker import get_current_worker
+import json
 
 from widgets.vault_container import VaultContainer
+from utils.tracing import traced
+from utils.match_counter import estimate_matches
+from utils.value_index import IndexSuggester, value_indexes
+from api.monk_client import monk
+from api.scheduler import Priority
 
 
 class FilterBuilderScreen(Screen):
@@ -104,7 +111,12 @@ class FilterBuilderScreen(Screen):
         background: #1a1a1a;
         margin: 1 0;
         padding: 1;
-        height: 6;
+        height: 7;
+    }
+    
+    .match-count {
+        color: #ffb000;
+        height: 1;
     }
     
     .generated-query {
@@ -128,11 +140,18 @@ class FilterBuilderScreen(Screen):
         Binding("c", "clear_all", "Clear All", show=True),
     ]
 
+    # Quiet period after the last edit before the filter is evaluated
+    EVALUATION_DELAY = 0.35
+
     def __init__(self, schema: str):
         super().__init__()
         self.schema = schema
         self.conditions = []
+        self.evaluation_timer = None
+        self.evaluated_query = None  # Canonical JSON of the last query counted
+        self.value_index = value_indexes.get(schema, monk.current_server, self.app.current_vault)
         
+    @traced(cat="screen")
     def on_mount(self) -> None:
         """Focus the AI input on startup"""
         self.call_later(self.focus_ai_input)
@@ -145,6 +164,7 @@ class FilterBuilderScreen(Screen):
         except:
             pass
 
+    @traced(cat="screen")
     def compose(self) -> ComposeResult:
         """Build the filter builder interface"""
         with Container(classes="centering-container"):
@@ -202,7 +222,8 @@ class FilterBuilderScreen(Screen):
                                 yield Input(
                                     placeholder="Enter value...",
                                     id="value1_input",
-                                    classes="field-input"
+                                    classes="field-input",
+                                    suggester=IndexSuggester(self.value_index, lambda: self.selected_field("#field1_select"))
                                 )
                     
                     # Logic connector
@@ -241,12 +262,14 @@ class FilterBuilderScreen(Screen):
                                 yield Input(
                                     placeholder="Enter value...",
                                     id="value2_input",
-                                    classes="field-input"
+                                    classes="field-input",
+                                    suggester=IndexSuggester(self.value_index, lambda: self.selected_field("#field2_select"))
                                 )
                     
                     # Generated query preview
                     with Container(classes="preview-section"):
                         yield Label("Generated Query Preview:", classes="field-label")
+                        yield Static("Matches: -", id="match_count", classes="match-count")
                         yield Static(
                             '{"$and":[{"department":"engineering"},{"status":"active"}]}',
                             id="query_preview",
@@ -263,7 +286,7 @@ class FilterBuilderScreen(Screen):
     def get_schema_fields(self):
         """Get available fields for the current schema"""
         # Return realistic database fields
-        return [
+        fields = [
             ("ID", "id"),
             ("First Name", "first_name"), 
             ("Last Name", "last_name"),
@@ -275,18 +298,28 @@ class FilterBuilderScreen(Screen):
             ("Employee ID", "employee_id"),
             ("Phone", "phone")
         ]
+        # Plus any other field values have been seen for
+        known = {value for _, value in fields}
+        fields.extend((name.replace("_", " ").title(), name)
+                      for name in self.value_index.field_names() if name not in known)
+        return fields
+
+    def selected_field(self, select_id: str):
+        """Field chosen in a field select, or None while blank"""
+        value = self.query_one(select_id, Select).value
+        return value if isinstance(value, str) else None
 
     def build_query(self) -> dict:
         """Build query from current form values"""
         try:
             # Get condition 1
             field1 = self.query_one("#field1_select", Select).value
-            op1 = self.query_one("#op1_select", Select).value
+            op1 = self.query_one("#op1_select", Select).value or "$eq"
             value1 = self.query_one("#value1_input", Input).value.strip()
             
             # Get condition 2  
             field2 = self.query_one("#field2_select", Select).value
-            op2 = self.query_one("#op2_select", Select).value
+            op2 = self.query_one("#op2_select", Select).value or "$eq"
             value2 = self.query_one("#value2_input", Input).value.strip()
             
             # Build query structure
@@ -320,7 +353,6 @@ class FilterBuilderScreen(Screen):
     def update_query_preview(self) -> None:
         """Update the generated query preview"""
         query = self.build_query()
-        import json
         
         if query:
             query_text = json.dumps(query, indent=2)
@@ -337,9 +369,8 @@ class FilterBuilderScreen(Screen):
     def action_execute_filter(self) -> None:
         """Execute the built filter"""
         query = self.build_query()
-        # TODO: Pass filter back to population management screen
-        self.app.bell()
-        self.app.pop_screen()
+        # Hand the filter back to the screen that opened us
+        self.dismiss(query or None)
         
     def action_save_query(self) -> None:
         """Save query as preset"""
@@ -360,7 +391,6 @@ class FilterBuilderScreen(Screen):
         converted_query = self.convert_natural_language(natural_query)
         
         # Update the query preview
-        import json
         query_text = json.dumps(converted_query, indent=2)
         preview = self.query_one("#query_preview", Static)
         preview.update(query_text)
@@ -406,12 +436,52 @@ class FilterBuilderScreen(Screen):
         self.update_query_preview()
 
     def on_select_changed(self, event: Select.Changed) -> None:
-        """Update preview when selections change"""
-        self.update_query_preview()
+        """Re-evaluate once selections settle"""
+        if event.select.id in ("field1_select", "field2_select"):
+            self.show_common_values(event.select.id.replace("field", "#value").replace("_select", "_input"),
+                                    event.value if isinstance(event.value, str) else None)
+        self.schedule_evaluation()
+
+    def show_common_values(self, input_id: str, field) -> None:
+        """Hint a field's most common values in its value input"""
+        common = self.value_index.top(field, 3) if field else []
+        placeholder = f"e.g. {', '.join(common)}" if common else "Enter value..."
+        self.query_one(input_id, Input).placeholder = placeholder
         
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Update preview when inputs change"""
+        """Re-evaluate once typing pauses"""
+        self.schedule_evaluation()
+
+    def schedule_evaluation(self) -> None:
+        """Debounce edits - only the last change within EVALUATION_DELAY is evaluated"""
+        if self.evaluation_timer:
+            self.evaluation_timer.stop()
+        self.evaluation_timer = self.set_timer(self.EVALUATION_DELAY, self.evaluate_filter)
+
+    def evaluate_filter(self) -> None:
+        """Refresh the preview and start a match count for the settled query"""
+        self.evaluation_timer = None
         self.update_query_preview()
+        query = self.build_query()
+        key = json.dumps(query, sort_keys=True)
+        if key == self.evaluated_query:
+            return
+        self.evaluated_query = key
+        self.query_one("#match_count", Static).update("Matches: counting...")
+        # exclusive=True cancels the count still running for the previous edit
+        self.run_worker(lambda: self.count_matches(query), thread=True, exclusive=True, group="match_count")
+
+    def count_matches(self, query: dict) -> None:
+        """Worker thread: count matches and post the result unless superseded"""
+        with monk.priority(Priority.VISIBLE_REFRESH):
+            estimate = estimate_matches(monk, self.schema, query)
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self.show_match_count, query, estimate)
+
+    def show_match_count(self, query: dict, estimate) -> None:
+        """Display a match count if it still belongs to the current query"""
+        if json.dumps(query, sort_keys=True) == self.evaluated_query:
+            self.query_one("#match_count", Static).update(estimate.describe())
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press events"""
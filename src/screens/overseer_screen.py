@@ -17,6 +17,7 @@ from models.vault_data import vault_data
 from api.monk_client import monk
 from utils.session_timer import SessionTimer
 import random
+from utils.tracing import traced
 
 
 class OverseerScreen(Screen):
@@ -99,6 +100,7 @@ class OverseerScreen(Screen):
         self.refresh_timer = None
         self.session_timer = None
 
+    @traced(cat="screen")
     def compose(self) -> ComposeResult:
         """Build the overseer console interface"""
         # Header with user info, population stats, and session
@@ -124,6 +126,7 @@ class OverseerScreen(Screen):
             
         yield Footer()
 
+    @traced(cat="screen")
     def on_mount(self) -> None:
         """Start refresh timer and initial data load"""
         self.start_refresh_timer()
@@ -187,19 +190,18 @@ class OverseerScreen(Screen):
     def update_auth_context(self) -> None:
         """Update user and session info from real monk auth data"""
         try:
-            # Get current auth info
-            info_result = monk.auth_info()
-            if info_result.success and isinstance(info_result.data, dict):
-                auth_info = info_result.data
+            # Get current auth info (usually already warmed by the session keeper)
+            auth = monk.auth_snapshot()
+            if auth.info:
+                auth_info = auth.info
                 
                 tenant = auth_info.get("tenant", self.app.current_vault)
                 username = auth_info.get("name", self.app.current_user)
                 
                 # Get live session countdown
-                expires_result = monk.auth_expires()
                 session_display = "Session: Loading..."
-                if expires_result.success:
-                    session_display = SessionTimer.get_session_display(expires_result.data)
+                if auth.expires:
+                    session_display = SessionTimer.get_session_display(auth.expires)
                 
                 # Get population stats for header
                 pop_data = vault_data.generate_population_stats()
@@ -257,17 +259,17 @@ class OverseerScreen(Screen):
     def action_module_1(self) -> None:
         """Navigate to Department Registry"""
         from screens.department_registry_screen import DepartmentRegistryScreen
-        self.app.push_screen(DepartmentRegistryScreen())
+        self.app.screen_cache.open("department_registry", DepartmentRegistryScreen)
         
     def action_module_2(self) -> None:
         """Navigate to Schema Laboratory"""
         from screens.schema_lab_screen import SchemaLabScreen
-        self.app.push_screen(SchemaLabScreen())
+        self.app.screen_cache.open("schema_lab", SchemaLabScreen)
         
     def action_module_3(self) -> None:
         """Navigate to Population Management"""
         from screens.population_management_screen import PopulationManagementScreen
-        self.app.push_screen(PopulationManagementScreen())
+        self.app.screen_cache.open("population_management", PopulationManagementScreen)
         
     def action_module_4(self) -> None:
         """Navigate to Security Protocols"""
@@ -8,9 +8,21 @@ from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
 from textual.screen import Screen
 from textual.widgets import Button, DataTable, Footer, Header, Input, Label, Select, Static, TextArea
+from textual.worker import get_current_worker
+from datetime import datetime
 
 from widgets.vault_container import VaultContainer
 from models.vault_data import vault_data
+from api.monk_client import monk
+from api.columnar_cache import dataset_cache
+from api.filter_cache import UnsupportedFilter, canonical, match_where
+from api.prefetch import prefetcher
+from api.scheduler import Priority
+from utils.incremental_sync import IncrementalSync
+from utils.keyset_pager import KeysetPager
+from utils.record_patch import load_full_record
+from utils.tracing import traced
+from utils.value_index import value_indexes
 
 
 class PopulationManagementScreen(Screen):
@@ -110,7 +122,20 @@ class PopulationManagementScreen(Screen):
         Binding("x", "clear_filter", "Clear", show=True),       # Clear filters
         Binding("b", "bulk_operations", "Bulk Ops", show=True),
         Binding("enter", "update_record", "Edit Record", show=True),
+        Binding("n", "next_page", "Next Page", show=True),
+        Binding("p", "prev_page", "Prev Page", show=True),
+        Binding("o", "cycle_sort", "Sort", show=True),
+        Binding("w", "snapshot_dataset", "Snapshot", show=True),
     ]
+    
+    # Columns the results table renders - list loads fetch nothing else
+    LIST_FIELDS = ["id", "first_name", "last_name", "department", "status", "modified_at"]
+    
+    # Table column index -> server sort field (column 0 is the checkbox)
+    SORT_COLUMNS = {1: "id", 2: "last_name", 3: "department", 4: "status", 5: "modified_at"}
+
+    # Rows per request while downloading a snapshot
+    SNAPSHOT_CHUNK = 1000
 
     def __init__(self):
         super().__init__()
@@ -118,7 +143,19 @@ class PopulationManagementScreen(Screen):
         self.selected_records = []
         self.population_data = []
         self.filter_query = ""
+        self.projected = False  # population_data rows carry only LIST_FIELDS
+        self.pager = self.list_pager(self.current_schema)
+        self.sync = IncrementalSync(monk, self.current_schema)
+        self.sync_status = ""
+        self.snapshot = None          # Mapped offline snapshot while monk is unreachable
+        self.snapshot_matches = []    # Snapshot row indices for the current filter and sort
 
+    @classmethod
+    def list_pager(cls, schema: str = "personnel_records") -> KeysetPager:
+        """Pager for a schema's record list (also used to pre-warm it after login)"""
+        return KeysetPager(monk, schema, fields=cls.LIST_FIELDS)
+
+    @traced(cat="screen")
     def compose(self) -> ComposeResult:
         """Build the population management interface"""
         # Header with vault info
@@ -148,18 +185,110 @@ class PopulationManagementScreen(Screen):
                 yield Button("[d] DELETE", variant="default", id="delete_btn")
                 yield Button("[u] UPDATE", variant="default", id="update_btn")
                 yield Button("[r] REFRESH", variant="default", id="refresh_btn")
-                yield Button("[x] EXPORT", variant="default", id="export_btn")
+                yield Button("[w] EXPORT", variant="default", id="export_btn")
                 
         yield Footer()
 
+    @traced(cat="screen")
     def on_mount(self) -> None:
         """Load initial population data"""
         self.load_population_data()
 
+    @traced(cat="screen")
     def load_population_data(self) -> None:
-        """Load population data (mock data with realistic fields)"""
+        """Load the current page of population records, sorted server-side"""
+        self.apply_population(self.pager.reload())
+
+    def apply_population(self, result) -> None:
+        """Show a freshly loaded page, falling back to the snapshot or mock records"""
+        if result.success and isinstance(result.data, list):
+            self.population_data = self.pager.rows
+            self.projected = True
+            self.sync.seed(self.population_data)
+            self.sync_status = ""
+            self.snapshot = None
+        elif self.open_snapshot():
+            # monk unavailable - page through the last saved snapshot
+            self.show_snapshot_page(0)
+            return
+        else:
+            # monk unavailable and no snapshot - fall back to local mock records
+            self.population_data = sorted(
+                self.filter_mock_records(self.mock_population_data()),
+                key=lambda record: str(record.get(self.pager.sort_field, "")),
+                reverse=self.pager.descending,
+            )
+            self.projected = False
+        
+        self.populate_results_table()
+        self.update_population_stats()
+
+    def open_snapshot(self) -> bool:
+        """Map the saved snapshot of this schema and match it against the current filter"""
+        if self.snapshot is None:
+            self.snapshot = dataset_cache.open(self.current_schema, monk.current_server, self.app.current_vault)
+            if self.snapshot is None:
+                return False
+        try:
+            self.snapshot_matches = self.snapshot.query(self.pager.where, self.pager.order())
+        except UnsupportedFilter:
+            self.snapshot_matches = self.snapshot.query(None, self.pager.order())
+        saved_at = datetime.fromtimestamp(self.snapshot.meta.get("saved_at", 0)).strftime("%Y-%m-%d %H:%M")
+        self.sync_status = f"offline snapshot from {saved_at}"
+        return True
+
+    def show_snapshot_page(self, page_index: int) -> None:
+        """Decode and show one page of snapshot rows (nothing else is read from disk)"""
+        size = self.pager.page_size
+        start = page_index * size
+        self.pager.page_index = page_index
+        self.pager.has_more = start + size < len(self.snapshot_matches)
+        self.population_data = self.snapshot.rows_at(self.snapshot_matches[start:start + size])
+        self.projected = False
+        self.populate_results_table()
+        self.update_population_stats()
+
+    def action_snapshot_dataset(self) -> None:
+        """Download the whole schema's list columns in the background and save a snapshot"""
+        self.sync_status = "snapshot: downloading..."
+        self.update_population_stats()
+        self.run_worker(self.write_snapshot, thread=True, exclusive=True, group="snapshot")
+
+    def write_snapshot(self) -> None:
+        """Worker thread: page through the schema, then write the columnar file"""
+        pager = KeysetPager(monk, self.current_schema, fields=self.LIST_FIELDS, page_size=self.SNAPSHOT_CHUNK)
+        worker = get_current_worker()
+        rows = []
+        with monk.priority(Priority.BACKGROUND):
+            result = pager.first_page()
+            while result is not None and result.success and not worker.is_cancelled:
+                rows.extend(pager.rows)
+                result = pager.next_page()
+        if worker.is_cancelled:
+            return
+        if result is not None and not result.success:
+            status = f"snapshot failed: {result.error}"
+        else:
+            size = dataset_cache.save(self.current_schema, rows, monk.current_server, self.LIST_FIELDS,
+                                      tenant=self.app.current_vault)
+            status = f"snapshot saved ({len(rows):,} records, {size / 1024:,.0f} KB)"
+        self.app.call_from_thread(self.show_sync_status, status)
+
+    def show_sync_status(self, status: str) -> None:
+        self.sync_status = status
+        self.update_population_stats()
+
+    def filter_mock_records(self, records: list) -> list:
+        """Apply the active where-clause to mock records"""
+        try:
+            return [record for record in records if match_where(record, self.pager.where)]
+        except UnsupportedFilter:
+            return records
+
+    def mock_population_data(self) -> list:
+        """Mock data with realistic fields"""
         # Generate mock data that represents real database records
-        population_data = [
+        return [
             {
                 "id": "12345", "first_name": "John", "last_name": "Doe", "email": "john.doe@company.com",
                 "department": "engineering", "status": "active", "hire_date": "2024-03-15", "selected": False,
@@ -189,15 +318,61 @@ class PopulationManagementScreen(Screen):
                 "_metadata": {"size": "0.9KB", "valid": True, "backed_up": False, "last_access": "2025-08-28"}
             },
         ]
-        
-        self.population_data = population_data
-        self.populate_results_table()
+
+    def revalidate(self) -> None:
+        """Refresh records in the background on re-entry while cached rows stay visible"""
+        if not self.filter_query:
+            self.run_worker(self.fetch_population_refresh, thread=True, exclusive=True, group="revalidate")
+
+    def fetch_population_refresh(self) -> None:
+        """Worker thread: sync changed records (or reload the page) and hand off to the UI thread"""
+        with monk.priority(Priority.VISIBLE_REFRESH):
+            result = self.sync_population()
+            if result is not None:
+                self.app.call_from_thread(self.apply_sync, result)
+                return
+            result = self.reload_from_server()
+        self.app.call_from_thread(self.apply_population, result)
+
+    def refresh_population_data(self) -> None:
+        """Merge only records changed since the last load, falling back to a full load"""
+        result = self.sync_population()
+        if result is None:
+            self.apply_population(self.reload_from_server())
+            return
+        self.apply_sync(result)
+
+    def reload_from_server(self):
+        """Re-fetch the current page past the filter cache - a refresh must show server state"""
+        monk.filter_cache.invalidate(self.current_schema)
+        return self.pager.reload()
+
+    def sync_population(self):
+        """Records changed since the last load, or None when a full load is needed"""
+        if not self.projected or self.sync.watermark is None:
+            return None
+        # New records only belong here when the whole result set is on screen
+        whole_set = self.pager.page_index == 0 and not self.pager.has_more
+        result = self.sync.refresh(self.population_data, where=self.pager.where,
+                                   fields=self.pager.projected_fields(), include_new=whole_set)
+        return result if result.success else None
+
+    def apply_sync(self, result) -> None:
+        """Apply an incremental population refresh"""
+        self.population_data = self.pager.rows = result.rows
+        self.sync_status = result.describe()
+        if result.changed or result.added or result.deleted:
+            self.populate_results_table()
         self.update_population_stats()
 
+    @traced(cat="table")
     def populate_results_table(self) -> None:
         """Populate results table with current data"""
         table = self.query_one("#population_table", DataTable)
         table.clear()
+        # Every load, page and sync passes through here - feed value autocomplete
+        value_indexes.observe(self.current_schema, self.population_data, monk.current_server,
+                              self.app.current_vault)
         
         for record in self.population_data:
             checkbox = "☑" if record.get("selected", False) else "☐"
@@ -208,17 +383,19 @@ class PopulationManagementScreen(Screen):
                 record["id"],
                 full_name,
                 record.get("department", "unknown"),
-                record["status"],
-                record.get("modified_at", "unknown")[:10]  # Just date part
+                record.get("status", "unknown"),
+                (record.get("modified_at") or "unknown")[:10]  # Just date part
             )
 
     def update_population_stats(self) -> None:
         """Update population statistics"""
         total_records = len(self.population_data)
         selected_count = len([r for r in self.population_data if r.get("selected", False)])
-        active_filters = "security_level=HIGH" if self.filter_query else "None"
+        active_filters = self.filter_query or "None"
         
-        stats_text = f"Population: {total_records:,} | Active Filters: {active_filters} | Selected: {selected_count} records"
+        stats_text = f"Population: {total_records:,} | {self.pager.describe()} | Active Filters: {active_filters} | Selected: {selected_count} records"
+        if self.sync_status:
+            stats_text += f" | Sync: {self.sync_status}"
         self.query_one("#population_stats", Label).update(stats_text)
         
         selection_text = f"Selected: {selected_count} records"
@@ -231,7 +408,15 @@ class PopulationManagementScreen(Screen):
     def action_find_records(self) -> None:
         """Open advanced filter/search interface"""
         from screens.filter_builder_screen import FilterBuilderScreen
-        self.app.push_screen(FilterBuilderScreen(self.current_schema))
+        self.app.push_screen(FilterBuilderScreen(self.current_schema), self.apply_filter)
+
+    def apply_filter(self, query) -> None:
+        """Show records matching a filter from the builder (refinements come from the cache)"""
+        if not query:
+            return
+        self.filter_query = canonical(query)[:60]
+        self.pager.set_where(query)
+        self.load_population_data()
         
     def action_create_record(self) -> None:
         """Create new population record"""
@@ -243,8 +428,12 @@ class PopulationManagementScreen(Screen):
         table = self.query_one("#population_table", DataTable)
         if table.cursor_row >= 0:
             record = self.population_data[table.cursor_row]
+            projected = self.projected
+            prefetched = prefetcher.take(("record", self.current_schema, record.get("id")))
+            if prefetched and load_full_record(monk, self.current_schema, record, prefetched=prefetched):
+                projected = False
             from screens.record_view_screen import RecordViewScreen
-            self.app.push_screen(RecordViewScreen(self.current_schema, record["id"], record))
+            self.app.push_screen(RecordViewScreen(self.current_schema, record["id"], record, projected))
             
     def action_execute_search(self) -> None:
         """Execute search with current filters"""
@@ -280,9 +469,9 @@ class PopulationManagementScreen(Screen):
         
     def action_clear_filter(self) -> None:
         """Clear all filters and reload"""
-        self.query_one("#filter_input", Input).value = ""
         self.filter_query = ""
-        self.load_population_data()  # Reload full data
+        self.pager.set_where(None)
+        self.load_population_data()  # Back to page 1, unfiltered
         
     def action_new_record(self) -> None:
         """Legacy method - redirect to create"""
@@ -307,11 +496,64 @@ class PopulationManagementScreen(Screen):
         # TODO: Implement bulk operations interface
         
     def action_refresh(self) -> None:
-        """Refresh population data"""
-        self.load_population_data()
+        """Refresh population data (incremental when possible)"""
+        self.refresh_population_data()
         self.app.bell()
+
+    def action_next_page(self) -> None:
+        """Seek to the next page in the current sort order"""
+        if self.snapshot is not None and self.pager.has_more:
+            self.show_snapshot_page(self.pager.page_index + 1)
+            return
+        if not self.projected or not self.pager.has_more:
+            self.app.bell()
+            return
+        self.apply_page(self.pager.next_page())
+
+    def action_prev_page(self) -> None:
+        """Seek back to the previous page"""
+        if self.snapshot is not None and self.pager.page_index > 0:
+            self.show_snapshot_page(self.pager.page_index - 1)
+            return
+        if not self.projected or self.pager.page_index == 0:
+            self.app.bell()
+            return
+        self.apply_page(self.pager.prev_page())
+
+    def action_cycle_sort(self) -> None:
+        """Sort by the next column (server-side), restarting at page 1"""
+        fields = list(self.SORT_COLUMNS.values())
+        current = fields.index(self.pager.sort_field) if self.pager.sort_field in fields else -1
+        self.pager.set_sort(fields[(current + 1) % len(fields)], descending=False)
+        self.load_population_data()
+
+    def on_data_table_header_selected(self, event: DataTable.HeaderSelected) -> None:
+        """Click a column header to sort by it (again to reverse)"""
+        field = self.SORT_COLUMNS.get(event.column_index)
+        if field:
+            self.pager.set_sort(field)
+            self.load_population_data()
+
+    def apply_page(self, result) -> None:
+        """Show the page the pager just fetched"""
+        if result is None or not result.success:
+            self.app.bell()
+            return
+        self.population_data = self.pager.rows
+        self.sync.seed(self.population_data)
+        self.populate_results_table()
+        self.update_population_stats()
         
 
+    def on_data_table_cell_highlighted(self, event: DataTable.CellHighlighted) -> None:
+        """Prefetch the full record while the cursor rests on a projected row"""
+        row = event.coordinate.row
+        if event.data_table.id != "population_table" or not self.projected:
+            return
+        if 0 <= row < len(self.population_data) and self.population_data[row].get("id"):
+            schema, record_id = self.current_schema, self.population_data[row]["id"]
+            prefetcher.hover(self, ("record", schema, record_id), lambda: monk.data_get(schema, record_id))
+
     def on_data_table_row_selected(self, event) -> None:
         """Handle record selection in table"""
         table = self.query_one("#population_table", DataTable)
@@ -336,6 +578,8 @@ class PopulationManagementScreen(Screen):
             self.action_execute_search()
         elif event.button.id == "clear_btn":
             self.action_clear_filter()
+        elif event.button.id == "export_btn":
+            self.action_snapshot_dataset()
         # Quick filter buttons
         elif event.button.id == "filter_active":
             self.apply_quick_filter("status", "●ACTIVE")
@@ -10,7 +10,13 @@ from textual.screen import Screen
 from textual.widgets import Button, Footer, Input, Label, Select, Static
 from datetime import datetime
 
-from widgets.vault_container import VaultContainer
+from widgets.vault_container import ComposedSection, VaultContainer
+from api.monk_client import monk
+from api.scheduler import Priority
+from utils.record_patch import compute_patch, load_full_record, save_patch
+from utils.schema_validators import schema_validators
+from utils.tracing import traced
+from utils.value_index import IndexSuggester, value_indexes
 
 
 class RecordEditScreen(Screen):
@@ -102,16 +108,27 @@ class RecordEditScreen(Screen):
         Binding("t", "test_validation", "Test", show=True),
     ]
 
-    def __init__(self, schema: str, record_id: str, record_data: dict):
+    def __init__(self, schema: str, record_id: str, record_data: dict, projected: bool = False):
         super().__init__()
         self.schema = schema
         self.record_id = record_id
+        self.source_record = record_data  # Caller's copy, refreshed after a successful save
         self.record_data = record_data.copy()
         self.validation_results = []
+        self.field_results = {}  # field_name -> (level, message), updated per change
+        self.validators = None
+        self.edits = {}  # field_name -> value typed before the form was rebuilt
         self.has_changes = False
+        self.projected = projected  # record_data holds only a list view's columns
+        self.value_index = value_indexes.get(schema, monk.current_server, self.app.current_vault)
+        self.saving = False  # Save worker in flight
 
+    @traced(cat="screen")
     def compose(self) -> ComposeResult:
         """Build the record edit interface"""
+        # Last compile (or name-based conventions) until the definition is fetched on mount
+        self.validators = schema_validators.peek(self.schema) or schema_validators.inferred(self.schema)
+        
         with Container(classes="centering-container"):
             with Container(classes="edit-container") as container:
                 container.border_title = f"EDIT RECORD: {self.schema}/{self.record_id}"
@@ -123,39 +140,8 @@ class RecordEditScreen(Screen):
                         yield Label("ID:", classes="field-label")
                         yield Label(f"{self.record_id} (read-only)", classes="readonly-field")
                     
-                    # Field editing section
-                    yield Label("FIELD EDITING:", classes="section-label")
-                    
-                    # Generate form fields based on record data
-                    for field_name, field_value in self.record_data.items():
-                        if field_name not in ["id", "_metadata", "created_at", "modified_at", "created_by"]:
-                            with Horizontal():
-                                yield Label(f"{field_name}:", classes="field-label")
-                                
-                                # Different input types based on field name/value
-                                if field_name.endswith("_date"):
-                                    yield Input(
-                                        value=str(field_value),
-                                        placeholder="YYYY-MM-DD",
-                                        id=f"field_{field_name}",
-                                        classes="field-input"
-                                    )
-                                elif field_name in ["department", "security_clearance", "status"]:
-                                    # Dropdown fields
-                                    options = self.get_field_options(field_name)
-                                    yield Select(
-                                        options,
-                                        value=str(field_value),
-                                        id=f"field_{field_name}",
-                                        classes="field-input"
-                                    )
-                                else:
-                                    # Regular text fields
-                                    yield Input(
-                                        value=str(field_value),
-                                        id=f"field_{field_name}",
-                                        classes="field-input"
-                                    )
+                    # Field editing section - rebuilt when the schema definition lands
+                    yield ComposedSection(self.compose_fields, id="edit_fields")
                     
                     # Validation status section
                     with Container(classes="validation-section"):
@@ -171,13 +157,62 @@ class RecordEditScreen(Screen):
                         yield Button("[t] TEST", variant="default", id="test_btn")
                     
                     # Metadata footer
-                    yield Label(
-                        f"Last Modified: {self.record_data.get('modified_at', 'Unknown')} by {self.record_data.get('created_by', 'system')}",
-                        classes="metadata-footer"
-                    )
+                    yield Label(self.metadata_text(), id="metadata_footer", classes="metadata-footer")
+
+    def metadata_text(self) -> str:
+        return f"Last Modified: {self.record_data.get('modified_at', 'Unknown')} by {self.record_data.get('created_by', 'system')}"
+
+    def compose_fields(self) -> ComposeResult:
+        """Form fields for the current record data and validators"""
+        yield Label("FIELD EDITING:", classes="section-label")
+        
+        # Generate form fields based on record data
+        for field_name, field_value in self.record_data.items():
+            if field_name not in ["id", "_metadata", "created_at", "modified_at", "created_by"]:
+                field_value = self.edits.get(field_name, field_value)
+                with Horizontal():
+                    yield Label(f"{field_name}:", classes="field-label")
+                    
+                    # Different input types based on field name/value
+                    if field_name.endswith("_date"):
+                        yield Input(
+                            value=str(field_value),
+                            placeholder="YYYY-MM-DD",
+                            id=f"field_{field_name}",
+                            classes="field-input"
+                        )
+                    elif self.is_choice_field(field_name):
+                        # Dropdown fields
+                        options = self.get_field_options(field_name)
+                        yield Select(
+                            options,
+                            value=str(field_value),
+                            id=f"field_{field_name}",
+                            classes="field-input"
+                        )
+                    else:
+                        # Regular text fields
+                        yield Input(
+                            value=str(field_value),
+                            id=f"field_{field_name}",
+                            classes="field-input",
+                            suggester=IndexSuggester(self.value_index, lambda name=field_name: name)
+                        )
+
+    def is_choice_field(self, field_name: str) -> bool:
+        """Check if a field should render as a dropdown"""
+        if self.validators and self.validators.field_options(field_name):
+            return True
+        return field_name in ["department", "security_clearance", "status"]
 
     def get_field_options(self, field_name: str):
         """Get dropdown options for specific fields"""
+        # Schema enums take precedence over the built-in defaults
+        if self.validators:
+            options = self.validators.field_options(field_name)
+            if options:
+                return options
+        
         field_options = {
             "department": [
                 ("Engineering", "engineering"),
@@ -199,35 +234,86 @@ class RecordEditScreen(Screen):
                 ("Medical Leave", "medical_leave")
             ]
         }
-        return field_options.get(field_name, [("Unknown", "unknown")])
+        options = field_options.get(field_name, [("Unknown", "unknown")])
+        # Values actually in use that the defaults don't list
+        known = {value for _, value in options}
+        options.extend((value.replace("_", " ").title(), value)
+                       for value in self.value_index.top(field_name) if value not in known)
+        return options
+
+    @traced(cat="screen")
+    def on_mount(self) -> None:
+        """Run one full validation pass, then fetch the definition (and full record) off the UI thread"""
+        self.validate_form()
+        if self.projected:
+            self.show_summary("… Loading full record", "validation-warning")
+        self.run_worker(self.fetch_details, thread=True, exclusive=True, group="record_edit")
+
+    def fetch_details(self) -> None:
+        """Worker thread: compile (or reuse) the schema's validators and load a projected row in full"""
+        with monk.priority(Priority.INTERACTIVE):
+            validators = schema_validators.get(self.schema)
+            full = monk.data_get(self.schema, self.record_id) if self.projected else None
+        self.app.call_from_thread(self.apply_details, validators, full)
+
+    async def apply_details(self, validators, full) -> None:
+        """Swap in the fetched validators and full record, rebuilding the form if either changes it"""
+        record = None
+        if full is not None:
+            # Editing a projected list row - fill in the caller's row too
+            if load_full_record(monk, self.schema, self.source_record, prefetched=full):
+                self.projected = False
+                record = self.source_record.copy()
+                self.value_index.observe([record])
+                self.show_summary("✅ All fields validated", "validation-ok")
+            else:
+                self.show_summary(f"⚠ Full record unavailable - showing list columns only ({full.error or 'not found'})",
+                                  "validation-warning")
+        if record is None and validators.version == self.validators.version:
+            return
+        self.validators = validators
+        await self.rebuild_fields(record)
+
+    async def rebuild_fields(self, record: dict = None) -> None:
+        """Re-render the form fields (for a new record, if given), keeping anything typed so far"""
+        self.edits = {name: value for name, value in self.collect_form_values().items()
+                      if value is not None and str(value) != str(self.record_data.get(name))}
+        if record is not None:
+            self.record_data = record
+            self.query_one("#metadata_footer", Label).update(self.metadata_text())
+        await self.query_one("#edit_fields", ComposedSection).rebuild()
+        self.validate_form()
+
+    def validate_form(self) -> None:
+        """Validate every field currently on the form"""
+        self.field_results = {}
+        for field_name, value in self.collect_form_values().items():
+            self.validate_field(field_name, value)
+
+    def validate_field(self, field_name: str, value) -> tuple:
+        """Validate one field with the compiled schema validators"""
+        result = self.validators.validate_field(field_name, "" if value is None else str(value))
+        self.field_results[field_name] = result
+        return result
 
     def validate_record(self) -> list:
-        """Validate all form fields"""
-        validation_results = []
-        
-        # Get all field values
-        for field_name in self.record_data.keys():
-            if field_name.startswith("_") or field_name in ["id", "created_at", "modified_at", "created_by"]:
-                continue
-                
-            try:
-                widget = self.query_one(f"#field_{field_name}")
-                if hasattr(widget, 'value'):
-                    field_value = widget.value
-                    
-                    # Basic validation examples
-                    if field_name == "email" and "@" not in field_value:
-                        validation_results.append(("error", f"{field_name}: Invalid email format"))
-                    elif field_name.endswith("_date") and len(field_value) != 10:
-                        validation_results.append(("warning", f"{field_name}: Date format should be YYYY-MM-DD"))
-                    elif field_name == "phone" and len(field_value.replace("-", "").replace(" ", "")) < 10:
-                        validation_results.append(("warning", f"{field_name}: Phone number seems incomplete"))
-                    else:
-                        validation_results.append(("ok", f"{field_name}: Valid"))
-            except:
-                pass
-                
-        return validation_results
+        """Validate all form fields (returns the incrementally maintained results)"""
+        return list(self.field_results.values())
+
+    def collect_form_values(self) -> dict:
+        """Read current values from all editable field widgets"""
+        values = {}
+        for widget in self.query("Input, Select"):
+            if widget.id and widget.id.startswith("field_"):
+                values[widget.id[len("field_"):]] = widget.value
+        return values
+
+    def show_summary(self, text: str, summary_class: str) -> None:
+        """Update the validation summary line"""
+        summary_widget = self.query_one("#validation_summary", Label)
+        summary_widget.update(text)
+        summary_widget.remove_class("validation-ok", "validation-warning", "validation-error")
+        summary_widget.add_class(summary_class)
 
     def action_back_to_list(self) -> None:
         """Return to record list"""
@@ -243,12 +329,43 @@ class RecordEditScreen(Screen):
         
         if errors:
             self.app.bell()
-            # Show validation errors
+            self.show_summary(f"❌ {len(errors)} errors - fix before saving", "validation-error")
             return
-            
-        # TODO: Execute monk data update command
-        self.app.bell()
-        # For now, just return to list
+        
+        # Send only the fields that changed, guarded by the record version
+        patch = compute_patch(self.record_data, self.collect_form_values())
+        if not patch:
+            self.app.pop_screen()
+            return
+        if self.saving:
+            return
+        
+        self.saving = True
+        self.show_summary("… Saving", "validation-warning")
+        self.run_worker(lambda: self.save_record(patch), thread=True, exclusive=True, group="record_save")
+
+    def save_record(self, patch: dict) -> None:
+        """Worker thread: version probe and update, off the UI thread"""
+        with monk.priority(Priority.INTERACTIVE):
+            result = save_patch(monk, self.schema, self.record_id, self.record_data, patch)
+        self.app.call_from_thread(self.apply_save, result)
+
+    def apply_save(self, result) -> None:
+        """Report a conflict or failure, or reflect the saved fields and close"""
+        self.saving = False
+        if result.conflict:
+            self.app.bell()
+            self.show_summary(f"⚠ Conflict: {result.conflict} - reload before saving", "validation-warning")
+            return
+        if not result.success:
+            self.app.bell()
+            self.show_summary(f"❌ Save failed: {result.error}", "validation-error")
+            return
+        
+        # Reflect the saved fields in the caller's record so lists stay current
+        self.record_data.update(result.record)
+        self.source_record.update(result.record)
+        self.has_changes = False
         self.app.pop_screen()
         
     def action_cancel_edit(self) -> None:
@@ -278,13 +395,22 @@ class RecordEditScreen(Screen):
             summary_text = "✅ All fields validated"
             summary_class = "validation-ok"
             
-        summary_widget = self.query_one("#validation_summary", Label)
-        summary_widget.update(summary_text)
-        summary_widget.remove_class("validation-ok", "validation-warning", "validation-error")
-        summary_widget.add_class(summary_class)
+        self.show_summary(summary_text, summary_class)
         
         self.app.bell()
 
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Re-validate only the edited field"""
+        if event.input.id and event.input.id.startswith("field_"):
+            self.validate_field(event.input.id[len("field_"):], event.value)
+            self.has_changes = True
+
+    def on_select_changed(self, event: Select.Changed) -> None:
+        """Re-validate only the changed dropdown"""
+        if event.select.id and event.select.id.startswith("field_"):
+            self.validate_field(event.select.id[len("field_"):], event.value)
+            self.has_changes = True
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press events"""
         if event.button.id == "save_btn":
@@ -10,7 +10,11 @@ from textual.screen import Screen
 from textual.widgets import Button, Footer, Label, Static
 from datetime import datetime
 
-from widgets.vault_container import VaultContainer
+from widgets.vault_container import ComposedSection, VaultContainer
+from api.monk_client import monk
+from api.scheduler import Priority
+from utils.record_patch import load_full_record
+from utils.tracing import traced
 
 
 class RecordViewScreen(Screen):
@@ -82,12 +86,14 @@ class RecordViewScreen(Screen):
         Binding("d", "delete_record", "Delete", show=True),
     ]
 
-    def __init__(self, schema: str, record_id: str, record_data: dict):
+    def __init__(self, schema: str, record_id: str, record_data: dict, projected: bool = False):
         super().__init__()
         self.schema = schema
         self.record_id = record_id
         self.record_data = record_data
+        self.projected = projected  # record_data holds only the list view's columns
 
+    @traced(cat="screen")
     def compose(self) -> ComposeResult:
         """Build the record view interface"""
         with Container(classes="centering-container"):
@@ -95,63 +101,8 @@ class RecordViewScreen(Screen):
                 container.border_title = f"RECORD VIEW: {self.schema}/{self.record_id}"
                 
                 with Vertical():
-                    # Record information section
-                    yield Label("RECORD INFORMATION:", classes="section-label")
-                    with Horizontal(classes="field-row"):
-                        yield Label("ID:", classes="field-name")
-                        yield Label(str(self.record_id), classes="field-value")
-                        yield Label("Schema:", classes="field-name")
-                        yield Label(self.schema, classes="field-value")
-                    
-                    with Horizontal(classes="field-row"):
-                        yield Label("Created:", classes="field-name")
-                        yield Label(self.record_data.get("created_at", "Unknown"), classes="field-value")
-                        yield Label("Modified:", classes="field-name")
-                        yield Label(self.record_data.get("modified_at", "Unknown"), classes="field-value")
-                    
-                    with Horizontal(classes="field-row"):
-                        yield Label("Status:", classes="field-name")
-                        yield Label(self.record_data.get("status", "unknown"), classes="field-value")
-                        yield Label("Created By:", classes="field-name")
-                        yield Label(self.record_data.get("created_by", "system"), classes="field-value")
-                    
-                    # Field data section
-                    yield Label("FIELD DATA:", classes="section-label")
-                    
-                    # Dynamic field display based on record data
-                    for field_name, field_value in self.record_data.items():
-                        if field_name not in ["id", "created_at", "modified_at", "status", "created_by", "_metadata"]:
-                            with Horizontal(classes="field-row"):
-                                yield Label(f"{field_name}:", classes="field-name")
-                                yield Label(str(field_value), classes="field-value")
-                    
-                    # System metadata section
-                    with Container(classes="metadata-section"):
-                        yield Label("SYSTEM METADATA:", classes="section-label")
-                        metadata = self.record_data.get("_metadata", {})
-                        
-                        with Horizontal(classes="field-row"):
-                            yield Label("Record Size:", classes="field-name")
-                            yield Label(f"{metadata.get('size', 'Unknown')}", classes="field-value")
-                            yield Label("Validation:", classes="field-name")
-                            yield Label("✅ PASSED" if metadata.get("valid", True) else "❌ FAILED", classes="field-value")
-                        
-                        with Horizontal(classes="field-row"):
-                            yield Label("Last Access:", classes="field-name")
-                            yield Label(metadata.get("last_access", "Unknown"), classes="field-value")
-                            yield Label("Backup Status:", classes="field-name")
-                            yield Label("✅ BACKED_UP" if metadata.get("backed_up", True) else "⚠ PENDING", classes="field-value")
-                    
-                    # Recent activity section
-                    with Container(classes="activity-section"):
-                        yield Label("RECENT ACTIVITY:", classes="section-label")
-                        activity_log = metadata.get("recent_activity", [])
-                        
-                        if activity_log:
-                            for entry in activity_log[:5]:  # Show last 5 activities
-                                yield Label(f"{entry.get('timestamp', 'Unknown')} | {entry.get('action', 'Unknown')}", classes="field-row")
-                        else:
-                            yield Label("No recent activity recorded", classes="field-row")
+                    # Record sections - rebuilt when a projected row's full record lands
+                    yield ComposedSection(self.compose_record, id="record_body")
                     
                     # Action buttons with killbox notation
                     with Horizontal(classes="action-buttons"):
@@ -159,6 +110,86 @@ class RecordViewScreen(Screen):
                         yield Button("[d] DELETE", variant="default", id="delete_btn")
                         yield Button("[ESC] BACK", variant="default", id="back_btn")
 
+    def compose_record(self) -> ComposeResult:
+        """Record information, fields, metadata and activity for the current record data"""
+        # Record information section
+        yield Label("RECORD INFORMATION:", classes="section-label")
+        with Horizontal(classes="field-row"):
+            yield Label("ID:", classes="field-name")
+            yield Label(str(self.record_id), classes="field-value")
+            yield Label("Schema:", classes="field-name")
+            yield Label(self.schema, classes="field-value")
+        
+        with Horizontal(classes="field-row"):
+            yield Label("Created:", classes="field-name")
+            yield Label(self.record_data.get("created_at", "Unknown"), classes="field-value")
+            yield Label("Modified:", classes="field-name")
+            yield Label(self.record_data.get("modified_at", "Unknown"), classes="field-value")
+        
+        with Horizontal(classes="field-row"):
+            yield Label("Status:", classes="field-name")
+            yield Label(self.record_data.get("status", "unknown"), classes="field-value")
+            yield Label("Created By:", classes="field-name")
+            yield Label(self.record_data.get("created_by", "system"), classes="field-value")
+        
+        # Field data section
+        yield Label("FIELD DATA:", classes="section-label")
+        
+        # Dynamic field display based on record data
+        for field_name, field_value in self.record_data.items():
+            if field_name not in ["id", "created_at", "modified_at", "status", "created_by", "_metadata"]:
+                with Horizontal(classes="field-row"):
+                    yield Label(f"{field_name}:", classes="field-name")
+                    yield Label(str(field_value), classes="field-value")
+        
+        # System metadata section
+        with Container(classes="metadata-section"):
+            yield Label("SYSTEM METADATA:", classes="section-label")
+            metadata = self.record_data.get("_metadata", {})
+            
+            with Horizontal(classes="field-row"):
+                yield Label("Record Size:", classes="field-name")
+                yield Label(f"{metadata.get('size', 'Unknown')}", classes="field-value")
+                yield Label("Validation:", classes="field-name")
+                yield Label("✅ PASSED" if metadata.get("valid", True) else "❌ FAILED", classes="field-value")
+            
+            with Horizontal(classes="field-row"):
+                yield Label("Last Access:", classes="field-name")
+                yield Label(metadata.get("last_access", "Unknown"), classes="field-value")
+                yield Label("Backup Status:", classes="field-name")
+                yield Label("✅ BACKED_UP" if metadata.get("backed_up", True) else "⚠ PENDING", classes="field-value")
+        
+        # Recent activity section
+        with Container(classes="activity-section"):
+            yield Label("RECENT ACTIVITY:", classes="section-label")
+            activity_log = metadata.get("recent_activity", [])
+            
+            if activity_log:
+                for entry in activity_log[:5]:  # Show last 5 activities
+                    yield Label(f"{entry.get('timestamp', 'Unknown')} | {entry.get('action', 'Unknown')}", classes="field-row")
+            else:
+                yield Label("No recent activity recorded", classes="field-row")
+
+    def on_mount(self) -> None:
+        """List rows are projected - fetch the full record now it is actually needed"""
+        if self.projected:
+            self.run_worker(self.fetch_full_record, thread=True, exclusive=True, group="record_view")
+
+    def fetch_full_record(self) -> None:
+        """Worker thread: load the full record and hand it to the UI thread"""
+        with monk.priority(Priority.INTERACTIVE):
+            result = monk.data_get(self.schema, self.record_id)
+        self.app.call_from_thread(self.apply_full_record, result)
+
+    async def apply_full_record(self, result) -> None:
+        """Fill in the projected row and re-render the record sections"""
+        if not load_full_record(monk, self.schema, self.record_data, prefetched=result):
+            self.app.notify(f"Full record unavailable - showing list columns only ({result.error or 'not found'})",
+                        title="Record", severity="warning")
+            return
+        self.projected = False
+        await self.query_one("#record_body", ComposedSection).rebuild()
+
     def action_back_to_list(self) -> None:
         """Return to record list"""
         self.app.pop_screen()
@@ -166,7 +197,7 @@ class RecordViewScreen(Screen):
     def action_edit_record(self) -> None:
         """Open record for editing"""
         from screens.record_edit_screen import RecordEditScreen
-        self.app.push_screen(RecordEditScreen(self.schema, self.record_id, self.record_data))
+        self.app.push_screen(RecordEditScreen(self.schema, self.record_id, self.record_data, self.projected))
         
     def action_delete_record(self) -> None:
         """Delete this record"""
@@ -7,10 +7,20 @@ from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Button, DataTable, Label, Static
+from textual.worker import get_current_worker
+from collections import Counter
 from typing import Dict, Any, List
 
 from screens.base_screen import BaseVaultScreen
 from api.monk_client import monk
+from api.prefetch import prefetcher
+from api.scheduler import Priority
+from api.schema_stats import SchemaStats, schema_stats
+from utils.incremental_sync import IncrementalSync
+from utils.keyset_pager import KeysetPager
+from utils.record_patch import load_full_record
+from utils.startup_snapshot import startup_snapshots
+from utils.tracing import traced
 
 
 class SchemaLabScreen(BaseVaultScreen):
@@ -58,13 +68,33 @@ class SchemaLabScreen(BaseVaultScreen):
         Binding("7", "select_schema_7", "\u200b", show=False),
         Binding("8", "select_schema_8", "\u200b", show=False),
         Binding("9", "select_schema_9", "\u200b", show=False),
+        Binding("n", "next_page", "Next Page", show=True),
+        Binding("p", "prev_page", "Prev Page", show=True),
+        Binding("o", "cycle_sort", "Sort", show=True),
     ]
 
+    # Columns the schema table renders - list loads fetch nothing else
+    LIST_FIELDS = ["name", "status", "field_count", "table_name", "updated_at"]
+    
+    # Server sort keys cycled with [o]
+    SORT_FIELDS = ["name", "status", "updated_at"]
+
     def __init__(self):
         super().__init__()
         self.schemas_data = []
         self.selected_schema = None
+        # One page per killbox set [1-9], seeked server-side
+        self.pager = self.list_pager()
+        self.sync = IncrementalSync(monk, "schema", watermark_field="updated_at", key_field="name")
+        self.stale = False  # schemas_data is the last-known snapshot, not a live result
 
+    @classmethod
+    def list_pager(cls) -> KeysetPager:
+        """Pager for the schema list (also used to pre-warm it after login)"""
+        return KeysetPager(monk, "schema", fields=cls.LIST_FIELDS, sort_field="name",
+                           page_size=9, key_field="name")
+
+    @traced(cat="screen")
     def compose_content(self) -> ComposeResult:
         """Define schema laboratory content"""
         with Vertical():
@@ -83,6 +113,8 @@ class SchemaLabScreen(BaseVaultScreen):
             table.add_column("FIELDS", width=8)  # Field count
             table.add_column("TABLE", width=12)  # Table name
             table.add_column("UPDATED", width=10) # Update date
+            table.add_column("RECORDS", width=8, key="records")   # Record count (probed concurrently)
+            table.add_column("CHANGED", width=10, key="changed")  # Newest record modification
             table.show_header = False
             table.cursor_type = "row"
             table.can_focus = True
@@ -92,10 +124,12 @@ class SchemaLabScreen(BaseVaultScreen):
         """Define default status message"""
         return "Ready for schema operations"
 
+    @traced(cat="screen")
     def on_mount(self) -> None:
         """Load schema data on startup"""
         super().on_mount()
-        self.load_schemas()
+        if not self.show_last_known_schemas():
+            self.load_schemas()
         # Focus the table so arrow keys and Enter work
         self.call_later(self.focus_table)
         
@@ -107,14 +141,69 @@ class SchemaLabScreen(BaseVaultScreen):
         except:
             pass
 
+    @traced(cat="screen")
     def load_schemas(self) -> None:
         """Load schema list from monk CLI using data select schema"""
         self.status_update("Loading schema registry...")
         
         # Use monk data select schema to get all schemas
-        result = monk.data_select("schema")
+        self.apply_schemas(self.pager.reload())
+
+    def snapshot_scope(self) -> str:
+        """Schema lists differ per server and tenant"""
+        return f"{monk.current_server}/{self.app.current_vault}"
+
+    def show_last_known_schemas(self) -> bool:
+        """Render the last-known first page instantly and refresh it in the background"""
+        snapshot = startup_snapshots.load("schemas", self.snapshot_scope())
+        if not snapshot or not isinstance(snapshot.data, list) or not snapshot.data:
+            return False
+        self.schemas_data = snapshot.data
+        self.stale = True
+        self.call_later(self.populate_schema_table)
+        self.call_later(self.update_stats)
+        self.status_update(f"Showing last-known schemas ({snapshot.age()} old, stale) - refreshing...")
+        self.run_worker(self.fetch_schemas, thread=True, exclusive=True, group="revalidate")
+        return True
+
+    def revalidate(self) -> None:
+        """Refresh the schema list in the background while cached rows stay visible"""
+        self.status_update(f"Showing {len(self.schemas_data)} cached schemas - refreshing...")
+        self.run_worker(self.fetch_schemas, thread=True, exclusive=True, group="revalidate")
+
+    def fetch_schemas(self) -> None:
+        """Worker thread: sync changed schemas (or fetch the page) and hand off to the UI thread"""
+        with monk.priority(Priority.VISIBLE_REFRESH):
+            if self.sync.watermark is not None:
+                whole_set = self.pager.page_index == 0 and not self.pager.has_more
+                sync_result = self.sync.refresh(self.schemas_data, fields=self.pager.projected_fields(),
+                                                include_new=whole_set)
+                if sync_result.success:
+                    self.app.call_from_thread(self.apply_sync, sync_result)
+                    return
+            result = self.pager.reload()
+        self.app.call_from_thread(self.apply_schemas, result)
+
+    def apply_sync(self, sync_result) -> None:
+        """Apply an incremental schema refresh"""
+        self.schemas_data = self.pager.rows = sync_result.rows
+        if sync_result.changed or sync_result.added or sync_result.deleted:
+            self.call_later(self.populate_schema_table)
+            self.call_later(self.update_stats)
+        else:
+            # Definitions unchanged, but record counts may have moved
+            self.load_record_stats()
+        self.status_update(f"Schema registry synced: {sync_result.describe()}")
+
+    @traced(cat="screen")
+    def apply_schemas(self, result) -> None:
+        """Apply a schema list result to the table and stats"""
         if result.success and isinstance(result.data, list):
-            self.schemas_data = result.data
+            self.schemas_data = self.pager.rows
+            self.sync.seed(self.schemas_data)
+            self.stale = False
+            if self.pager.page_index == 0 and self.pager.sort_field == "name" and not self.pager.descending:
+                startup_snapshots.save("schemas", self.schemas_data, self.snapshot_scope())
             
             if not self.schemas_data:
                 self.status_update("No schemas found. Use [c] CREATE SCHEMA to add one.")
@@ -126,6 +215,10 @@ class SchemaLabScreen(BaseVaultScreen):
             self.call_later(self.populate_schema_table)
             self.call_later(self.update_stats)
             self.status_update(f"Found {len(self.schemas_data)} schemas. Press [1-{min(len(self.schemas_data), 9)}] to select.")
+        elif self.schemas_data:
+            # Revalidation failed - keep showing the last good data
+            label = "last-known schemas (stale)" if self.stale else "cached schemas"
+            self.status_update(f"⚠ Refresh failed, showing {label}: {result.error}")
         else:
             # No schemas or error
             self.schemas_data = []
@@ -133,6 +226,7 @@ class SchemaLabScreen(BaseVaultScreen):
             error_msg = result.error if result.error else "monk CLI unavailable"
             self.status_update(f"⚠ Schema registry not accessible! {error_msg}. Use [c] CREATE SCHEMA.")
 
+    @traced(cat="table")
     def populate_schema_table(self) -> None:
         """Populate schema table with killbox notation"""
         try:
@@ -140,10 +234,10 @@ class SchemaLabScreen(BaseVaultScreen):
             table.clear()
             
             if not self.schemas_data:
-                table.add_row("", "No schemas available.", "", "", "", "")
+                table.add_row("", "No schemas available.", "", "", "", "", "", "")
                 return
                 
-            for i, schema in enumerate(self.schemas_data[:9]):  # Max 9 schemas
+            for i, schema in enumerate(self.schemas_data):  # One page = max 9 schemas
                 name = schema.get("name", "unknown")
                 status = self.format_status(schema.get("status", "unknown"))
                 field_count = schema.get("field_count", "0")
@@ -152,12 +246,45 @@ class SchemaLabScreen(BaseVaultScreen):
                 
                 killbox = f"[{i+1}]"
                 
-                # Add row to table
-                table.add_row(killbox, name, status, field_count, table_name, updated)
+                # Cached record stats show at once; missing ones fill in as probes land
+                stats = schema_stats.get(self.snapshot_scope(), name)
+                records = stats.describe_records() if stats else "…"
+                changed = self.format_date(stats.last_modified) if stats else "…"
+                
+                # Add row to table (keyed so record stats can update single cells)
+                table.add_row(killbox, name, status, field_count, table_name, updated, records, changed, key=name)
                 
         except Exception as e:
             # Fallback - update status with error info
             self.status_update(f"Table population error: {str(e)}")
+        self.load_record_stats()
+
+    def load_record_stats(self) -> None:
+        """Probe record counts for this page's schemas whose cached stats are missing or stale"""
+        names = [schema.get("name") for schema in self.schemas_data if schema.get("name")]
+        stale = schema_stats.stale(self.snapshot_scope(), names)
+        if stale:
+            self.run_worker(lambda: self.fetch_record_stats(stale), thread=True, exclusive=True,
+                            group="schema_stats")
+
+    def fetch_record_stats(self, names: List[str]) -> None:
+        """Worker thread: concurrent per-schema probes, each handed to the UI thread as it lands"""
+        worker = get_current_worker()
+        with monk.priority(Priority.BACKGROUND):
+            schema_stats.refresh(monk, self.snapshot_scope(), names,
+                                 on_result=lambda name, stats: self.app.call_from_thread(
+                                     self.apply_record_stats, name, stats),
+                                 cancelled=lambda: worker.is_cancelled)
+
+    def apply_record_stats(self, name: str, stats: SchemaStats) -> None:
+        """One schema's record stats arrived - update its row in place"""
+        try:
+            table = self.query_one("#schema_table", DataTable)
+            table.update_cell(name, "records", stats.describe_records())
+            table.update_cell(name, "changed", self.format_date(stats.last_modified) if not stats.error else "?")
+        except Exception:
+            return  # Row no longer shown (paged away)
+        self.update_stats()
 
     def format_status(self, status: str) -> str:
         """Format schema status with visual indicators"""
@@ -185,9 +312,14 @@ class SchemaLabScreen(BaseVaultScreen):
             stats_text = "No schemas in registry"
         else:
             total = len(self.schemas_data)
-            active = len([s for s in self.schemas_data if s.get("status") == "active"])
-            system = len([s for s in self.schemas_data if s.get("status") == "system"])
-            stats_text = f"Registry: {total} schemas | Active: {active} | System: {system}"
+            statuses = Counter(s.get("status") for s in self.schemas_data)
+            scope = self.snapshot_scope()
+            probed = [schema_stats.get(scope, s.get("name")) for s in self.schemas_data]
+            probed = [stats for stats in probed if stats and not stats.error]
+            records = sum(stats.records for stats in probed)
+            more = "+" if len(probed) < total or not all(stats.exact for stats in probed) else ""
+            stats_text = (f"Registry: {total} schemas | Active: {statuses['active']} | System: {statuses['system']} | "
+                          f"Records: {records:,}{more} | {self.pager.describe()}")
         
         try:
             stats_widget = self.query_one("#schema_stats", Static)
@@ -202,8 +334,17 @@ class SchemaLabScreen(BaseVaultScreen):
             if 0 <= row_index < len(self.schemas_data):
                 self.edit_schema_by_index(row_index)
 
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Prefetch the full definition the wizard needs while the cursor rests on a schema"""
+        if event.data_table.id == "schema_table" and 0 <= event.cursor_row < len(self.schemas_data):
+            name = self.schemas_data[event.cursor_row].get("name")
+            if name:
+                prefetcher.hover(self, ("record", "schema", name),
+                                 lambda: monk.data_get("schema", name, key="name"))
+
     def action_back_to_overseer(self) -> None:
         """Return to overseer console"""
+        prefetcher.cancel()
         self.app.pop_screen()
         
     def action_edit_current(self) -> None:
@@ -242,12 +383,36 @@ class SchemaLabScreen(BaseVaultScreen):
             schema_data = self.schemas_data[index]
             schema_name = schema_data["name"]
             
+            # The table only holds projected rows - the wizard needs the full definition
+            load_full_record(monk, "schema", schema_data, key="name",
+                             prefetched=prefetcher.take(("record", "schema", schema_name)))
+            
             self.status_update(f"Opening schema wizard: {schema_name}")
             from screens.schema_wizard_screen import SchemaWizardScreen
             self.app.push_screen(SchemaWizardScreen(mode="update", schema_data=schema_data))
         else:
             self.status_update("Invalid schema selection")
 
+    def action_next_page(self) -> None:
+        """Seek to the next page of schemas"""
+        if not self.pager.has_more:
+            self.status_update("Last page of schemas")
+            return
+        self.apply_schemas(self.pager.next_page())
+
+    def action_prev_page(self) -> None:
+        """Seek back to the previous page of schemas"""
+        if self.pager.page_index == 0:
+            self.status_update("First page of schemas")
+            return
+        self.apply_schemas(self.pager.prev_page())
+
+    def action_cycle_sort(self) -> None:
+        """Sort by the next field (server-side), restarting at page 1"""
+        current = self.SORT_FIELDS.index(self.pager.sort_field) if self.pager.sort_field in self.SORT_FIELDS else -1
+        self.pager.set_sort(self.SORT_FIELDS[(current + 1) % len(self.SORT_FIELDS)], descending=False)
+        self.load_schemas()
+
     # Individual schema selection methods
     def action_select_schema_1(self) -> None: self.select_schema_by_index(0)
     def action_select_schema_2(self) -> None: self.select_schema_by_index(1)
@@ -12,6 +12,9 @@ from textual.widgets import Button, DataTable, Label, Static
 from widgets.vault_container import VaultContainer
 from screens.base_screen import BaseVaultScreen
 from api.monk_client import monk
+from api.scheduler import Priority
+from api.prefetch import prefetcher
+from utils.startup_snapshot import startup_snapshots
 
 
 class ServerSelectionScreen(BaseVaultScreen):
@@ -48,6 +51,7 @@ class ServerSelectionScreen(BaseVaultScreen):
         super().__init__()
         self.servers_data = []
         self.selected_server = None
+        self.stale = False  # servers_data is the last-known snapshot, not a live result
 
     def compose_content(self) -> ComposeResult:
         """Define server selection content"""
@@ -86,21 +90,43 @@ class ServerSelectionScreen(BaseVaultScreen):
             pass
 
     def load_servers(self) -> None:
-        """Load server list from monk CLI"""
-        self.status_update("Loading vault facility servers...")
-        
-        result = monk.server_list()
+        """Show last-known servers at once, then load the live list from monk CLI in the background"""
+        snapshot = None if self.servers_data else startup_snapshots.load("servers")
+        if snapshot and isinstance(snapshot.data, dict) and snapshot.data.get("servers"):
+            self.servers_data = snapshot.data["servers"]
+            self.stale = True
+            self.populate_server_table()
+            self.status_update(f"Showing last-known servers ({snapshot.age()} old, stale) - refreshing...")
+        else:
+            self.status_update("Loading vault facility servers...")
+        self.run_worker(self.fetch_servers, thread=True, exclusive=True, group="revalidate")
+
+    def fetch_servers(self) -> None:
+        """Worker thread: fetch the live server list and hand off to the UI thread"""
+        with monk.priority(Priority.VISIBLE_REFRESH):
+            result = monk.server_list()
+        self.app.call_from_thread(self.apply_servers, result)
+
+    def apply_servers(self, result) -> None:
+        """Replace whatever is shown with the live server list"""
         if result.success and isinstance(result.data, dict):
+            startup_snapshots.save("servers", result.data)
             servers = result.data.get("servers", [])
             self.servers_data = servers
+            self.stale = False
             
             if not servers:
+                self.populate_server_table()
                 self.status_update("No servers configured. Use [c] CREATE SERVER to add one.")
                 return
                 
             self.populate_server_table()
             self.update_dynamic_bindings()
             self.status_update(f"Found {len(servers)} vault facility servers. Press [1-{len(servers)}] to select.")
+        elif self.stale:
+            # Keep the last-known list usable while monk is unreachable
+            error_msg = result.error if result.error else "monk CLI unavailable"
+            self.status_update(f"⚠ Refresh failed, showing last-known servers (stale): {error_msg}")
         else:
             # No demo data - show proper error
             self.servers_data = []
@@ -121,6 +147,8 @@ class ServerSelectionScreen(BaseVaultScreen):
             name = server.get("name", "unknown")
             endpoint = server.get("endpoint", "unknown")
             status = "●ONLINE" if server.get("status") == "up" else "◐OFFLINE"
+            if self.stale:
+                status += " (stale)"
             auth_sessions = server.get("auth_sessions", 0)
             current_marker = " *" if server.get("is_current", False) else ""
             
@@ -152,6 +180,14 @@ class ServerSelectionScreen(BaseVaultScreen):
             if 0 <= row_index < len(self.servers_data):
                 self.select_server_by_index(row_index)
 
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Prefetch the tenant list of the current server while the cursor rests on it"""
+        if event.data_table.id == "server_table" and 0 <= event.cursor_row < len(self.servers_data):
+            server = self.servers_data[event.cursor_row]
+            # Other servers would need a (side-effecting) switch before their tenants can be listed
+            if server.get("is_current", False):
+                prefetcher.hover(self, ("tenants", server.get("name")), monk.tenant_list)
+
     def action_back_to_welcome(self) -> None:
         """Return to welcome screen"""
         self.app.pop_screen()
@@ -8,6 +8,7 @@ from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
 from textual.screen import Screen
 from textual.widgets import Button, DataTable, Input, Label, Static
+from typing import Optional
 
 from widgets.vault_container import VaultContainer
 from screens.base_screen import BaseVaultScreen
@@ -99,37 +100,24 @@ class SessionSelectionScreen(BaseVaultScreen):
         """Check if user is already authenticated for this tenant"""
         self.status_update("Checking for existing authentication...")
         
-        # Check auth status
-        status_result = monk.auth_status()
-        if status_result.success and isinstance(status_result.data, dict):
-            auth_data = status_result.data
+        # Status, expiry and identity in one parallel round (cached until a login or switch)
+        auth = monk.auth_snapshot()
+        if auth.active and auth.tenant == self.tenant_name:
+            # Already authenticated to this tenant - auto-proceed
+            username = auth.username or "unknown"
+            self.existing_session = auth.info
+            session_widget = self.query_one("#session_status", Static)
+            session_widget.update(f"✅ Current session: {username}@{auth.tenant}")
             
-            if auth_data.get("authenticated", False):
-                # Check if token is expired
-                expired_result = monk.auth_expired()
-                if expired_result.success:  # Not expired
-                    # Get auth info
-                    info_result = monk.auth_info()
-                    if info_result.success and isinstance(info_result.data, dict):
-                        user_info = info_result.data
-                        current_tenant = user_info.get("tenant", "")
-                        username = user_info.get("name", "unknown")
-                        
-                        if current_tenant == self.tenant_name:
-                            # Already authenticated to this tenant - auto-proceed
-                            self.existing_session = user_info
-                            session_widget = self.query_one("#session_status", Static)
-                            session_widget.update(f"✅ Current session: {username}@{current_tenant}")
-                            
-                            # Auto-proceed with existing session after brief display
-                            user_data = {
-                                "username": username,
-                                "vault_id": current_tenant,
-                                "server": self.server_name
-                            }
-                            self.status_update("Using existing authenticated session...")
-                            self.set_timer(2.0, lambda: self.proceed_to_vault(user_data))
-                            return
+            # Auto-proceed with existing session after brief display
+            user_data = {
+                "username": username,
+                "vault_id": auth.tenant,
+                "server": self.server_name
+            }
+            self.status_update("Using existing authenticated session...")
+            self.set_timer(2.0, lambda: self.proceed_to_vault(user_data))
+            return
         
         # No existing session
         session_widget = self.query_one("#session_status", Static) 
@@ -185,20 +173,20 @@ class SessionSelectionScreen(BaseVaultScreen):
                 "vault_id": self.tenant_name,
                 "server": self.server_name
             }
-            self.proceed_to_vault(user_data)
+            self.proceed_to_vault(user_data, password)
         else:
             error_msg = auth_result.error or "Authentication failed"
             self.status_update(f"❌ Authentication failed: {error_msg}")
             self.query_one("#password_input", Input).focus()
 
-    def proceed_to_vault(self, user_data: dict) -> None:
+    def proceed_to_vault(self, user_data: dict, password: Optional[str] = None) -> None:
         """Proceed to main vault application"""
         # Clear all auth screens and go to main app
         while len(self.app.screen_stack) > 1:
             self.app.pop_screen()
             
-        # Set app authentication state
-        self.app.authenticate_user(user_data)
+        # Set app authentication state (the password lets it renew the session)
+        self.app.authenticate_user(user_data, password)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press events"""
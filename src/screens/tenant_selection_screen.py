@@ -14,6 +14,9 @@ from widgets.vault_container import VaultContainer
 from widgets.killbox_table import KillboxTable
 from screens.base_screen import BaseVaultScreen
 from api.monk_client import monk
+from api.scheduler import Priority
+from api.prefetch import prefetcher
+from utils.startup_snapshot import startup_snapshots
 
 
 class TenantSelectionScreen(BaseVaultScreen):
@@ -56,6 +59,7 @@ class TenantSelectionScreen(BaseVaultScreen):
         self.server_name = server_name
         self.tenants_data = []
         self.selected_tenant = None
+        self.stale = False  # tenants_data is the last-known snapshot, not a live result
 
     def compose_content(self) -> ComposeResult:
         """Define tenant selection content"""
@@ -91,21 +95,48 @@ class TenantSelectionScreen(BaseVaultScreen):
             pass
 
     def load_tenants(self) -> None:
-        """Load tenant list from monk CLI"""
-        self.status_update("Loading available tenant databases...")
-        
-        # Use real monk tenant list --json command
-        result = monk.tenant_list()
+        """Show last-known tenants at once, then load the live list from monk CLI in the background"""
+        prefetched = prefetcher.take(("tenants", self.server_name))
+        if prefetched:
+            # Loaded while the cursor rested on this server - no monk call needed
+            self.apply_tenants(prefetched)
+            return
+        snapshot = None if self.tenants_data else startup_snapshots.load("tenants", self.server_name)
+        if snapshot and isinstance(snapshot.data, dict) and snapshot.data.get("tenants"):
+            self.tenants_data = snapshot.data["tenants"]
+            self.stale = True
+            self.populate_tenant_table()
+            self.status_update(f"Showing last-known tenants ({snapshot.age()} old, stale) - refreshing...")
+        else:
+            self.status_update("Loading available tenant databases...")
+        self.run_worker(self.fetch_tenants, thread=True, exclusive=True, group="revalidate")
+
+    def fetch_tenants(self) -> None:
+        """Worker thread: fetch the live tenant list and hand off to the UI thread"""
+        with monk.priority(Priority.VISIBLE_REFRESH):
+            # Use real monk tenant list --json command
+            result = monk.tenant_list()
+        self.app.call_from_thread(self.apply_tenants, result)
+
+    def apply_tenants(self, result) -> None:
+        """Replace whatever is shown with the live tenant list"""
         if result.success and isinstance(result.data, dict):
+            startup_snapshots.save("tenants", result.data, self.server_name)
             tenants = result.data.get("tenants", [])
             self.tenants_data = tenants
+            self.stale = False
             
             if not tenants:
+                self.populate_tenant_table()
                 self.status_update("No tenants configured. Use [c] CREATE TENANT to add one.")
                 return
                 
             self.populate_tenant_table()
             self.status_update(f"Found {len(tenants)} tenant databases for server '{self.server_name}'. Press [1-{len(tenants)}] to select.")
+        elif self.stale:
+            # Keep the last-known list usable while monk is unreachable
+            error_msg = result.error if result.error else "monk CLI unavailable"
+            self.status_update(f"⚠ Refresh failed, showing last-known tenants (stale): {error_msg}")
         else:
             # No demo data - show proper error
             self.tenants_data = []
@@ -130,6 +161,8 @@ class TenantSelectionScreen(BaseVaultScreen):
             
             killbox = f"[{i+1}]"
             auth_status = f"{authenticated}{current_marker}"
+            if self.stale:
+                auth_status += " (stale)"
             
             table.add_row(killbox, name, display_name, auth_status)
         
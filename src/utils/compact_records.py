@@ -0,0 +1,229 @@
+"""
+Compact Records Utility
+Tuple-backed records with shared layouts and pooled repeated values
+
+A parsed monk result holds every record as its own dict, with its own copy
+of each repeated string ("engineering", "active", nested _metadata keys...).
+CompactRecord keeps the field names once per layout and the values in a
+tuple, and ValuePool makes records share one object per repeated value.
+Records still behave as mappings, so list views, filters and record
+screens use them unchanged.
+
+Benchmark: python -m utils.compact_records [count]
+"""
+
+import json
+import sys
+import threading
+from collections.abc import Mapping, MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# A field stops being pooled once it has this many distinct values
+POOL_MAX_DISTINCT = 512
+
+# Longer strings are assumed unique (notes, descriptions)
+POOL_MAX_LENGTH = 64
+
+
+class ValuePool:
+    """Per-field pools of repeated values - high-cardinality fields are left alone"""
+
+    def __init__(self, max_distinct: int = POOL_MAX_DISTINCT):
+        self.max_distinct = max_distinct
+        self.pools: Dict[str, Dict[Any, Any]] = {}
+        self.skipped: set = set()
+        self.lock = threading.Lock()
+
+    def share(self, field: str, value: Any) -> Any:
+        """The pooled instance equal to value (nested objects are compacted too)"""
+        if isinstance(value, dict):
+            return compact(value, self, prefix=f"{field}.")
+        if not isinstance(value, str) or len(value) > POOL_MAX_LENGTH:
+            return value
+        # Shared by every worker thread that parses select results
+        with self.lock:
+            if field in self.skipped:
+                return value
+            pool = self.pools.setdefault(field, {})
+            shared = pool.get(value)
+            if shared is not None:
+                return shared
+            if len(pool) >= self.max_distinct:
+                # Too many distinct values to pay off - stop pooling this field
+                self.skipped.add(field)
+                self.pools.pop(field, None)
+                return value
+            pool[value] = value
+            return value
+
+    def stats(self) -> Dict[str, int]:
+        with self.lock:
+            return {"fields": len(self.pools), "values": sum(len(pool) for pool in self.pools.values()),
+                    "skipped": len(self.skipped)}
+
+
+class RecordLayout:
+    """Field names shared by every record with the same keys in the same order"""
+
+    __slots__ = ("fields", "positions")
+
+    _layouts: Dict[Tuple[str, ...], "RecordLayout"] = {}
+
+    def __init__(self, fields: Tuple[str, ...]):
+        self.fields = fields
+        self.positions = {name: position for position, name in enumerate(fields)}
+
+    @classmethod
+    def of(cls, fields: Iterable[str]) -> "RecordLayout":
+        key = tuple(sys.intern(name) for name in fields)
+        layout = cls._layouts.get(key)
+        if layout is None:
+            layout = cls._layouts.setdefault(key, cls(key))
+        return layout
+
+
+class CompactRecord(MutableMapping):
+    """A record stored as (layout, values tuple) that reads like a dict"""
+
+    __slots__ = ("_layout", "_values", "_extra")
+
+    def __init__(self, layout: RecordLayout, values: Tuple[Any, ...]):
+        self._layout = layout
+        self._values = values
+        self._extra: Optional[Dict[str, Any]] = None  # Fields added after loading
+
+    def __getitem__(self, key: str) -> Any:
+        position = self._layout.positions.get(key)
+        if position is not None:
+            value = self._values[position]
+            if value is not _MISSING:
+                return value
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        position = self._layout.positions.get(key)
+        if position is not None:
+            values = list(self._values)
+            values[position] = value
+            self._values = tuple(values)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        position = self._layout.positions.get(key)
+        if position is not None and self._values[position] is not _MISSING:
+            self[key] = _MISSING
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for name, value in zip(self._layout.fields, self._values):
+            if value is not _MISSING:
+                yield name
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        position = self._layout.positions.get(key)
+        if position is not None:
+            return self._values[position] is not _MISSING
+        return self._extra is not None and key in self._extra
+
+    def get(self, key: str, default: Any = None) -> Any:
+        # Hot path for tables and filters - skip the KeyError round trip
+        position = self._layout.positions.get(key)
+        if position is not None:
+            value = self._values[position]
+            return default if value is _MISSING else value
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def copy(self) -> Dict[str, Any]:
+        """Plain dict copy (edit forms work on dicts)"""
+        return dict(self)
+
+    def clone(self) -> "CompactRecord":
+        """Independent compact copy - shares the layout and the (immutable) values tuple"""
+        twin = CompactRecord(self._layout, self._values)
+        if self._extra is not None:
+            twin._extra = dict(self._extra)
+        return twin
+
+    def __repr__(self) -> str:
+        return f"CompactRecord({dict(self)!r})"
+
+
+# Placeholder for a field deleted from a compact record
+_MISSING = object()
+
+
+def compact(record: Dict[str, Any], pool: Optional[ValuePool] = None, prefix: str = "") -> CompactRecord:
+    """Compact one record dict (prefix names the pools of nested objects)"""
+    pool = pool or record_pool
+    layout = RecordLayout.of(record)
+    return CompactRecord(layout, tuple(pool.share(prefix + name, value) for name, value in record.items()))
+
+
+def compact_rows(rows: List[Any], pool: Optional[ValuePool] = None) -> List[Any]:
+    """Compact every dict row of a select result (other items pass through)"""
+    pool = pool or record_pool
+    return [compact(row, pool) if isinstance(row, dict) else row for row in rows]
+
+
+def copy_rows(rows: List[Any]) -> List[Any]:
+    """Shallow per-row copies, so callers can mutate rows without touching a shared cache"""
+    return [row.clone() if isinstance(row, CompactRecord) else dict(row) if isinstance(row, dict) else row
+            for row in rows]
+
+
+def to_plain(value: Any) -> Any:
+    """JSON-ready copy of compact records (for dumps and payloads)"""
+    if isinstance(value, Mapping):
+        return {key: to_plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_plain(item) for item in value]
+    return value
+
+
+# Global value pool instance
+record_pool = ValuePool()
+
+
+def _benchmark(count: int) -> None:
+    """Bytes per record for parsed dicts vs compact records"""
+    import tracemalloc
+    from models.vault_data import vault_data
+
+    payload = json.dumps(vault_data.generate_personnel_records(count))
+
+    def measure(build):
+        tracemalloc.start()
+        rows = build(payload)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return rows, size
+
+    plain, plain_bytes = measure(json.loads)
+    pool = ValuePool()
+    compacted, compact_bytes = measure(lambda text: compact_rows(json.loads(text), pool))
+    assert to_plain(compacted) == plain
+
+    print(f"{count:,} personnel records")
+    print(f"  dict records:    {plain_bytes / count:8.0f} bytes/record")
+    print(f"  compact records: {compact_bytes / count:8.0f} bytes/record "
+          f"({100 * (1 - compact_bytes / plain_bytes):.0f}% smaller)")
+
+
+if __name__ == "__main__":
+    _benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,119 @@
+"""
+Incremental Sync Utility
+Refresh loaded records by modified-at watermark instead of full reloads
+
+A refresh asks only for rows changed since the highest watermark seen,
+merges them into the loaded set by id, and detects deletions with an
+id-only existence probe over the loaded ids.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from utils.compact_records import compact
+
+
+# Ids per existence probe - keeps $in lists within argv/stdin comfort
+PROBE_CHUNK = 500
+
+
+@dataclass
+class SyncResult:
+    """Outcome of one incremental refresh"""
+    success: bool
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    changed: int = 0
+    added: int = 0
+    deleted: int = 0
+    error: str = ""
+
+    def describe(self) -> str:
+        if not self.success:
+            return f"sync failed: {self.error}"
+        if not (self.changed or self.added or self.deleted):
+            return "up to date"
+        return f"{self.changed} changed, {self.added} new, {self.deleted} deleted"
+
+
+class IncrementalSync:
+    """Watermark state and merge logic for one schema as loaded by one view"""
+
+    def __init__(self, client, schema: str, watermark_field: str = "modified_at", key_field: str = "id"):
+        self.client = client
+        self.schema = schema
+        self.watermark_field = watermark_field
+        self.key_field = key_field
+        self.watermark: Optional[str] = None
+
+    def seed(self, rows: List[Dict[str, Any]]) -> None:
+        """Advance the watermark past freshly loaded rows"""
+        values = [str(row[self.watermark_field]) for row in rows if row.get(self.watermark_field)]
+        if values:
+            latest = max(values)
+            if self.watermark is None or latest > self.watermark:
+                self.watermark = latest
+
+    def reset(self) -> None:
+        self.watermark = None
+
+    def changed_since(self, where: Optional[Dict], fields: Optional[List[str]]):
+        """Rows modified at or after the watermark (>= so same-second edits aren't missed)"""
+        condition = {self.watermark_field: {"$gte": self.watermark}}
+        query = {"where": {"$and": [where, condition]} if where else condition}
+        return self.client.data_select(self.schema, query, fields=fields)
+
+    def existing_keys(self, keys: List[Any], where: Optional[Dict] = None) -> Optional[set]:
+        """Which of the given keys still exist and still match where (None if the probe failed)"""
+        found = set()
+        for start in range(0, len(keys), PROBE_CHUNK):
+            chunk = keys[start:start + PROBE_CHUNK]
+            condition = {self.key_field: {"$in": chunk}}
+            query = {"where": {"$and": [where, condition]} if where else condition}
+            result = self.client.data_select(self.schema, query, fields=[self.key_field])
+            if not result.success or not isinstance(result.data, list):
+                return None
+            found.update(row.get(self.key_field) for row in result.data if isinstance(row, dict))
+        return found
+
+    def refresh(self, rows: List[Dict[str, Any]], where: Optional[Dict] = None,
+                fields: Optional[List[str]] = None, include_new: bool = True) -> SyncResult:
+        """Merge changes since the watermark into rows (a new list is returned)"""
+        if self.watermark is None:
+            return SyncResult(success=False, rows=rows, error="no watermark - full load required")
+
+        result = self.changed_since(where, fields)
+        if not result.success or not isinstance(result.data, list):
+            return SyncResult(success=False, rows=rows, error=result.error or "unexpected response")
+
+        merged = list(rows)
+        index = {row.get(self.key_field): position for position, row in enumerate(merged)}
+        changed = added = 0
+        for fresh in result.data:
+            key = fresh.get(self.key_field)
+            position = index.get(key)
+            if position is not None:
+                current = merged[position]
+                if any(current.get(name) != value for name, value in fresh.items()):
+                    # Keep local-only state (e.g. selection) while taking server fields
+                    merged[position] = compact({**current, **fresh})
+                    changed += 1
+            elif include_new:
+                index[key] = len(merged)
+                merged.append(compact(fresh))
+                added += 1
+        self.seed(result.data)
+        if result.data:
+            # Cached selects over this schema may now be stale
+            self.client.filter_cache.invalidate(self.schema)
+
+        # Deletions: only rows loaded before this refresh can have vanished
+        deleted = 0
+        loaded_keys = [row.get(self.key_field) for row in rows]
+        existing = self.existing_keys(loaded_keys, where) if loaded_keys else set()
+        if existing is not None:
+            vanished = set(loaded_keys) - existing
+            if vanished:
+                merged = [row for row in merged if row.get(self.key_field) not in vanished]
+                deleted = len(vanished)
+
+        return SyncResult(success=True, rows=merged, changed=changed, added=added, deleted=deleted)
@@ -0,0 +1,144 @@
+"""
+Keyset Pager Utility
+Server-side sort with seek pagination over monk data select
+
+Each page is requested as "rows after the last (sort value, id) seen",
+so page N+1 costs the same as page 1 and nothing beyond a page is ever
+downloaded.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import config
+
+
+Cursor = Tuple[Any, Any]  # (sort value, key) of the last row on a page
+
+
+class KeysetPager:
+    """Pages through one schema in server sort order using seek cursors"""
+
+    def __init__(self, client, schema: str, fields: Optional[List[str]] = None,
+                 sort_field: str = "id", descending: bool = False,
+                 page_size: Optional[int] = None, where: Optional[Dict] = None,
+                 key_field: str = "id"):
+        self.client = client
+        self.schema = schema
+        self.fields = list(fields) if fields else None
+        self.sort_field = sort_field
+        self.descending = descending
+        self.page_size = max(1, page_size or config.page_size)
+        self.where = where or {}
+        self.key_field = key_field
+
+        # cursors[i] starts page i; page 0 starts at the beginning
+        self.cursors: List[Optional[Cursor]] = [None]
+        self.page_index = 0
+        self.rows: List[Dict[str, Any]] = []
+        self.has_more = False
+
+    # Query building
+
+    def order(self) -> List[str]:
+        """Sort clause - the key field breaks ties so the order is total"""
+        direction = "desc" if self.descending else "asc"
+        order = [f"{self.sort_field} {direction}"]
+        if self.sort_field != self.key_field:
+            order.append(f"{self.key_field} {direction}")
+        return order
+
+    def seek(self, cursor: Cursor) -> Dict:
+        """Where-clause selecting rows strictly after the cursor in sort order"""
+        value, key = cursor
+        op = "$lt" if self.descending else "$gt"
+        if self.sort_field == self.key_field:
+            return {self.key_field: {op: key}}
+        return {"$or": [
+            {self.sort_field: {op: value}},
+            {"$and": [{self.sort_field: value}, {self.key_field: {op: key}}]},
+        ]}
+
+    def build_filter(self, cursor: Optional[Cursor]) -> Dict:
+        """Filter for the page starting at cursor (one extra row detects a next page)"""
+        conditions = [c for c in (self.where, self.seek(cursor) if cursor else None) if c]
+        query: Dict[str, Any] = {"order": self.order(), "limit": self.page_size + 1}
+        if len(conditions) == 1:
+            query["where"] = conditions[0]
+        elif conditions:
+            query["where"] = {"$and": conditions}
+        return query
+
+    def projected_fields(self) -> Optional[List[str]]:
+        """Requested columns plus whatever the cursor needs"""
+        if self.fields is None:
+            return None
+        fields = list(self.fields)
+        for name in (self.sort_field, self.key_field):
+            if name not in fields:
+                fields.append(name)
+        return fields
+
+    # Paging
+
+    def load(self, page_index: int):
+        """Fetch one page (must already have a cursor) and make it current"""
+        page_index = max(0, min(page_index, len(self.cursors) - 1))
+        cursor = self.cursors[page_index]
+        result = self.client.data_select_cached(self.schema, self.build_filter(cursor), fields=self.projected_fields())
+        if not result.success or not isinstance(result.data, list):
+            return result
+
+        rows = result.data
+        self.has_more = len(rows) > self.page_size
+        self.rows = rows[:self.page_size]
+        self.page_index = page_index
+
+        # Remember where the following page starts
+        del self.cursors[page_index + 1:]
+        if self.has_more and self.rows:
+            last = self.rows[-1]
+            self.cursors.append((last.get(self.sort_field), last.get(self.key_field)))
+        return result
+
+    def first_page(self):
+        return self.load(0)
+
+    def next_page(self):
+        """Fetch the following page, or None when already on the last one"""
+        if not self.has_more:
+            return None
+        return self.load(self.page_index + 1)
+
+    def prev_page(self):
+        """Fetch the preceding page, or None when already on the first one"""
+        if self.page_index == 0:
+            return None
+        return self.load(self.page_index - 1)
+
+    def reload(self):
+        """Re-fetch the current page (e.g. after a refresh)"""
+        return self.load(self.page_index)
+
+    def set_sort(self, field: str, descending: Optional[bool] = None) -> None:
+        """Change sort order; same field toggles direction. Paging restarts."""
+        if descending is None:
+            descending = not self.descending if field == self.sort_field else False
+        self.sort_field = field
+        self.descending = descending
+        self.reset()
+
+    def set_where(self, where: Optional[Dict]) -> None:
+        """Change the base filter. Paging restarts."""
+        self.where = where or {}
+        self.reset()
+
+    def reset(self) -> None:
+        self.cursors = [None]
+        self.page_index = 0
+        self.has_more = False
+
+    def describe(self) -> str:
+        """Short page/sort label for status lines"""
+        arrow = "▼" if self.descending else "▲"
+        more = "+" if self.has_more else ""
+        return f"Page {self.page_index + 1}{more} | Sort: {self.sort_field} {arrow}"
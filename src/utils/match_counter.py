@@ -0,0 +1,48 @@
+"""
+Match Counter Utility
+Cheap match counts for filters that are still being edited
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from config import config
+
+
+@dataclass
+class MatchEstimate:
+    """How many records a filter matches"""
+    count: int
+    exact: bool         # False = at least count (the probe hit its cap)
+    source: str         # "cache" or "server"
+    error: str = ""
+
+    def describe(self) -> str:
+        if self.error:
+            return f"Matches: unavailable ({self.error})"
+        if self.count == 0:
+            return "Matches: 0 - this filter returns nothing"
+        prefix = "" if self.exact else "more than "
+        suffix = " (cached)" if self.source == "cache" else ""
+        return f"Matches: {prefix}{self.count:,}{suffix}"
+
+
+def estimate_matches(client, schema: str, where: Optional[Dict], cap: Optional[int] = None,
+                     key_field: str = "id", timeout: Optional[float] = None) -> MatchEstimate:
+    """Count matches locally from a cached superset, else with a capped id-only select"""
+    cap = cap or config.match_count_cap
+    query = {"where": where or {}, "select": [key_field]}
+
+    # Exact and free when a broader complete result is already cached
+    rows = client.filter_cache.lookup(schema, query, client.cache_scope)
+    if rows is not None:
+        return MatchEstimate(count=len(rows), exact=True, source="cache")
+
+    # Otherwise ask for ids only, one past the cap, so huge results stay cheap
+    result = client.data_select_cached(schema, dict(query, limit=cap + 1), timeout=timeout)
+    if not result.success or not isinstance(result.data, list):
+        return MatchEstimate(count=0, exact=False, source="server", error=result.error or "no response")
+    count = len(result.data)
+    if count > cap:
+        return MatchEstimate(count=cap, exact=False, source="server")
+    return MatchEstimate(count=count, exact=True, source="server")
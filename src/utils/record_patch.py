@@ -0,0 +1,131 @@
+"""
+Record Patch Utility
+Field-level diffs, lazy full-record loads and optimistic-concurrency saves for single records
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+# Fields checked (in order) to detect a concurrent modification
+VERSION_FIELDS = ("version", "modified_at")
+
+# Fields never sent back to the server in a patch
+READONLY_FIELDS = ("id", "_metadata", "created_at", "modified_at", "created_by", "version", "selected")
+
+
+@dataclass
+class PatchResult:
+    """Outcome of a patch save"""
+    success: bool
+    patch: Dict[str, Any] = field(default_factory=dict)
+    record: Dict[str, Any] = field(default_factory=dict)   # Server copy of the saved fields
+    conflict: str = ""
+    error: str = ""
+
+
+def coerce_like(original: Any, value: Any) -> Any:
+    """Convert an edited (string) value back to the original value's type"""
+    if not isinstance(value, str) or isinstance(original, str) or original is None:
+        return value
+    try:
+        if isinstance(original, bool):
+            return value.strip().lower() in ("true", "1", "yes", "y")
+        if isinstance(original, int):
+            return int(value)
+        if isinstance(original, float):
+            return float(value)
+    except ValueError:
+        pass
+    return value
+
+
+def compute_patch(original: Dict[str, Any], edited: Dict[str, Any]) -> Dict[str, Any]:
+    """Return only the fields whose edited value differs from the original"""
+    patch = {}
+    for field_name, value in edited.items():
+        if field_name in READONLY_FIELDS or field_name.startswith("_"):
+            continue
+        before = original.get(field_name)
+        after = coerce_like(before, value)
+        if after != before and str(after) != str(before):
+            patch[field_name] = after
+    return patch
+
+
+def version_of(record: Dict[str, Any]) -> tuple:
+    """Return (field, value) for the record's concurrency token"""
+    for version_field in VERSION_FIELDS:
+        if record.get(version_field) is not None:
+            return version_field, record[version_field]
+    return "", None
+
+
+def check_version(client, schema: str, record_id: str, original: Dict[str, Any]) -> str:
+    """Compare the server version token against the original, returning a conflict message"""
+    version_field, expected = version_of(original)
+    if not version_field:
+        return ""  # Nothing to guard with
+
+    result = client.data_version(schema, record_id, version_field)
+    if not result.success:
+        return ""  # Probe unavailable - let the update itself report errors
+
+    rows = result.data if isinstance(result.data, list) else [result.data]
+    current = rows[0] if rows and isinstance(rows[0], dict) else None
+    if current is None:
+        return f"Record {record_id} no longer exists"
+
+    actual = current.get(version_field)
+    if actual is not None and str(actual) != str(expected):
+        return f"Record changed by another operator ({version_field} {expected} → {actual})"
+    return ""
+
+
+def load_full_record(client, schema: str, record: Dict[str, Any], key: str = "id", prefetched=None) -> bool:
+    """Fill a projected list row in place with the full record, returning whether it worked"""
+    result = prefetched or client.data_get(schema, record.get(key), key=key)
+    if not result.success or not isinstance(result.data, dict):
+        return False
+    record.update(result.data)
+    return True
+
+
+def save_patch(client, schema: str, record_id: str, original: Dict[str, Any], patch: Dict[str, Any]) -> PatchResult:
+    """Send only changed fields, refusing the write if the record moved underneath us"""
+    if not patch:
+        return PatchResult(success=True)
+
+    conflict = check_version(client, schema, record_id, original)
+    if conflict:
+        return PatchResult(success=False, patch=patch, conflict=conflict)
+
+    result = client.data_update(schema, record_id, patch)
+    if not result.success:
+        return PatchResult(success=False, patch=patch, error=result.error or "Update failed")
+
+    saved = result.data if isinstance(result.data, dict) else {}
+    record = dict(patch)
+    record.update({k: v for k, v in saved.items() if k in patch or k in VERSION_FIELDS})
+    refresh_version(client, schema, record_id, original, record)
+    return PatchResult(success=True, patch=patch, record=record)
+
+
+def refresh_version(client, schema: str, record_id: str, original: Dict[str, Any], record: Dict[str, Any]) -> None:
+    """Bring the saved record's concurrency token up to date so the next save isn't a false conflict"""
+    version_field, _ = version_of(original)
+    if not version_field or record.get(version_field) is not None:
+        return  # Unguarded, or the update already returned the new token
+
+    result = client.data_version(schema, record_id, version_field)
+    current = {}
+    if result.success:
+        rows = result.data if isinstance(result.data, list) else [result.data]
+        current = rows[0] if rows and isinstance(rows[0], dict) else {}
+    if current.get(version_field) is not None:
+        record[version_field] = current[version_field]
+        return
+    # New token unknown - drop the stale guard rather than report a conflict next time
+    for stale_field in VERSION_FIELDS:
+        if record.get(stale_field) is None:
+            record[stale_field] = None
@@ -0,0 +1,275 @@
+"""
+Schema Validators
+Field validators compiled once from a monk schema definition
+"""
+
+import hashlib
+import json
+import re
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# (level, message) where level is "ok", "warning" or "error"
+ValidationResult = Tuple[str, str]
+Check = Callable[[Any], Optional[ValidationResult]]
+
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+DATETIME_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?$")
+
+# System-managed fields that operators never edit
+SYSTEM_FIELDS = ("id", "created_at", "modified_at", "created_by", "updated_at", "trashed_at", "deleted_at")
+
+
+def _is_blank(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and value.strip() == "")
+
+
+class FieldValidator:
+    """Ordered list of pre-built checks for a single field"""
+
+    def __init__(self, name: str, spec: Dict[str, Any], required: bool = False):
+        self.name = name
+        self.spec = spec
+        self.required = required
+        self.options = [(str(v).replace("_", " ").title(), str(v)) for v in spec.get("enum", []) or []]
+        self.checks: List[Check] = self.compile_checks(spec)
+
+    def compile_checks(self, spec: Dict[str, Any]) -> List[Check]:
+        """Turn the JSON Schema property into a list of closures"""
+        name = self.name
+        checks: List[Check] = []
+
+        field_type = spec.get("type")
+        if isinstance(field_type, list):
+            field_type = next((t for t in field_type if t != "null"), None)
+
+        if field_type in ("integer", "number"):
+            convert = int if field_type == "integer" else float
+            minimum, maximum = spec.get("minimum"), spec.get("maximum")
+
+            def check_number(value):
+                try:
+                    number = convert(value)
+                except (TypeError, ValueError):
+                    return ("error", f"{name}: Expected {field_type}")
+                if minimum is not None and number < minimum:
+                    return ("error", f"{name}: Must be ≥ {minimum}")
+                if maximum is not None and number > maximum:
+                    return ("error", f"{name}: Must be ≤ {maximum}")
+                return None
+            checks.append(check_number)
+
+        elif field_type == "boolean":
+            def check_boolean(value):
+                if isinstance(value, bool) or str(value).strip().lower() in ("true", "false", "1", "0", "yes", "no"):
+                    return None
+                return ("error", f"{name}: Expected true/false")
+            checks.append(check_boolean)
+
+        enum_values = {str(v) for v in spec.get("enum", []) or []}
+        if enum_values:
+            def check_enum(value):
+                if str(value) not in enum_values:
+                    return ("error", f"{name}: Not one of {', '.join(sorted(enum_values))}")
+                return None
+            checks.append(check_enum)
+
+        min_length, max_length = spec.get("minLength"), spec.get("maxLength")
+        if min_length is not None or max_length is not None:
+            def check_length(value):
+                length = len(str(value))
+                if min_length is not None and length < min_length:
+                    return ("warning", f"{name}: Shorter than {min_length} characters")
+                if max_length is not None and length > max_length:
+                    return ("error", f"{name}: Longer than {max_length} characters")
+                return None
+            checks.append(check_length)
+
+        pattern = spec.get("pattern")
+        if pattern:
+            try:
+                compiled = re.compile(pattern)
+
+                def check_pattern(value):
+                    if not compiled.search(str(value)):
+                        return ("error", f"{name}: Does not match required pattern")
+                    return None
+                checks.append(check_pattern)
+            except re.error:
+                pass  # Invalid pattern in the schema - skip rather than block editing
+
+        fmt = spec.get("format")
+        if fmt == "email":
+            checks.append(lambda value: None if EMAIL_PATTERN.match(str(value)) else ("error", f"{name}: Invalid email format"))
+        elif fmt == "date":
+            checks.append(lambda value: None if DATE_PATTERN.match(str(value)) else ("warning", f"{name}: Date format should be YYYY-MM-DD"))
+        elif fmt == "date-time":
+            checks.append(lambda value: None if DATETIME_PATTERN.match(str(value)) else ("warning", f"{name}: Expected ISO date-time"))
+        elif fmt == "phone":
+            checks.append(lambda value: None if len(re.sub(r"[\s\-()+.]", "", str(value))) >= 10 else ("warning", f"{name}: Phone number seems incomplete"))
+
+        return checks
+
+    def validate(self, value: Any) -> ValidationResult:
+        """Run checks in order and return the first failure"""
+        if _is_blank(value):
+            if self.required:
+                return ("error", f"{self.name}: Required")
+            return ("ok", f"{self.name}: Valid")
+
+        for check in self.checks:
+            outcome = check(value)
+            if outcome:
+                return outcome
+        return ("ok", f"{self.name}: Valid")
+
+
+class CompiledSchema:
+    """All field validators for one version of a schema"""
+
+    def __init__(self, name: str, definition: Dict[str, Any], version: str):
+        self.name = name
+        self.version = version
+        self.definition = definition
+        required = set(definition.get("required", []) or [])
+        properties = definition.get("properties", {}) or {}
+        self.fields: Dict[str, FieldValidator] = {
+            field_name: FieldValidator(field_name, spec or {}, field_name in required)
+            for field_name, spec in properties.items()
+        }
+        self.required = [f for f in required if f in self.fields]
+
+    def validator_for(self, field_name: str) -> FieldValidator:
+        """Get (or lazily infer) the validator for a field"""
+        validator = self.fields.get(field_name)
+        if validator is None:
+            # Field not described by the schema - fall back to name-based conventions
+            validator = FieldValidator(field_name, infer_field_spec(field_name))
+            self.fields[field_name] = validator
+        return validator
+
+    def validate_field(self, field_name: str, value: Any) -> ValidationResult:
+        """Validate a single field value (used on every keystroke)"""
+        return self.validator_for(field_name).validate(value)
+
+    def validate_record(self, record: Dict[str, Any], check_required: bool = True) -> List[ValidationResult]:
+        """Validate every field of a record, returning only failures"""
+        failures = []
+        for field_name, value in record.items():
+            if field_name.startswith("_") or field_name in SYSTEM_FIELDS:
+                continue
+            outcome = self.validate_field(field_name, value)
+            if outcome[0] != "ok":
+                failures.append(outcome)
+        if check_required:
+            for field_name in self.required:
+                if field_name not in record:
+                    failures.append(("error", f"{field_name}: Required"))
+        return failures
+
+    def validate_many(self, records: Iterable[Dict[str, Any]]) -> Iterator[Tuple[int, List[ValidationResult]]]:
+        """Batch validation - yields (index, failures) for records that failed"""
+        for index, record in enumerate(records):
+            failures = self.validate_record(record)
+            if failures:
+                yield index, failures
+
+    def field_options(self, field_name: str) -> List[Tuple[str, str]]:
+        """Select options derived from the field's enum (empty when unconstrained)"""
+        validator = self.fields.get(field_name)
+        return validator.options if validator else []
+
+
+def infer_field_spec(field_name: str) -> Dict[str, Any]:
+    """Name-based conventions for fields the schema doesn't describe"""
+    if field_name == "email" or field_name.endswith("_email"):
+        return {"format": "email"}
+    if field_name.endswith("_date"):
+        return {"format": "date"}
+    if field_name == "phone" or field_name.endswith("_phone"):
+        return {"format": "phone"}
+    return {}
+
+
+def schema_version(definition: Dict[str, Any]) -> str:
+    """Version token for a definition - explicit version if present, else a content hash"""
+    explicit = definition.get("version") or definition.get("updated_at") or definition.get("$id")
+    if explicit:
+        return str(explicit)
+    encoded = json.dumps(definition, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()[:12]
+
+
+def extract_definition(data: Any) -> Dict[str, Any]:
+    """Pull the JSON Schema out of a meta select response"""
+    if isinstance(data, list):
+        data = data[0] if data else {}
+    if not isinstance(data, dict):
+        return {}
+    if "properties" in data:
+        return data
+    for key in ("definition", "json_schema", "schema"):
+        nested = data.get(key)
+        if isinstance(nested, dict) and "properties" in nested:
+            return nested
+    return {}
+
+
+class SchemaValidatorCache:
+    """Compiled validators keyed by (schema, version) with a short freshness window"""
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        self.compiled: Dict[Tuple[str, str], CompiledSchema] = {}
+        self.latest: Dict[str, Tuple[float, CompiledSchema]] = {}
+
+    def compile(self, schema: str, definition: Dict[str, Any]) -> CompiledSchema:
+        """Compile a definition, reusing an existing compile of the same version"""
+        version = schema_version(definition)
+        key = (schema, version)
+        compiled = self.compiled.get(key)
+        if compiled is None:
+            compiled = CompiledSchema(schema, definition, version)
+            self.compiled[key] = compiled
+        self.latest[schema] = (time.monotonic(), compiled)
+        return compiled
+
+    def get(self, schema: str, client=None) -> CompiledSchema:
+        """Get validators for a schema, fetching the definition when stale"""
+        cached = self.latest.get(schema)
+        if cached and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+
+        if client is None:
+            from api.monk_client import monk as client
+
+        result = client.meta_select(schema)
+        if not result.success:
+            # Keep last good compile when the server is unavailable; never cache the failure
+            return cached[1] if cached else self.inferred(schema)
+        definition = extract_definition(result.data)
+        if not definition and cached:
+            return cached[1]
+        return self.compile(schema, definition)
+
+    def peek(self, schema: str) -> Optional[CompiledSchema]:
+        """Last compile for a schema, fresh or not, without fetching"""
+        cached = self.latest.get(schema)
+        return cached[1] if cached else None
+
+    def inferred(self, schema: str) -> CompiledSchema:
+        """Uncached validators from name-based conventions only (definition not available yet)"""
+        return CompiledSchema(schema, {}, "inferred")
+
+    def invalidate(self, schema: Optional[str] = None) -> None:
+        """Force the next get() to re-fetch the definition"""
+        if schema is None:
+            self.latest.clear()
+        else:
+            self.latest.pop(schema, None)
+
+
+# Global validator cache
+schema_validators = SchemaValidatorCache()
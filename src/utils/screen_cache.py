@@ -0,0 +1,64 @@
+"""
+Screen Cache Utility
+Keeps recently used module screens alive between visits
+"""
+
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from textual.screen import Screen
+
+
+class ScreenCache:
+    """LRU cache of installed screens with background revalidation on re-entry"""
+
+    def __init__(self, app, max_screens: int = 3):
+        self.app = app
+        self.max_screens = max(1, max_screens)
+        self.entries: "OrderedDict[str, Screen]" = OrderedDict()
+
+    def open(self, name: str, factory: Callable[[], Screen]) -> Screen:
+        """Push a cached screen (revalidating it) or build, install and push a new one"""
+        screen = self.entries.get(name)
+        if screen is not None and self.app.is_screen_installed(name):
+            self.entries.move_to_end(name)
+            self.app.push_screen(name)
+            # Last data is already on screen - refresh it without blocking the keypress
+            if hasattr(screen, "revalidate"):
+                screen.revalidate()
+            return screen
+
+        screen = factory()
+        self.app.install_screen(screen, name)
+        self.entries[name] = screen
+        self.evict()
+        self.app.push_screen(name)
+        return screen
+
+    def evict(self) -> None:
+        """Drop least recently used screens beyond the cap (never ones on the stack)"""
+        for name in list(self.entries):
+            if len(self.entries) <= self.max_screens:
+                break
+            self.discard(name)
+
+    def discard(self, name: str) -> bool:
+        """Uninstall and free one cached screen if it isn't currently displayed"""
+        screen = self.entries.get(name)
+        if screen is None:
+            return False
+        if screen in self.app.screen_stack:
+            return False
+        self.entries.pop(name)
+        self.app.uninstall_screen(name)
+        screen.remove()
+        return True
+
+    def clear(self) -> None:
+        """Forget every cached screen (e.g. on login, logout or tenant switch)"""
+        for name in list(self.entries):
+            self.discard(name)
+
+    def get(self, name: str) -> Optional[Screen]:
+        """Get a cached screen without pushing it"""
+        return self.entries.get(name)
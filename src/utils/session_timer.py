@@ -3,7 +3,7 @@ Session Timer Utility
 Live countdown for JWT token expiration
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 import time
 from typing import Optional
 
@@ -13,7 +13,7 @@ class SessionTimer:
     
     @staticmethod
     def parse_expires_output(expires_text: str) -> Optional[datetime]:
-        """Parse monk auth expires output to datetime"""
+        """Parse monk auth expires output to datetime (timezone-aware when the output names one)"""
         try:
             # Handle different possible formats
             expires_text = expires_text.strip()
@@ -27,27 +27,45 @@ class SessionTimer:
             
             for fmt in formats_to_try:
                 try:
-                    return datetime.strptime(expires_text, fmt)
+                    parsed = datetime.strptime(expires_text, fmt)
                 except ValueError:
                     continue
+                return SessionTimer._with_timezone(parsed, expires_text, fmt)
                     
             return None
             
         except Exception:
             return None
     
+    @staticmethod
+    def _with_timezone(parsed: datetime, expires_text: str, fmt: str) -> datetime:
+        """Attach the zone the text names; left naive when it names none"""
+        if fmt.endswith("Z"):
+            return parsed.replace(tzinfo=timezone.utc)
+        if "%Z" in fmt:
+            # strptime only accepts UTC/GMT or the local zone's names, and drops them
+            zone = expires_text.split()[-2]
+            if zone in ("UTC", "GMT"):
+                return parsed.replace(tzinfo=timezone.utc)
+            return parsed.astimezone()  # local zone
+        return parsed
+
+    @staticmethod
+    def seconds_until(expires_at: datetime) -> Optional[float]:
+        """Seconds until a timezone-aware expiry, or None when its timezone is unknown"""
+        if expires_at.tzinfo is None:
+            return None
+        return (expires_at - datetime.now(timezone.utc)).total_seconds()
+
     @staticmethod
     def format_time_remaining(expires_at: datetime) -> str:
         """Format time remaining until expiration"""
         try:
-            now = datetime.now()
-            
-            # Handle timezone-naive comparison (assumes same timezone)
-            if expires_at.tzinfo is None and now.tzinfo is None:
-                time_remaining = expires_at - now
+            if expires_at.tzinfo is None:
+                # No timezone in the output - assume local time
+                time_remaining = expires_at - datetime.now()
             else:
-                # For now, just use naive comparison
-                time_remaining = expires_at.replace(tzinfo=None) - now
+                time_remaining = expires_at - datetime.now(timezone.utc)
             
             if time_remaining.total_seconds() <= 0:
                 # Calculate how long ago it expired
@@ -0,0 +1,68 @@
+"""
+Startup Snapshot Utility
+Last-known server, tenant and schema lists for instant first render
+
+Selection screens show the snapshot straight away (marked stale) and
+replace it when the live monk result arrives in the background.
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from config import config
+from utils.compact_records import to_plain
+
+
+@dataclass
+class Snapshot:
+    """A persisted monk result and when it was taken"""
+    data: Any
+    saved_at: float
+
+    def age(self) -> str:
+        """Human age for stale labels ("40s", "12m", "3h", "2d")"""
+        seconds = max(0, time.time() - self.saved_at)
+        for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+            if seconds >= size:
+                return f"{int(seconds // size)}{unit}"
+        return f"{int(seconds)}s"
+
+
+class SnapshotStore:
+    """Small JSON files keyed by list kind and scope (server, server/tenant)"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def path_for(self, kind: str, scope: Optional[str] = None) -> str:
+        name = f"{kind}__{scope}" if scope else kind
+        safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in name)
+        return os.path.join(self.directory, f"{safe}.json")
+
+    def load(self, kind: str, scope: Optional[str] = None) -> Optional[Snapshot]:
+        """Last saved result, or None if there isn't a readable one"""
+        try:
+            with open(self.path_for(kind, scope), encoding="utf-8") as handle:
+                stored = json.load(handle)
+            return Snapshot(data=stored["data"], saved_at=float(stored["saved_at"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, kind: str, data: Any, scope: Optional[str] = None) -> None:
+        """Persist a fresh result atomically (failures only cost the next fast start)"""
+        path = self.path_for(kind, scope)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temp_path = path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as handle:
+                json.dump({"saved_at": time.time(), "data": data}, handle, default=to_plain)
+            os.replace(temp_path, path)
+        except OSError:
+            pass
+
+
+# Global snapshot store instance
+startup_snapshots = SnapshotStore(os.path.join(config.cache_dir, "snapshots"))
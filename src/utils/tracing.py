@@ -0,0 +1,127 @@
+"""
+Tracing Utility
+Chrome trace-event spans for actions, screen loads and monk calls
+
+Enable with VAULT_TRACE=/path/to/trace.json and open the file in
+Perfetto (ui.perfetto.dev) or chrome://tracing.
+"""
+
+import atexit
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, List, Optional
+
+from config import config
+
+
+# Shared no-op context returned while tracing is off
+NULL_SPAN = nullcontext()
+
+
+class Tracer:
+    """Collects complete ("X") trace events in memory and writes them on exit"""
+
+    def __init__(self, path: str = ""):
+        self.path = path
+        self.enabled = bool(path)
+        self.events: List[Dict[str, Any]] = []
+        self.thread_names: Dict[int, str] = {}
+        self.lock = threading.Lock()
+        self.pid = os.getpid()
+        self.origin = time.perf_counter()
+
+    def now_us(self) -> float:
+        """Microseconds since tracer start"""
+        return (time.perf_counter() - self.origin) * 1_000_000
+
+    def span(self, name: str, cat: str = "app", **args):
+        """Context manager timing the enclosed block (free when tracing is off)"""
+        if not self.enabled:
+            return NULL_SPAN
+        return self._span(name, cat, args)
+
+    @contextmanager
+    def _span(self, name: str, cat: str, args: Dict[str, Any]):
+        start = self.now_us()
+        try:
+            yield
+        finally:
+            self.record(name, cat, start, self.now_us() - start, args)
+
+    def record(self, name: str, cat: str, start_us: float, duration_us: float, args: Optional[Dict] = None) -> None:
+        """Append one complete event"""
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": round(start_us, 3),
+            "dur": round(duration_us, 3),
+            "pid": self.pid,
+            "tid": thread.ident,
+        }
+        if args:
+            event["args"] = {k: v if isinstance(v, (int, float, bool)) else str(v) for k, v in args.items()}
+        with self.lock:
+            self.events.append(event)
+            self.thread_names.setdefault(thread.ident, thread.name)
+
+    def instant(self, name: str, cat: str = "app", **args) -> None:
+        """Record a zero-duration marker"""
+        if self.enabled:
+            self.record(name, cat, self.now_us(), 0, args)
+
+    def export(self, path: Optional[str] = None) -> None:
+        """Write collected events as Chrome trace-event JSON"""
+        path = path or self.path
+        if not path:
+            return
+        with self.lock:
+            events = list(self.events)
+            metadata = [
+                {"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": name}}
+                for tid, name in self.thread_names.items()
+            ]
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, handle)
+
+
+def traced(name: Optional[str] = None, cat: str = "app") -> Callable:
+    """Decorator wrapping a method (or generator method such as compose) in a span"""
+    def decorator(fn: Callable) -> Callable:
+        def span_name(args) -> str:
+            if name:
+                return name
+            if args:
+                return f"{type(args[0]).__name__}.{fn.__name__}"
+            return fn.__name__
+
+        if inspect.isgeneratorfunction(fn):
+            @functools.wraps(fn)
+            def generator_wrapper(*args, **kwargs):
+                if not tracer.enabled:
+                    return (yield from fn(*args, **kwargs))
+                with tracer.span(span_name(args), cat):
+                    return (yield from fn(*args, **kwargs))
+            return generator_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return fn(*args, **kwargs)
+            with tracer.span(span_name(args), cat):
+                return fn(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+# Global tracer instance
+tracer = Tracer(config.trace_path)
+if tracer.enabled:
+    atexit.register(tracer.export)
@@ -0,0 +1,219 @@
+"""
+Value Index Utility
+Per-schema, per-field top-K distinct values for autocomplete
+
+Counts use the Space-Saving heavy-hitter algorithm, so memory per field
+stays at `capacity` counters however many distinct values a field has.
+Indexes are fed from records the UI has already loaded or synced and
+are persisted under the local cache directory, together with a bounded
+record id -> version signature LRU so records counted in an earlier run
+are not counted again.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from textual.suggester import Suggester
+
+from config import config
+
+
+# Fields never worth suggesting (unique or machine generated)
+SKIP_FIELDS = {"id", "_metadata", "selected", "created_at", "modified_at", "updated_at", "version"}
+
+# Longer strings are free text rather than categorical values
+MAX_VALUE_LENGTH = 64
+
+# Record versions remembered per schema (least recently seen are forgotten first)
+SEEN_LIMIT = 5000
+
+
+class SpaceSaving:
+    """Approximate top-K counter: the evicted minimum's count carries over as error"""
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+
+    def add(self, value: str, weight: int = 1) -> None:
+        if value in self.counts:
+            self.counts[value] += weight
+            return
+        if len(self.counts) < self.capacity:
+            self.counts[value] = weight
+            self.errors[value] = 0
+            return
+        # Replace the current minimum; its count becomes this value's overestimate
+        victim = min(self.counts, key=self.counts.get)
+        floor = self.counts.pop(victim)
+        self.errors.pop(victim, None)
+        self.counts[value] = floor + weight
+        self.errors[value] = floor
+
+    def top(self, k: int = 10) -> List[Tuple[str, int]]:
+        return sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))[:k]
+
+    def to_dict(self) -> Dict:
+        return {"counts": self.counts, "errors": self.errors}
+
+    @classmethod
+    def from_dict(cls, data: Dict, capacity: int) -> "SpaceSaving":
+        counter = cls(capacity)
+        counter.counts = {str(k): int(v) for k, v in data.get("counts", {}).items()}
+        counter.errors = {str(k): int(v) for k, v in data.get("errors", {}).items()}
+        return counter
+
+
+class ValueIndex:
+    """Top values of every categorical field of one schema"""
+
+    def __init__(self, schema: str, path: str, capacity: int = 64, seen_limit: int = SEEN_LIMIT):
+        self.schema = schema
+        self.path = path
+        self.capacity = capacity
+        self.seen_limit = seen_limit
+        self.fields: Dict[str, SpaceSaving] = {}
+        self.seen: "OrderedDict[str, str]" = OrderedDict()  # record id -> signature of the version counted
+        self.dirty = False
+        self.lock = threading.Lock()
+
+    def observe(self, records: Iterable[Dict]) -> None:
+        """Count field values of newly seen records"""
+        with self.lock:
+            for record in records:
+                if not isinstance(record, Mapping):
+                    continue
+                values = {name: str(value) for name, value in record.items() if self._indexable(name, value)}
+                # Re-loading or re-paging the same record version must not inflate counts
+                signature = hashlib.sha1(json.dumps(sorted(values.items())).encode("utf-8")).hexdigest()[:16]
+                key = str(record["id"]) if record.get("id") is not None else signature
+                if self.seen.get(key) == signature:
+                    self.seen.move_to_end(key)
+                    continue
+                self.seen[key] = signature
+                self.seen.move_to_end(key)
+                if len(self.seen) > self.seen_limit:
+                    self.seen.popitem(last=False)
+                for name, text in values.items():
+                    counter = self.fields.get(name)
+                    if counter is None:
+                        counter = self.fields[name] = SpaceSaving(self.capacity)
+                    counter.add(text)
+                    self.dirty = True
+
+    @staticmethod
+    def _indexable(name: str, value) -> bool:
+        if name in SKIP_FIELDS or name.startswith("_"):
+            return False
+        if value is None or isinstance(value, (bool, dict, list)):
+            return False
+        return 0 < len(str(value)) <= MAX_VALUE_LENGTH
+
+    def top(self, field: str, k: int = 10) -> List[str]:
+        counter = self.fields.get(field)
+        return [value for value, _ in counter.top(k)] if counter else []
+
+    def suggest(self, field: str, prefix: str, case_sensitive: bool = False) -> Optional[str]:
+        """Most frequent value of a field starting with prefix"""
+        counter = self.fields.get(field)
+        if counter is None or not prefix:
+            return None
+        needle = prefix if case_sensitive else prefix.casefold()
+        for value, _ in counter.top(self.capacity):
+            candidate = value if case_sensitive else value.casefold()
+            if candidate.startswith(needle) and len(value) > len(prefix):
+                return value
+        return None
+
+    def field_names(self) -> List[str]:
+        return sorted(self.fields)
+
+    # Persistence
+
+    def load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return
+        with self.lock:
+            self.fields = {name: SpaceSaving.from_dict(counter, self.capacity)
+                           for name, counter in data.get("fields", {}).items()}
+            self.seen = OrderedDict((str(key), str(signature))
+                                    for key, signature in data.get("seen", [])[-self.seen_limit:])
+
+    def save(self) -> None:
+        """Write atomically if anything changed since the last save"""
+        with self.lock:
+            if not self.dirty:
+                return
+            data = {"schema": self.schema, "fields": {n: c.to_dict() for n, c in self.fields.items()},
+                    "seen": list(self.seen.items())}
+            self.dirty = False
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(data, handle)
+        os.replace(temp_path, self.path)
+
+
+class ValueIndexRegistry:
+    """Lazily loaded value indexes, one per (server, tenant, schema)"""
+
+    def __init__(self, directory: str, capacity: int = 64):
+        self.directory = directory
+        self.capacity = capacity
+        self.indexes: Dict[Tuple[str, str, str], ValueIndex] = {}
+        self.lock = threading.Lock()
+
+    def get(self, schema: str, server: Optional[str] = None, tenant: Optional[str] = None) -> ValueIndex:
+        key = (server or "default", tenant or "default", schema)
+        with self.lock:
+            index = self.indexes.get(key)
+            if index is None:
+                safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in "__".join(key))
+                index = ValueIndex(schema, os.path.join(self.directory, f"{safe}.json"), self.capacity)
+                index.load()
+                self.indexes[key] = index
+            return index
+
+    def observe(self, schema: str, records: Iterable[Dict], server: Optional[str] = None,
+                tenant: Optional[str] = None) -> None:
+        self.get(schema, server, tenant).observe(records)
+
+    def save_all(self) -> None:
+        with self.lock:
+            indexes = list(self.indexes.values())
+        for index in indexes:
+            try:
+                index.save()
+            except OSError:
+                pass
+
+
+class IndexSuggester(Suggester):
+    """Input suggester completing values from a field's value index"""
+
+    def __init__(self, index: ValueIndex, field: Callable[[], Optional[str]]):
+        # The field can change under the same input (filter builder), so no caching
+        super().__init__(use_cache=False, case_sensitive=True)
+        self.index = index
+        self.field = field
+
+    async def get_suggestion(self, value: str) -> Optional[str]:
+        field = self.field()
+        if not field:
+            return None
+        return self.index.suggest(field, value)
+
+
+# Global registry instance
+value_indexes = ValueIndexRegistry(os.path.join(config.cache_dir, "value_index"), config.value_index_size)
+atexit.register(value_indexes.save_all)
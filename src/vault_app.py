@@ -7,12 +7,17 @@ from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.widgets import Footer, Header
 from textual.screen import Screen
+from typing import Optional
 
 from screens.auth_screen import AuthScreen
 from screens.overseer_screen import OverseerScreen
 from theme.vault_theme import VAULT_CSS
 from widgets.vault_footer import VaultFooter
 from api.monk_client import monk
+from api.session_keeper import session_keeper
+from utils.screen_cache import ScreenCache
+from utils.tracing import tracer
+from config import config
 
 
 class VaultApp(App):
@@ -33,6 +38,16 @@ class VaultApp(App):
         self.current_vault = None
         self.authenticated = False
         self.vault_footer = None
+        self.screen_cache = ScreenCache(self, config.screen_cache_size)
+        
+        # What the first screens after login read - warmed in the background after each login
+        from screens.schema_lab_screen import SchemaLabScreen
+        from screens.population_management_screen import PopulationManagementScreen
+        session_keeper.warmers = [
+            monk.auth_snapshot,
+            lambda: SchemaLabScreen.list_pager().first_page(),
+            lambda: PopulationManagementScreen.list_pager().first_page(),
+        ]
 
     def compose(self) -> ComposeResult:
         """Compose the main application layout"""
@@ -51,6 +66,13 @@ class VaultApp(App):
             from screens.welcome_screen import WelcomeScreen
             self.push_screen(WelcomeScreen())
 
+    async def run_action(self, action, default_namespace=None) -> bool:
+        """Run a bound action, wrapped in a trace span when VAULT_TRACE is set"""
+        if not tracer.enabled:
+            return await super().run_action(action, default_namespace)
+        with tracer.span(f"action {action}", "action", screen=type(self.screen).__name__):
+            return await super().run_action(action, default_namespace)
+
     def action_help(self) -> None:
         """Show help documentation"""
         self.bell()
@@ -65,12 +87,18 @@ class VaultApp(App):
         """Quit the application"""
         self.exit()
 
-    def authenticate_user(self, user_data: dict) -> None:
+    def authenticate_user(self, user_data: dict, password: Optional[str] = None) -> None:
         """Handle successful authentication"""
         self.current_user = user_data.get("username")
         self.current_vault = user_data.get("vault_id") 
         self.authenticated = True
         
+        # Renew the session before it expires (only possible when we were given the password)
+        session_keeper.start(self, self.current_vault, self.current_user, password)
+        
+        # Cached module screens belong to the previous session
+        self.screen_cache.clear()
+        
         # Switch to main dashboard
         self.pop_screen()  # Remove auth screen
         self.push_screen(OverseerScreen())
@@ -80,6 +108,8 @@ class VaultApp(App):
         self.current_user = None
         self.current_vault = None
         self.authenticated = False
+        self.screen_cache.clear()
+        session_keeper.stop()
         
         # Return to authentication
         self.pop_screen()  # Remove current screen
@@ -7,7 +7,10 @@ from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.widget import Widget
 from textual.widgets import Static
-import json
+import time
+
+from config import config
+from widgets.trace_feed import RateMeter, TraceChannel, format_command, preview
 
 
 class SendTrace(Widget):
@@ -29,41 +32,50 @@ class SendTrace(Widget):
         width: 100%;
         overflow: hidden;
     }
+    
+    .rate-display {
+        width: 26;
+        color: #ffb000;
+        text-align: right;
+        text-style: dim;
+    }
     """
 
     def __init__(self):
         super().__init__()
         self.current_command = ""
+        self.channel = TraceChannel("CMD", "", clear_after=2.0)
+        self.meter = RateMeter()
 
     def compose(self) -> ComposeResult:
         """Build the command trace"""
         with Horizontal():
             yield Static("CMD: Vault-Tec command trace ready...", id="command_text", classes="command-display")
+            yield Static("", id="command_rate", classes="rate-display")
 
-    def show_command(self, command: str, data: dict = None) -> None:
-        """Display a command execution (briefly)"""
-        # Format command with optional JSON data
-        display_text = f"monk {command}"
-        if data:
-            json_str = json.dumps(data, separators=(',', ':'))  # Compact JSON
-            if len(json_str) > 50:
-                json_str = json_str[:47] + "..."
-            display_text += f" {json_str}"
-        
-        # Truncate if too long
-        if len(display_text) > 120:
-            display_text = display_text[:117] + "..."
-        
-        # Update display
-        self.current_command = display_text
-        command_display = self.query_one("#command_text", Static)
-        command_display.update(f"CMD: {display_text}")
-        
-        # Clear after brief delay
-        self.set_timer(2.0, self.clear_command)
+    def on_mount(self) -> None:
+        """Repaint at most once per frame"""
+        self.set_interval(1 / max(1, config.trace_fps), self.flush)
+
+    def show_command(self, command: str, data: dict = None, size: int = 0) -> None:
+        """Queue a command execution for display (safe from worker threads)"""
+        self.channel.post(command, data)
+        self.meter.record(size + len(command), commands=1)
+
+    def flush(self) -> None:
+        """Paint the latest command and the rate meter if they changed"""
+        now = time.monotonic()
+        text = self.channel.take(format_command, now)
+        if text is not None:
+            self.current_command = text
+            self.query_one("#command_text", Static).update(text)
+        rate = self.meter.sample(now)
+        if rate is not None:
+            self.query_one("#command_rate", Static).update(rate)
     
     def clear_command(self) -> None:
         """Clear the command display"""
+        self.channel.pending = None
         command_display = self.query_one("#command_text", Static)
         command_display.update("")
 
@@ -87,41 +99,47 @@ class RecvTrace(Widget):
         overflow: hidden;
         text-style: dim;
     }
+    
+    .rate-display {
+        width: 26;
+        color: #22c55e;
+        text-align: right;
+        text-style: dim;
+    }
     """
 
     def compose(self) -> ComposeResult:
         """Build the response trace"""
         with Horizontal():
             yield Static("RSP: Vault-Tec response trace ready...", id="response_text", classes="response-display")
+            yield Static("", id="response_rate", classes="rate-display")
+
+    def __init__(self):
+        super().__init__()
+        self.channel = TraceChannel("RSP", "", clear_after=1.5)
+        self.meter = RateMeter()
+
+    def on_mount(self) -> None:
+        """Repaint at most once per frame"""
+        self.set_interval(1 / max(1, config.trace_fps), self.flush)
+
+    def show_response(self, data: any, size: int = 0) -> None:
+        """Queue a response for display (safe from worker threads)"""
+        self.channel.post(data)
+        self.meter.record(size, commands=1)
 
-    def show_response(self, data: any) -> None:
-        """Display a JSON response (briefly)"""
-        try:
-            if isinstance(data, (dict, list)):
-                # Convert to compact JSON
-                json_str = json.dumps(data, separators=(',', ':'))
-            else:
-                # Raw text response
-                json_str = str(data)
-            
-            # Truncate if too long
-            if len(json_str) > 150:
-                json_str = json_str[:147] + "..."
-                
-            # Update display
-            response_display = self.query_one("#response_text", Static)
-            response_display.update(f"RSP: {json_str}")
-            
-            # Clear after brief delay
-            self.set_timer(1.5, self.clear_response)
-            
-        except Exception:
-            # Fallback for unparseable data
-            response_display = self.query_one("#response_text", Static)
-            response_display.update("RSP: [unparseable response]")
-            self.set_timer(1.5, self.clear_response)
+    def flush(self) -> None:
+        """Paint the latest response preview and the rate meter if they changed"""
+        now = time.monotonic()
+        text = self.channel.take(preview, now)
+        if text is not None:
+            self.query_one("#response_text", Static).update(text)
+        rate = self.meter.sample(now)
+        if rate is not None:
+            self.query_one("#response_rate", Static).update(rate)
     
     def clear_response(self) -> None:
         """Clear the response display"""
+        self.channel.pending = None
         response_display = self.query_one("#response_text", Static)
         response_display.update("")
\ No newline at end of file
@@ -29,6 +29,7 @@ class KillboxTable(DataTable):
         self.id_field = id_field
         self.on_select_callback = on_select
         self.max_items = max_items
+        self.page = 0  # Pages of max_items rows, killboxes numbered per page
         
         # DataTable setup
         self.show_header = False
@@ -46,6 +47,7 @@ class KillboxTable(DataTable):
         """Populate table with data and killbox notation"""
         if data is not None:
             self.data_items = data
+            self.page = 0
         
         # Setup columns first
         self.setup_columns()
@@ -57,7 +59,7 @@ class KillboxTable(DataTable):
             return
         
         # Add data rows with killbox notation
-        for i, item in enumerate(self.data_items[:self.max_items]):
+        for i, item in enumerate(self.page_items()):
             killbox = f"[{i+1}]"
             
             # Build row data from item fields
@@ -69,6 +71,38 @@ class KillboxTable(DataTable):
             
             self.add_row(*row_data)
 
+    def page_items(self) -> List[Dict[str, Any]]:
+        """Items on the current page"""
+        start = self.page * self.max_items
+        return self.data_items[start:start + self.max_items]
+
+    def page_count(self) -> int:
+        return max(1, -(-len(self.data_items) // self.max_items))
+
+    def next_page(self) -> bool:
+        """Show the next page of items, returning False on the last page"""
+        if self.page + 1 >= self.page_count():
+            return False
+        self.page += 1
+        self.populate_data()
+        return True
+
+    def prev_page(self) -> bool:
+        """Show the previous page of items, returning False on the first page"""
+        if self.page == 0:
+            return False
+        self.page -= 1
+        self.populate_data()
+        return True
+
+    def sort_by(self, column: str, descending: bool = False) -> None:
+        """Sort items by a column's displayed value and return to the first page.
+        Lists fed from monk data select should page server-side (utils.keyset_pager)."""
+        self.data_items = sorted(self.data_items, key=lambda item: str(self.get_field_value(item, column)),
+                                 reverse=descending)
+        self.page = 0
+        self.populate_data()
+
     def get_field_value(self, item: Dict[str, Any], field_path: str) -> Any:
         """Get field value from item, supporting dot notation"""
         try:
@@ -112,20 +146,22 @@ class KillboxTable(DataTable):
     def on_row_selected(self, event) -> None:
         """Handle ENTER key or row selection"""
         if self.on_select_callback and event.cursor_row >= 0:
-            if event.cursor_row < len(self.data_items):
-                selected_item = self.data_items[event.cursor_row]
-                self.on_select_callback(event.cursor_row, selected_item)
+            index = self.page * self.max_items + event.cursor_row
+            if event.cursor_row < self.max_items and index < len(self.data_items):
+                selected_item = self.data_items[index]
+                self.on_select_callback(index, selected_item)
 
     def get_selected_item(self) -> Optional[Dict[str, Any]]:
         """Get currently selected item"""
-        if 0 <= self.cursor_row < len(self.data_items):
-            return self.data_items[self.cursor_row]
+        items = self.page_items()
+        if 0 <= self.cursor_row < len(items):
+            return items[self.cursor_row]
         return None
         
     def get_binding_methods(self, action_prefix: str) -> List[Binding]:
         """Generate killbox bindings for this table"""
         bindings = []
-        for i in range(min(len(self.data_items), self.max_items)):
+        for i in range(len(self.page_items())):
             num = str(i + 1)
             bindings.append(
                 Binding(num, f"{action_prefix}_{num}", "\u200b", show=False)
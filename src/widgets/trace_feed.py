@@ -0,0 +1,136 @@
+"""
+Trace Feed
+Cheap, thread-safe hand-off from monk execution to the trace widgets
+
+Executions only post the latest command/response and bump counters;
+the widgets format and paint at most once per frame.
+"""
+
+import json
+import threading
+import time
+from typing import Any, Iterator, Optional, Tuple
+
+
+def _json_chunks(value: Any, budget: int) -> Iterator[str]:
+    """Compact JSON for value, generated lazily so callers can stop early"""
+    if isinstance(value, dict):
+        yield "{"
+        for index, (key, item) in enumerate(value.items()):
+            if index:
+                yield ","
+            yield json.dumps(str(key)[:budget])
+            yield ":"
+            yield from _json_chunks(item, budget)
+        yield "}"
+    elif isinstance(value, (list, tuple)):
+        yield "["
+        for index, item in enumerate(value):
+            if index:
+                yield ","
+            yield from _json_chunks(item, budget)
+        yield "]"
+    elif isinstance(value, str):
+        # Never escape more of a long string than could be shown
+        yield json.dumps(value[:budget])
+    else:
+        try:
+            yield json.dumps(value)
+        except (TypeError, ValueError):
+            yield json.dumps(str(value)[:budget])
+
+
+def preview(data: Any, limit: int = 150) -> str:
+    """Compact one-line preview of data, encoding no more than limit characters"""
+    if not isinstance(data, (dict, list, tuple)):
+        text = str(data[:limit + 1] if isinstance(data, str) else data)
+    else:
+        parts = []
+        size = 0
+        for chunk in _json_chunks(data, limit):
+            parts.append(chunk)
+            size += len(chunk)
+            if size > limit:
+                break
+        text = "".join(parts)
+    if len(text) > limit:
+        text = text[:limit - 3] + "..."
+    return text.replace("\n", " ")
+
+
+def format_command(command: str, data: Optional[dict] = None, limit: int = 120) -> str:
+    """One-line `monk <command> <json>` preview"""
+    text = f"monk {command}"
+    if data:
+        text += " " + preview(data, 50)
+    if len(text) > limit:
+        text = text[:limit - 3] + "..."
+    return text
+
+
+class TraceChannel:
+    """Latest item posted for one trace line, cleared after it has been idle"""
+
+    def __init__(self, prefix: str, idle_text: str, clear_after: float):
+        self.prefix = prefix
+        self.idle_text = idle_text
+        self.clear_after = clear_after
+        self.pending: Optional[Tuple] = None
+        self.posted_at = 0.0
+        self.showing = False
+
+    def post(self, *item) -> None:
+        """Replace the pending item (called from any thread, never formats)"""
+        self.pending = item
+        self.posted_at = time.monotonic()
+
+    def take(self, render, now: float) -> Optional[str]:
+        """Text to paint this frame, or None if the line is unchanged"""
+        item, self.pending = self.pending, None
+        if item is not None:
+            self.showing = True
+            return f"{self.prefix}: {render(*item)}"
+        if self.showing and now - self.posted_at >= self.clear_after:
+            self.showing = False
+            return self.idle_text
+        return None
+
+
+def _human_bytes(rate: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if rate < 1024:
+            return f"{rate:.0f} {unit}/s" if unit == "B" else f"{rate:.1f} {unit}/s"
+        rate /= 1024
+    return f"{rate:.1f} GB/s"
+
+
+class RateMeter:
+    """Commands/sec and bytes/sec over roughly one-second windows"""
+
+    def __init__(self, window: float = 1.0):
+        self.window = window
+        self.lock = threading.Lock()
+        self.commands = 0
+        self.bytes = 0
+        self.window_start = time.monotonic()
+        self.text = ""
+
+    def record(self, nbytes: int = 0, commands: int = 0) -> None:
+        with self.lock:
+            self.commands += commands
+            self.bytes += nbytes
+
+    def sample(self, now: float) -> Optional[str]:
+        """New meter text once per window, None in between or when unchanged"""
+        elapsed = now - self.window_start
+        if elapsed < self.window:
+            return None
+        with self.lock:
+            commands, nbytes = self.commands, self.bytes
+            self.commands = self.bytes = 0
+        self.window_start = now
+        text = f"{commands / elapsed:.1f} cmd/s {_human_bytes(nbytes / elapsed)}" if commands or nbytes else ""
+        if text == self.text:
+            return None
+        self.text = text
+        return text
@@ -2,7 +2,10 @@
 Vault-Tec styled container widgets
 """
 
-from textual.containers import Container
+from typing import Callable
+
+from textual.app import ComposeResult
+from textual.containers import Container, Vertical
 from textual.widget import Widget
 from textual.widgets import Static
 
@@ -17,6 +20,35 @@ class VaultContainer(Container):
         self.add_class("vault-container")
 
 
+class ComposedSection(Vertical):
+    """Section whose children come from a compose-style callback, so a screen can rebuild it when data lands"""
+    
+    DEFAULT_CSS = """
+    ComposedSection {
+        height: auto;
+    }
+    """
+    
+    def __init__(self, build: Callable[[], ComposeResult], **kwargs):
+        super().__init__(**kwargs)
+        self.build = build
+    
+    def compose(self) -> ComposeResult:
+        yield from self.build()
+    
+    async def rebuild(self) -> "ComposedSection":
+        """Swap in a freshly composed copy of this section at the same position"""
+        parent = self.parent
+        position = parent.children.index(self)
+        fresh = ComposedSection(self.build, id=self.id, classes=" ".join(self.classes))
+        await self.remove()
+        if position < len(parent.children):
+            await parent.mount(fresh, before=position)
+        else:
+            await parent.mount(fresh)
+        return fresh
+
+
 class StatusIndicator(Static):
     """Status indicator with color coding"""
     
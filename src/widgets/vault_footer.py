@@ -3,10 +3,13 @@ Enhanced Vault-Tec Footer with Command Traces
 """
 
 from textual.app import ComposeResult
-from textual.containers import Container, Vertical
+from textual.containers import Container, Horizontal, Vertical
 from textual.widget import Widget
 from textual.widgets import Static
-import json
+import time
+
+from config import config
+from widgets.trace_feed import RateMeter, TraceChannel, format_command, preview
 
 
 class VaultFooter(Widget):
@@ -27,6 +30,23 @@ class VaultFooter(Widget):
         text-style: bold;
     }
     
+    .trace-row {
+        height: 1;
+    }
+    
+    .send-trace, .recv-trace {
+        width: 1fr;
+    }
+    
+    .trace-rate {
+        width: 26;
+        height: 1;
+        background: #0a0a0a;
+        color: #ffb000;
+        text-align: right;
+        text-style: dim;
+    }
+    
     .recv-trace {
         height: 1;
         background: #0a0a0a;  
@@ -42,68 +62,64 @@ class VaultFooter(Widget):
     }
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Filled from any thread by MonkClient, painted at most once per frame
+        self.send_channel = TraceChannel("CMD", "CMD: Ready...", clear_after=2.0)
+        self.recv_channel = TraceChannel("RSP", "RSP: Ready...", clear_after=1.5)
+        self.send_meter = RateMeter()
+        self.recv_meter = RateMeter()
+
     def compose(self) -> ComposeResult:
         """Build the enhanced footer"""
         with Vertical():
-            yield Static("CMD: Vault-Tec send_trace ready...", id="send_trace_text", classes="send-trace")
-            yield Static("RSP: Vault-Tec recv_trace ready...", id="recv_trace_text", classes="recv-trace") 
+            with Horizontal(classes="trace-row"):
+                yield Static("CMD: Vault-Tec send_trace ready...", id="send_trace_text", classes="send-trace")
+                yield Static("", id="send_rate", classes="trace-rate")
+            with Horizontal(classes="trace-row"):
+                yield Static("RSP: Vault-Tec recv_trace ready...", id="recv_trace_text", classes="recv-trace")
+                yield Static("", id="recv_rate", classes="trace-rate")
             yield Static("CTRL+C Quit | H Help | ⏎ Execute | ESC Back", id="key_bindings", classes="key-bindings")
 
-    def show_send_trace(self, command: str, data: dict = None) -> None:
-        """Display a command execution (briefly)"""
-        # Format command with optional JSON data
-        display_text = f"monk {command}"
-        if data:
-            json_str = json.dumps(data, separators=(',', ':'))  # Compact JSON
-            if len(json_str) > 50:
-                json_str = json_str[:47] + "..."
-            display_text += f" {json_str}"
-        
-        # Truncate if too long
-        if len(display_text) > 120:
-            display_text = display_text[:117] + "..."
-        
-        # Update display
-        send_trace = self.query_one("#send_trace_text", Static)
-        send_trace.update(f"CMD: {display_text}")
-        
-        # Clear after brief delay
-        self.set_timer(2.0, self.clear_send_trace)
+    def on_mount(self) -> None:
+        """Start the single repaint loop"""
+        self.set_interval(1 / max(1, config.trace_fps), self.flush_traces)
+
+    def show_send_trace(self, command: str, data: dict = None, size: int = 0) -> None:
+        """Queue a command execution for display (safe from worker threads)"""
+        self.send_channel.post(command, data)
+        self.send_meter.record(size + len(command), commands=1)
+    
+    def show_recv_trace(self, data: any, size: int = 0) -> None:
+        """Queue a response for display (safe from worker threads)"""
+        self.recv_channel.post(data)
+        self.recv_meter.record(size, commands=1)
     
-    def show_recv_trace(self, data: any) -> None:
-        """Display a JSON response (briefly)"""
-        try:
-            if isinstance(data, (dict, list)):
-                # Convert to compact JSON
-                json_str = json.dumps(data, separators=(',', ':'))
-            else:
-                # Raw text response
-                json_str = str(data)
-            
-            # Truncate if too long
-            if len(json_str) > 150:
-                json_str = json_str[:147] + "..."
-                
-            # Update display
-            recv_trace = self.query_one("#recv_trace_text", Static)
-            recv_trace.update(f"RSP: {json_str}")
-            
-            # Clear after brief delay
-            self.set_timer(1.5, self.clear_recv_trace)
-            
-        except Exception:
-            # Fallback for unparseable data
-            recv_trace = self.query_one("#recv_trace_text", Static)
-            recv_trace.update("RSP: [unparseable response]")
-            self.set_timer(1.5, self.clear_recv_trace)
+    def flush_traces(self) -> None:
+        """Paint whatever changed since the last frame"""
+        now = time.monotonic()
+        send_text = self.send_channel.take(format_command, now)
+        if send_text is not None:
+            self.query_one("#send_trace_text", Static).update(send_text)
+        recv_text = self.recv_channel.take(preview, now)
+        if recv_text is not None:
+            self.query_one("#recv_trace_text", Static).update(recv_text)
+        send_rate = self.send_meter.sample(now)
+        if send_rate is not None:
+            self.query_one("#send_rate", Static).update(send_rate)
+        recv_rate = self.recv_meter.sample(now)
+        if recv_rate is not None:
+            self.query_one("#recv_rate", Static).update(recv_rate)
     
     def clear_send_trace(self) -> None:
         """Clear the send trace display"""
+        self.send_channel.pending = None
         send_trace = self.query_one("#send_trace_text", Static)
         send_trace.update("CMD: Ready...")
     
     def clear_recv_trace(self) -> None:
         """Clear the recv trace display"""
+        self.recv_channel.pending = None
         recv_trace = self.query_one("#recv_trace_text", Static)
         recv_trace.update("RSP: Ready...")
         
@@ -0,0 +1,8 @@
+"""
+Test configuration - modules import from src/ the same way the app does
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
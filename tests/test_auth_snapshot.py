@@ -0,0 +1,33 @@
+"""
+Auth snapshot expiry - UTC "...Z" expiries against the local clock
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from api.auth_snapshot import AuthSnapshot
+from utils.session_timer import SessionTimer
+
+
+def utc_text(delta: timedelta) -> str:
+    return (datetime.now(timezone.utc) + delta).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def test_z_suffix_parses_as_utc():
+    parsed = SessionTimer.parse_expires_output("2030-01-18T20:30:22Z")
+    assert parsed == datetime(2030, 1, 18, 20, 30, 22, tzinfo=timezone.utc)
+
+
+def test_utc_expiry_is_judged_against_utc_now():
+    live = AuthSnapshot(authenticated=True, expires_at=SessionTimer.parse_expires_output(utc_text(timedelta(minutes=5))))
+    dead = AuthSnapshot(authenticated=True, expires_at=SessionTimer.parse_expires_output(utc_text(timedelta(minutes=-5))))
+    assert not live.expired
+    assert dead.expired
+    assert 0 < SessionTimer.seconds_until(live.expires_at) <= 300
+
+
+def test_expiry_without_timezone_defers_to_reported_verdict():
+    naive = SessionTimer.parse_expires_output("2000-01-01 00:00:00")
+    assert naive.tzinfo is None
+    assert SessionTimer.seconds_until(naive) is None
+    assert not AuthSnapshot(expires_at=naive).expired
+    assert AuthSnapshot(expires_at=naive, reported_expired=True).expired
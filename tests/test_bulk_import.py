@@ -0,0 +1,86 @@
+"""
+Bulk import - resuming after a batch whose outcome is unknown
+"""
+
+import contextlib
+import json
+import threading
+
+from api.bulk_import import BulkImporter
+from api.monk_client import MonkCommandResult
+
+
+class FakeClient:
+    """In-memory schema; create_many can be told to land only part of a batch and then fail"""
+
+    def __init__(self):
+        self.rows = []
+        self.partial_on = None      # id of a record whose batch lands half and then errors
+        self.lock = threading.Lock()
+
+    def priority(self, priority):
+        return contextlib.nullcontext()
+
+    def data_create_many(self, schema, records, timeout=30):
+        with self.lock:
+            if self.partial_on in [record.get("id") for record in records]:
+                self.partial_on = None
+                self.rows.extend(records[:1])
+                return MonkCommandResult(success=False, error="socket hang up")
+            self.rows.extend(records)
+            return MonkCommandResult(success=True, data=records)
+
+    def data_select(self, schema, filters=None, fields=None, timeout=None):
+        where = (filters or {}).get("where", {})
+        with self.lock:
+            hits = [row for row in self.rows if all(row.get(k) == v for k, v in where.items())]
+        return MonkCommandResult(success=True, data=hits[:(filters or {}).get("limit") or None])
+
+
+def write_source(tmp_path, records):
+    path = tmp_path / "people.ndjson"
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+    return str(path)
+
+
+def make_importer(tmp_path, client, source):
+    return BulkImporter("people", source, client=client, schema_definition={}, batch_size=2, parallelism=1,
+                        checkpoint_path=str(tmp_path / "checkpoint.json"))
+
+
+def test_resume_after_partial_batch_neither_skips_nor_duplicates(tmp_path):
+    records = [{"id": str(n), "name": f"person {n}"} for n in range(6)]
+    source = write_source(tmp_path, records)
+    client = FakeClient()
+    client.partial_on = "2"
+
+    first = make_importer(tmp_path, client, source).run()
+    assert not first.finished
+    assert "partially applied" in first.error
+
+    # Resuming with the half-landed batch still there stops again rather than re-sending it
+    again = make_importer(tmp_path, client, source).run()
+    assert not again.finished and "partial" in again.error
+
+    # Operator removes the stray row; the batch is now provably missing and gets sent
+    client.rows = [row for row in client.rows if row["id"] != "2"]
+    resumed = make_importer(tmp_path, client, source).run()
+    assert resumed.finished and not resumed.error
+    assert sorted(row["id"] for row in client.rows) == [str(n) for n in range(6)]
+    assert resumed.rows_imported == 6
+
+
+def test_batches_without_ids_are_unknown_and_stop_the_import(tmp_path):
+    source = write_source(tmp_path, [{"name": "a"}, {"name": "b"}])
+    client = FakeClient()
+    importer = make_importer(tmp_path, client, source)
+    checkpoint = importer.load_checkpoint()
+    checkpoint.sent_batches = [0]               # an earlier run sent it and stopped
+    importer.save_checkpoint(checkpoint)
+    # Same-valued rows that may or may not be ours - matching on values would call the batch applied
+    client.rows = [{"id": "x", "name": "a"}, {"id": "y", "name": "b"}]
+
+    progress = importer.run()
+    assert not progress.finished
+    assert "unknown" in progress.error
+    assert len(client.rows) == 2
@@ -0,0 +1,115 @@
+"""
+Columnar dataset cache - encodings, round-trips and queries
+"""
+
+import pytest
+
+from api.columnar_cache import (ColumnarFormatError, ColumnarTable, DatasetCache, DictColumn, FixedColumn, TextColumn,
+                                write_table)
+
+
+ROWS = [
+    {"id": "a1", "department": "eng", "age": 30, "score": 1.5, "hired": "2024-01-10",
+     "modified_at": "2025-08-27 14:22:11", "bio": "Builds things", "active": True, "tags": ["x"]},
+    {"id": "a2", "department": "ops", "age": None, "score": 2.25, "hired": "2023-11-20",
+     "modified_at": "2025-08-26 09:45:33", "bio": None, "active": False, "tags": []},
+    {"id": "a3", "department": "eng", "age": 52, "score": None, "hired": None,
+     "modified_at": "2025-08-28 12:30:15", "bio": "Runs things", "active": True, "tags": ["y", "z"]},
+    {"id": "a4", "department": None, "age": 25, "score": 0.5, "hired": "2024-06-01",
+     "modified_at": "2025-08-25 08:00:00", "bio": "Ünïcode ✓", "active": None, "tags": None},
+]
+
+
+@pytest.fixture
+def table(tmp_path):
+    path = str(tmp_path / "people.vcol")
+    write_table(path, ROWS, meta={"schema": "people"})
+    with ColumnarTable(path) as opened:
+        yield opened
+
+
+def test_round_trip(table):
+    assert len(table) == len(ROWS)
+    assert table.meta == {"schema": "people"}
+    assert table.fields == list(ROWS[0])
+    assert [table.row(index) for index in range(len(ROWS))] == ROWS
+    assert table[-1] == ROWS[-1]
+    assert table[1:3] == ROWS[1:3]
+
+
+def test_row_decodes_only_requested_fields(table):
+    assert table.row(2, ["id", "age", "missing"]) == {"id": "a3", "age": 52, "missing": None}
+    with pytest.raises(IndexError):
+        table.row(len(ROWS))
+
+
+def test_encodings(table):
+    assert isinstance(table.column("department"), DictColumn)
+    assert isinstance(table.column("id"), TextColumn)
+    assert isinstance(table.column("bio"), TextColumn)
+    assert isinstance(table.column("age"), FixedColumn)
+    assert isinstance(table.column("score"), FixedColumn)
+    assert table.column("missing") is None
+
+
+def test_dates_stored_as_timestamps_keep_their_text(table):
+    for name in ("hired", "modified_at"):
+        column = table.column(name)
+        assert isinstance(column, FixedColumn)
+        assert [column[index] for index in range(len(ROWS))] == [row[name] for row in ROWS]
+
+
+def test_mixed_date_formats_fall_back_to_text(tmp_path):
+    path = str(tmp_path / "mixed.vcol")
+    rows = [{"when": "2024-01-10"}, {"when": "2024-01-10 10:00:00"}, {"when": "soon"}]
+    write_table(path, rows)
+    with ColumnarTable(path) as opened:
+        assert not isinstance(opened.column("when"), FixedColumn)
+        assert opened[:] == rows
+
+
+def test_nulls_in_every_encoding(table):
+    assert table.row(3)["department"] is None      # dictionary null code
+    assert table.row(1)["age"] is None             # fixed-width null bitmap
+    assert table.row(2)["hired"] is None           # timestamp null bitmap
+    assert table.row(1)["bio"] is None             # text null bitmap
+    assert table.row(3)["tags"] is None            # JSON text null
+
+
+def test_non_string_values_round_trip_as_json(table):
+    assert [table.row(index)["tags"] for index in range(len(ROWS))] == [row["tags"] for row in ROWS]
+    assert [table.row(index)["active"] for index in range(len(ROWS))] == [row["active"] for row in ROWS]
+
+
+def test_query_filters_through_dictionary_and_plain_columns(table):
+    assert table.query({"department": "eng"}) == [0, 2]
+    assert table.query({"department": "eng", "age": {"$gt": 40}}) == [2]
+    assert table.query({"department": {"$in": ["ops", "eng"]}}) == [0, 1, 2]
+
+
+def test_query_ordering_and_limit(table):
+    ids = lambda indices: [table.row(index)["id"] for index in indices]
+    assert ids(table.query(order=["age asc"])) == ["a4", "a1", "a3", "a2"]  # nulls last
+    assert ids(table.query(order=["modified_at desc"])) == ["a3", "a1", "a2", "a4"]
+    assert ids(table.query(order=["department asc", "id desc"])) == ["a3", "a1", "a2", "a4"]
+    assert ids(table.query({"department": "eng"}, order=["age desc"], limit=1)) == ["a3"]
+
+
+def test_rejects_files_that_are_not_columnar(tmp_path):
+    empty = tmp_path / "empty.vcol"
+    empty.write_bytes(b"")
+    garbage = tmp_path / "garbage.vcol"
+    garbage.write_bytes(b"not a columnar file at all")
+    for path in (empty, garbage):
+        with pytest.raises(ColumnarFormatError):
+            ColumnarTable(str(path))
+
+
+def test_snapshots_are_kept_apart_per_server_and_tenant(tmp_path):
+    cache = DatasetCache(str(tmp_path))
+    cache.save("people", ROWS[:1], server="alpha", tenant="t1")
+    assert cache.open("people", server="alpha", tenant="t2") is None
+    assert cache.open("people", server="beta", tenant="t1") is None
+    with cache.open("people", server="alpha", tenant="t1") as opened:
+        assert opened[:] == ROWS[:1]
+        assert opened.meta["tenant"] == "t1"
@@ -0,0 +1,198 @@
+"""
+Filter result cache - normalisation, subsumption and row isolation
+"""
+
+from api.filter_cache import FilterCache, query_key, split_conditions
+from api.monk_client import MonkClient
+from api.transport import TransportResult
+from utils.compact_records import ValuePool, compact_rows
+
+
+ROWS = [
+    {"id": "1", "department": "eng", "status": "active", "age": 30},
+    {"id": "2", "department": "eng", "status": "suspended", "age": 41},
+    {"id": "3", "department": "ops", "status": "active", "age": 25},
+    {"id": "4", "department": "eng", "status": "active", "age": 52},
+]
+
+
+def eng_rows():
+    return [dict(row) for row in ROWS if row["department"] == "eng"]
+
+
+# split_conditions
+
+def test_split_conditions_expands_shorthand_and_operators():
+    atoms = split_conditions({"department": "eng", "age": {"$gt": 20, "$lt": 50}})
+    assert {"department": {"$eq": "eng"}} in atoms
+    assert {"age": {"$gt": 20}} in atoms
+    assert {"age": {"$lt": 50}} in atoms
+    assert len(atoms) == 3
+
+
+def test_split_conditions_flattens_nested_and():
+    atoms = split_conditions({"$and": [{"department": "eng"}, {"$and": [{"status": "active"}]}]})
+    assert atoms == [{"department": {"$eq": "eng"}}, {"status": {"$eq": "active"}}]
+
+
+def test_split_conditions_keeps_or_opaque():
+    where = {"$or": [{"department": "eng"}, {"department": "ops"}]}
+    assert split_conditions(where) == [where]
+
+
+def test_split_conditions_empty():
+    assert split_conditions(None) == []
+    assert split_conditions({}) == []
+
+
+# query_key
+
+def test_query_key_ignores_condition_order_and_shorthand():
+    a = {"where": {"department": "eng", "status": "active"}}
+    b = {"where": {"$and": [{"status": {"$eq": "active"}}, {"department": {"$eq": "eng"}}]}}
+    assert query_key("people", a) == query_key("people", b)
+
+
+def test_query_key_ignores_select_order():
+    assert query_key("people", {"select": ["id", "age"]}) == query_key("people", {"select": ["age", "id"]})
+
+
+def test_query_key_distinguishes_schema_order_and_limit():
+    base = {"where": {"department": "eng"}}
+    assert query_key("people", base) != query_key("staff", base)
+    assert query_key("people", base) != query_key("people", dict(base, limit=10))
+    assert query_key("people", dict(base, order=["age asc"])) != query_key("people", dict(base, order=["age desc"]))
+
+
+# Subsumption
+
+def test_exact_hit():
+    cache = FilterCache()
+    query = {"where": {"department": "eng"}}
+    cache.store("people", query, eng_rows())
+    assert [row["id"] for row in cache.lookup("people", query)] == ["1", "2", "4"]
+    assert cache.stats()["hits"] == 1
+
+
+def test_refinement_answered_from_complete_superset():
+    cache = FilterCache()
+    cache.store("people", {"where": {"department": "eng"}}, eng_rows())
+    rows = cache.lookup("people", {"where": {"department": "eng", "status": "active"}, "order": ["age desc"]})
+    assert [row["id"] for row in rows] == ["4", "1"]
+    assert cache.stats()["subsumed"] == 1
+
+
+def test_refinement_applies_limit_and_projection():
+    cache = FilterCache()
+    cache.store("people", {"where": {"department": "eng"}}, eng_rows())
+    rows = cache.lookup("people", {"where": {"department": "eng"}, "order": ["age asc"], "limit": 2,
+                                   "select": ["id"]})
+    assert rows == [{"id": "1"}, {"id": "2"}]
+
+
+def test_broader_query_is_not_answered_from_narrower_entry():
+    cache = FilterCache()
+    cache.store("people", {"where": {"department": "eng"}}, eng_rows())
+    assert cache.lookup("people", {"where": {}}) is None
+    assert cache.lookup("people", {"where": {"department": "ops"}}) is None
+
+
+def test_limited_result_that_filled_its_limit_is_incomplete():
+    cache = FilterCache()
+    cache.store("people", {"where": {"department": "eng"}, "limit": 3}, eng_rows())
+    # The exact query is still a hit, but it can't answer refinements - more rows may exist
+    assert cache.lookup("people", {"where": {"department": "eng"}, "limit": 3}) is not None
+    assert cache.lookup("people", {"where": {"department": "eng", "status": "active"}}) is None
+
+
+def test_short_limited_result_is_complete():
+    cache = FilterCache()
+    cache.store("people", {"where": {"department": "eng"}, "limit": 10}, eng_rows())
+    rows = cache.lookup("people", {"where": {"department": "eng", "status": "suspended"}})
+    assert [row["id"] for row in rows] == ["2"]
+
+
+def test_projected_entry_cannot_answer_queries_needing_other_columns():
+    cache = FilterCache()
+    projected = [{"id": row["id"], "department": row["department"]} for row in eng_rows()]
+    cache.store("people", {"where": {"department": "eng"}, "select": ["id", "department"]}, projected)
+    assert cache.lookup("people", {"where": {"department": "eng", "status": "active"},
+                                   "select": ["id", "department"]}) is None
+    assert cache.lookup("people", {"where": {"department": "eng"}}) is None
+
+
+def test_unsupported_operator_goes_to_server():
+    cache = FilterCache()
+    cache.store("people", {"where": {"department": "eng"}}, eng_rows())
+    assert cache.lookup("people", {"where": {"department": "eng", "name": {"$regex": "^A"}}}) is None
+
+
+def test_invalidate_drops_schema_entries():
+    cache = FilterCache()
+    cache.store("people", {"where": {}}, [dict(row) for row in ROWS])
+    cache.store("places", {"where": {}}, [{"id": "x"}])
+    cache.invalidate("people")
+    assert cache.lookup("people", {"where": {}}) is None
+    assert cache.lookup("places", {"where": {}}) is not None
+
+
+# Row isolation
+
+def test_mutating_returned_rows_does_not_touch_the_cache():
+    cache = FilterCache()
+    query = {"where": {"department": "eng"}}
+    cache.store("people", query, eng_rows())
+
+    rows = cache.lookup("people", query)
+    rows[0]["selected"] = True
+    rows[1].update({"bio": "loaded later"})
+
+    again = cache.lookup("people", query)
+    assert "selected" not in again[0]
+    assert "bio" not in again[1]
+    refined = cache.lookup("people", {"where": {"department": "eng", "status": "active"}})
+    assert all("selected" not in row for row in refined)
+
+
+def test_mutating_stored_rows_does_not_touch_the_cache():
+    cache = FilterCache()
+    query = {"where": {"department": "eng"}}
+    rows = compact_rows(eng_rows(), ValuePool())
+    cache.store("people", query, rows)
+    rows[0]["selected"] = True
+    rows[0]["status"] = "changed"
+
+    cached = cache.lookup("people", query)
+    assert "selected" not in cached[0]
+    assert cached[0]["status"] == "active"
+
+
+# Server/tenant scope
+
+def test_entries_are_scoped_by_server_and_tenant():
+    cache = FilterCache()
+    query = {"where": {"department": "eng"}}
+    cache.store("people", query, eng_rows(), scope="alpha/t1")
+    assert cache.lookup("people", query, scope="alpha/t1") is not None
+    assert cache.lookup("people", query, scope="alpha/t2") is None
+    assert cache.lookup("people", {"where": {"department": "eng", "status": "active"}}, scope="beta/t1") is None
+
+
+def test_client_drops_cached_rows_on_tenant_switch():
+    class Transport:
+        calls = 0
+
+        def run(self, args, stdin_payload, timeout):
+            Transport.calls += 1
+            return TransportResult(stdout='[{"id": "1"}]', stderr="", returncode=0, duration=0.01)
+
+    client = MonkClient(monk_binary="monk", transport=Transport())
+    client.tenant_use("t1")
+    client.data_select_cached("people", {"where": {}})
+    client.data_select_cached("people", {"where": {}})
+    assert Transport.calls == 2          # tenant use + one select
+    client.tenant_use("t2")
+    assert client.filter_cache.stats()["entries"] == 0
+    client.data_select_cached("people", {"where": {}})
+    assert Transport.calls == 4
+    assert client.cache_scope.endswith("/t2")
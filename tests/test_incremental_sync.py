@@ -0,0 +1,78 @@
+"""
+Incremental sync - watermark ties and merging
+"""
+
+from api.filter_cache import FilterCache, match_where
+from api.monk_client import MonkCommandResult
+from utils.incremental_sync import IncrementalSync
+
+
+class FakeClient:
+    """Schema rows answered through the local filter evaluator"""
+
+    def __init__(self, rows):
+        self.rows = [dict(row) for row in rows]
+        self.filter_cache = FilterCache()
+
+    def data_select(self, schema, filters=None, fields=None, timeout=None):
+        hits = [dict(row) for row in self.rows if match_where(row, (filters or {}).get("where"))]
+        if fields:
+            hits = [{name: row.get(name) for name in fields} for row in hits]
+        return MonkCommandResult(success=True, data=hits)
+
+
+ROWS = [
+    {"id": "1", "name": "a", "modified_at": "2025-01-01 10:00:00"},
+    {"id": "2", "name": "b", "modified_at": "2025-01-01 10:00:05"},
+]
+
+
+def loaded(client):
+    sync = IncrementalSync(client, "people")
+    rows = [dict(row) for row in client.rows]
+    sync.seed(rows)
+    return sync, rows
+
+
+def test_edit_in_the_watermark_second_is_picked_up():
+    client = FakeClient(ROWS)
+    sync, rows = loaded(client)
+    # Another record written in the same second as the watermark, after the load
+    client.rows[0].update(name="a2", modified_at="2025-01-01 10:00:05")
+    result = sync.refresh(rows)
+    assert result.success and result.changed == 1
+    assert next(row for row in result.rows if row["id"] == "1")["name"] == "a2"
+
+
+def test_unchanged_rows_at_the_watermark_are_not_reported():
+    client = FakeClient(ROWS)
+    sync, rows = loaded(client)
+    result = sync.refresh(rows)
+    assert result.success
+    assert (result.changed, result.added, result.deleted) == (0, 0, 0)
+    assert result.describe() == "up to date"
+    assert sync.watermark == "2025-01-01 10:00:05"
+
+
+def test_new_tied_record_is_added_only_when_the_whole_set_is_loaded():
+    client = FakeClient(ROWS)
+    sync, rows = loaded(client)
+    client.rows.append({"id": "3", "name": "c", "modified_at": "2025-01-01 10:00:05"})
+    assert sync.refresh(rows, include_new=False).added == 0
+    result = sync.refresh(rows)
+    assert result.added == 1 and [row["id"] for row in result.rows] == ["1", "2", "3"]
+
+
+def test_watermark_never_moves_backwards():
+    client = FakeClient(ROWS)
+    sync, _ = loaded(client)
+    sync.seed([{"id": "9", "modified_at": "2024-12-31 23:59:59"}])
+    assert sync.watermark == "2025-01-01 10:00:05"
+
+
+def test_deleted_rows_are_dropped():
+    client = FakeClient(ROWS)
+    sync, rows = loaded(client)
+    client.rows = client.rows[1:]
+    result = sync.refresh(rows)
+    assert result.deleted == 1 and [row["id"] for row in result.rows] == ["2"]
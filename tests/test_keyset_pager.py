@@ -0,0 +1,77 @@
+"""
+Keyset pager - seek cursors across equal sort keys
+"""
+
+from api.filter_cache import match_where, sort_rows
+from api.monk_client import MonkCommandResult
+from utils.keyset_pager import KeysetPager
+
+
+class FakeClient:
+    """Evaluates pager filters locally the way the server would"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def data_select_cached(self, schema, filters=None, fields=None, timeout=None):
+        self.queries.append(filters)
+        rows = [row for row in self.rows if match_where(row, filters.get("where"))]
+        rows = sort_rows(rows, filters.get("order"))[:filters.get("limit")]
+        if fields:
+            rows = [{name: row.get(name) for name in fields} for row in rows]
+        return MonkCommandResult(success=True, data=rows)
+
+
+# Long runs of equal sort keys, some spanning page boundaries
+ROWS = [{"id": f"{n:02d}", "department": department}
+        for n, department in enumerate(["ops", "eng", "eng", "ops", "eng", "sales", "eng", "ops", "eng"])]
+
+
+def walk(pager):
+    ids = []
+    pager.first_page()
+    ids.extend(row["id"] for row in pager.rows)
+    while pager.next_page() is not None:
+        ids.extend(row["id"] for row in pager.rows)
+    return ids
+
+
+def expected(descending):
+    order = [f"department {'desc' if descending else 'asc'}", f"id {'desc' if descending else 'asc'}"]
+    return [row["id"] for row in sort_rows(list(ROWS), order)]
+
+
+def test_pages_cover_equal_sort_keys_exactly_once():
+    for descending in (False, True):
+        pager = KeysetPager(FakeClient(ROWS), "people", sort_field="department", descending=descending, page_size=2)
+        assert walk(pager) == expected(descending)
+        assert not pager.has_more
+
+
+def test_cursor_carries_the_key_of_the_last_tied_row():
+    client = FakeClient(ROWS)
+    pager = KeysetPager(client, "people", fields=["department"], sort_field="department", page_size=2)
+    pager.first_page()
+    assert [row["id"] for row in pager.rows] == ["01", "02"]
+    assert pager.cursors[1] == ("eng", "02")
+    pager.next_page()
+    assert [row["id"] for row in pager.rows] == ["04", "06"]
+    assert client.queries[-1]["order"] == ["department asc", "id asc"]
+
+
+def test_prev_page_returns_the_same_rows():
+    pager = KeysetPager(FakeClient(ROWS), "people", sort_field="department", page_size=2)
+    pager.first_page()
+    pager.next_page()
+    second = [row["id"] for row in pager.rows]
+    pager.next_page()
+    pager.prev_page()
+    assert [row["id"] for row in pager.rows] == second
+    assert pager.page_index == 1
+
+
+def test_base_filter_combines_with_seek():
+    pager = KeysetPager(FakeClient(ROWS), "people", sort_field="department", page_size=2,
+                        where={"department": {"$ne": "sales"}})
+    assert "05" not in walk(pager)
@@ -0,0 +1,44 @@
+"""
+Record patches - optimistic-concurrency saves
+"""
+
+from api.monk_client import MonkCommandResult
+from utils.record_patch import save_patch, version_of
+
+
+class FakeClient:
+    """Record store answering data_version / data_update like monk, with a scriptable update reply"""
+
+    def __init__(self, record, update_reply=None, version_available=True):
+        self.record = dict(record)
+        self.update_reply = update_reply
+        self.version_available = version_available
+
+    def data_version(self, schema, record_id, version_field="modified_at"):
+        if not self.version_available:
+            return MonkCommandResult(success=False, error="unavailable")
+        return MonkCommandResult(success=True, data=[{"id": record_id, version_field: self.record.get(version_field)}])
+
+    def data_update(self, schema, record_id, patch):
+        self.record.update(patch)
+        self.record["modified_at"] = f"{self.record['modified_at']}+"
+        return MonkCommandResult(success=True, data=self.update_reply)
+
+
+def test_non_dict_update_reply_refreshes_the_version_token():
+    client = FakeClient({"id": "1", "name": "a", "modified_at": "t1"}, update_reply="OK")
+    local = dict(client.record)
+    first = save_patch(client, "people", "1", local, {"name": "b"})
+    assert first.success and first.record["modified_at"] == "t1+"
+    local.update(first.record)
+    second = save_patch(client, "people", "1", local, {"name": "c"})
+    assert second.success and not second.conflict
+
+
+def test_unknown_new_token_drops_the_guard():
+    client = FakeClient({"id": "1", "name": "a", "modified_at": "t1"}, update_reply=None, version_available=False)
+    local = dict(client.record)
+    first = save_patch(client, "people", "1", local, {"name": "b"})
+    assert first.success
+    local.update(first.record)
+    assert version_of(local) == ("", None)
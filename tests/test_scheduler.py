@@ -0,0 +1,95 @@
+"""
+Execution scheduler - admission order by priority, reserve and per-server limits
+"""
+
+import threading
+import time
+
+from api.scheduler import ExecutionScheduler, Priority
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out waiting"
+        time.sleep(0.005)
+
+
+def queue_behind(scheduler, requests, server="s1"):
+    """Start one thread per (name, priority, server), each queued in turn; return (threads, start order)"""
+    started = []
+    threads = []
+
+    def run(name, priority, target):
+        with scheduler.slot(target, priority):
+            started.append(name)
+
+    for name, priority, *rest in requests:
+        queued = len(scheduler.waiting)
+        thread = threading.Thread(target=run, args=(name, priority, rest[0] if rest else server))
+        thread.start()
+        threads.append(thread)
+        wait_until(lambda: len(scheduler.waiting) == queued + 1)  # fixes arrival order
+    return threads, started
+
+
+def test_waiting_work_starts_in_priority_then_arrival_order():
+    scheduler = ExecutionScheduler(global_limit=1, per_server_limit=1, interactive_reserve=0)
+    with scheduler.slot("s1", Priority.BULK):
+        threads, started = queue_behind(scheduler, [
+            ("bulk", Priority.BULK),
+            ("background-1", Priority.BACKGROUND),
+            ("refresh", Priority.VISIBLE_REFRESH),
+            ("background-2", Priority.BACKGROUND),
+            ("keypress", Priority.INTERACTIVE),
+        ])
+    for thread in threads:
+        thread.join(2)
+    assert started == ["keypress", "refresh", "background-1", "background-2", "bulk"]
+
+
+def test_interactive_reserve_admits_a_keypress_while_saturated():
+    scheduler = ExecutionScheduler(global_limit=1, per_server_limit=1, interactive_reserve=1)
+    admitted = threading.Event()
+    release = threading.Event()
+
+    def keypress():
+        with scheduler.slot("s1", Priority.INTERACTIVE):
+            admitted.set()
+            release.wait(2)
+
+    with scheduler.slot("s1", Priority.BULK):
+        threads, started = queue_behind(scheduler, [("bulk", Priority.BULK)])
+        threads.append(threading.Thread(target=keypress))
+        threads[-1].start()
+        assert admitted.wait(2)                # runs in the reserve slot
+        assert started == []                   # bulk still waits for the regular slot
+        assert scheduler.stats()["queued_bulk"] == 1
+        release.set()
+    for thread in threads:
+        thread.join(2)
+    assert started == ["bulk"]
+
+
+def test_saturated_server_does_not_block_work_for_another():
+    scheduler = ExecutionScheduler(global_limit=4, per_server_limit=1, interactive_reserve=0)
+    with scheduler.slot("s1", Priority.BULK):
+        threads, started = queue_behind(scheduler, [("s1-refresh", Priority.VISIBLE_REFRESH, "s1")])
+        with scheduler.slot("s2", Priority.BULK):
+            started.append("s2-bulk")          # admitted past the higher-priority s1 ticket
+        assert started == ["s2-bulk"]
+    for thread in threads:
+        thread.join(2)
+    assert started == ["s2-bulk", "s1-refresh"]
+
+
+def test_thread_priority_context_and_defaults():
+    scheduler = ExecutionScheduler()
+    assert scheduler.current_priority() == Priority.INTERACTIVE        # main (UI) thread
+    with scheduler.priority(Priority.BULK):
+        assert scheduler.current_priority() == Priority.BULK
+    seen = []
+    worker = threading.Thread(target=lambda: seen.append(scheduler.current_priority()))
+    worker.start()
+    worker.join()
+    assert seen == [Priority.BACKGROUND]
@@ -0,0 +1,145 @@
+"""
+Circuit breakers and adaptive timeouts
+"""
+
+import subprocess
+
+from api.monk_client import MonkClient
+from api.server_health import CircuitBreaker, LatencyTracker, ServerHealth
+from api.transport import TransportResult
+
+
+class FakeTransport:
+    """Answers every call with the next scripted outcome, remembering the timeouts it was given"""
+
+    def __init__(self):
+        self.outcomes = []
+        self.timeouts = []
+
+    def run(self, args, stdin_payload, timeout):
+        self.timeouts.append(timeout)
+        outcome = self.outcomes.pop(0) if self.outcomes else "ok"
+        if outcome == "timeout":
+            raise subprocess.TimeoutExpired(args, timeout)
+        if outcome == "refused":
+            return TransportResult(stdout="", stderr="connect ECONNREFUSED", returncode=1, duration=0.01)
+        return TransportResult(stdout="[]", stderr="", returncode=0, duration=0.01)
+
+
+def make_client(threshold=1, cooldown=0.0):
+    transport = FakeTransport()
+    client = MonkClient(monk_binary="monk", transport=transport)
+    client.health = ServerHealth(failure_threshold=threshold, cooldown=cooldown)
+    return client, transport
+
+
+# CircuitBreaker
+
+def test_breaker_opens_after_threshold_and_fails_fast():
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=60)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.retry_in() > 0
+
+
+def test_breaker_success_resets_failure_count():
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_allows_exactly_one_probe():
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=0)
+    breaker.record_failure()
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+
+
+def test_successful_probe_closes_and_resets_cooldown():
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=0)
+    breaker.record_failure()
+    breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.cooldown == breaker.base_cooldown
+    assert breaker.allow()
+
+
+def test_failed_probe_reopens_with_longer_cooldown():
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=5, max_cooldown=8)
+    breaker.record_failure()
+    breaker.opened_at -= 5
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.cooldown == 8   # doubled, capped at max_cooldown
+    assert not breaker.allow()
+
+
+# Client integration
+
+def test_half_open_probe_timeout_settles_the_breaker():
+    client, transport = make_client()
+    # Fast history shortens the adaptive deadline well below the ceiling
+    for _ in range(10):
+        client.health.latency.record("current|data select|small", 0.01)
+    transport.outcomes = ["refused", "timeout"]
+
+    assert not client.data_select("people", {"limit": 1}).success
+    breaker = client.health.breaker("current")
+    assert breaker.state == CircuitBreaker.OPEN
+
+    probe = client.data_select("people", {"limit": 1})
+    assert probe.timed_out
+    assert transport.timeouts[-1] == MonkClient.DEFAULT_TIMEOUT   # probe ran with the full deadline
+    assert breaker.state == CircuitBreaker.OPEN                    # not stuck half-open
+    assert not breaker.probe_in_flight
+
+    breaker.opened_at -= breaker.cooldown
+    assert client.data_select("people", {"limit": 1}).success
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_shortened_adaptive_timeout_does_not_count_as_failure():
+    client, transport = make_client()
+    for _ in range(10):
+        client.health.latency.record("current|data select|small", 0.01)
+    transport.outcomes = ["timeout"]
+    result = client.data_select("people", {"limit": 1})
+    assert result.timed_out
+    assert transport.timeouts[-1] < MonkClient.DEFAULT_TIMEOUT
+    assert client.health.breaker("current").state == CircuitBreaker.CLOSED
+
+
+def test_explicit_timeout_is_used_as_given():
+    client, transport = make_client()
+    for _ in range(10):
+        client.health.latency.record("current|data select|small", 0.01)
+    client.data_select("people", {"limit": 1}, timeout=30)
+    assert transport.timeouts[-1] == 30
+
+
+# Adaptive timeouts
+
+def test_latency_tracker_needs_samples_and_respects_floor_and_ceiling():
+    tracker = LatencyTracker(min_samples=5, multiplier=3.0, floor=1.0)
+    assert tracker.timeout_for("k", 5.0) == 5.0          # no history - the ceiling
+    for _ in range(5):
+        tracker.record("k", 0.01)
+    assert tracker.timeout_for("k", 5.0) == 1.0          # floor
+    for _ in range(50):
+        tracker.record("slow", 4.0)
+    assert tracker.timeout_for("slow", 5.0) == 5.0       # ceiling
+
+
+def test_latency_keys_separate_size_classes():
+    assert MonkClient._size_class(["data", "select", "s", "--filter", '{"limit":1}'], None) == "small"
+    assert MonkClient._size_class(["data", "select", "s", "--filter", '{"limit":50}'], None) == "medium"
+    assert MonkClient._size_class(["data", "select", "s", "--filter", '{"limit":1000}'], None) == "large"
+    assert MonkClient._size_class(["data", "select", "s"], None) == "large"